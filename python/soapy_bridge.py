@@ -4,14 +4,20 @@ SoapySDR Bridge for Second Sight RF Forensic Platform
 Handles device enumeration, configuration, IQ sample capture, and real-time FFT streaming
 """
 
+import os
 import sys
 import json
 import time
+import pickle
+import struct
 import numpy as np
 import requests
+import requests.adapters
+from multiprocessing import shared_memory
 from typing import Dict, List, Optional, Tuple
 import threading
 import signal
+from collections import deque
 
 try:
     import SoapySDR
@@ -20,18 +26,141 @@ except ImportError:
     print("ERROR: SoapySDR not installed. Install with: pip install SoapySDR", file=sys.stderr)
     sys.exit(1)
 
+# pyFFTW is optional - falls back to numpy.fft when missing
+try:
+    import pyfftw
+    PYFFTW_AVAILABLE = True
+except ImportError:
+    PYFFTW_AVAILABLE = False
+
+# CuPy is optional - batched cuFFT on the GPU when requested
+try:
+    import cupy as cp
+    import cupyx.scipy.fftpack as cpx_fftpack
+    CUPY_AVAILABLE = True
+except ImportError:
+    CUPY_AVAILABLE = False
+
+# numexpr is optional - fuses the dB conversion into a single multithreaded pass
+try:
+    import numexpr as ne
+    ne.set_num_threads(2)
+    NUMEXPR_AVAILABLE = True
+except ImportError:
+    NUMEXPR_AVAILABLE = False
+
+# Numba is optional - fused fftshift + dB kernel for the CPU path
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# orjson is optional - serializes the float32 spectrum without tolist()
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Planner wisdom persisted across runs so FFTW planning is only paid once
+FFTW_WISDOM_PATH = os.path.expanduser("~/.second_sight/fftw_wisdom")
+
+# Binary FFT frame header: float64 timestamp, uint32 sample count (little-endian),
+# followed by the magnitude spectrum as float32
+FFT_FRAME_HEADER = struct.Struct('<dI')
+
+# Shared-memory FFT ring for local consumers (fft_transport="shm"), at
+# /dev/shm/ss_fft. Layout: SHM_FFT_HEADER_DTYPE, then SHM_FFT_SLOTS frames of
+# (float64 timestamp, uint32 sample count, float32 spectrum[n]), all packed and
+# little-endian. write_seq is bumped after each frame is complete; the newest
+# frame is in slot (write_seq - 1) % slots.
+SHM_FFT_NAME = "ss_fft"
+SHM_FFT_SLOTS = 16
+SHM_FFT_HEADER_DTYPE = np.dtype([('write_seq', '<u8'), ('slots', '<u4'), ('bins', '<u4')])
+
+# Batches in the reader -> FFT ring: one being filled, one being transformed,
+# one queued
+FFT_RING_DEPTH = 3
+
+# Longest the reader waits for the FFT thread to free a batch before it evicts
+# the oldest queued one (seconds; short enough not to overflow the RX buffer)
+FFT_FREE_TIMEOUT = 0.005
+
+
+def _magnitude_db(spectrum: np.ndarray) -> np.ndarray:
+    """Power spectrum in dB, computed from |X|^2 to skip the complex-abs sqrt"""
+    re = spectrum.real
+    im = spectrum.imag
+    if NUMEXPR_AVAILABLE:
+        return ne.evaluate('10 * log10(re * re + im * im + 1e-20)')
+    return 10 * np.log10(re * re + im * im + 1e-20)
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _shifted_magnitude_db(spectrum, out):
+        """fftshift + power in dB in one parallel pass over (rows, n) spectra"""
+        rows, n = spectrum.shape
+        half = n // 2
+        for r in prange(rows):
+            for k in range(n):
+                v = spectrum[r, (k + n - half) % n]
+                out[r, k] = 10.0 * np.log10(v.real * v.real + v.imag * v.imag + 1e-20)
+
 
 class SoapyBridge:
     """Bridge between SoapySDR hardware and Second Sight web application"""
     
-    def __init__(self, websocket_url: str = "http://localhost:3000"):
+    def __init__(self, websocket_url: str = "http://localhost:3000", fft_batch_size: int = 8,
+                 fft_transport: str = "json", use_gpu: bool = False):
         self.websocket_url = websocket_url
+        self.fft_batch_size = fft_batch_size
+        self.fft_transport = fft_transport
+        self.use_gpu = use_gpu and CUPY_AVAILABLE
         self.device: Optional[SoapySDR.Device] = None
         self.stream = None
         self.is_streaming = False
         self.is_recording = False
-        self.recorded_samples = []
         self.stream_thread: Optional[threading.Thread] = None
+        self.fft_thread: Optional[threading.Thread] = None
+        
+        # FFT batch ring and plan, created per stream in _setup_fft. Batch
+        # indices move between the free and ready deques under _fft_cond; the
+        # reader waits at most FFT_FREE_TIMEOUT on the FFT/HTTP consumer.
+        self._fft_ring = None
+        self._fft_cond = threading.Condition()
+        self._fft_free: deque = deque()
+        self._fft_ready: deque = deque()
+        self._fft_out: Optional[np.ndarray] = None
+        self._fft_plan = None
+        self._load_fftw_wisdom()
+        
+        # cuFFT state (GPU only): pinned host staging, device batch, stream and plan
+        self._pinned_mem = None
+        self._d_in = None
+        self._mag_host: Optional[np.ndarray] = None
+        self._cp_stream = None
+        self._cufft_plan = None
+        
+        # Reused dB output for the numba kernel (CPU only)
+        self._mag_out: Optional[np.ndarray] = None
+        
+        # Single persistent keep-alive connection for FFT frames
+        self._session = requests.Session()
+        self._session.mount("http://", requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=1))
+        self._session.headers["Content-Type"] = (
+            "application/octet-stream" if self.fft_transport == "binary" else "application/json"
+        )
+        
+        # Shared-memory frame ring (fft_transport="shm"), created per stream
+        self._shm: Optional[shared_memory.SharedMemory] = None
+        self._shm_header: Optional[np.ndarray] = None
+        self._shm_frames: Optional[np.ndarray] = None
+        
+        # Preallocated recording buffer, filled in place by the stream worker
+        self._rec: Optional[np.ndarray] = None
+        self._rec_pos = 0
         
     def enumerate_devices(self) -> List[Dict]:
         """Enumerate all available SoapySDR devices"""
@@ -107,12 +236,23 @@ class SoapyBridge:
             return False
             
         try:
+            # Allocate FFT batch buffers and plan before samples arrive
+            self._setup_fft(buffer_size)
+            if self.fft_transport == "shm":
+                self._setup_shm(buffer_size)
+            
             # Setup stream
             self.stream = self.device.setupStream(SOAPY_SDR_RX, SOAPY_SDR_CF32)
             self.device.activateStream(self.stream)
             self.is_streaming = True
             
-            # Start streaming thread
+            # Start FFT consumer, then the reader that feeds it
+            self.fft_thread = threading.Thread(
+                target=self._fft_worker,
+                daemon=True
+            )
+            self.fft_thread.start()
+            
             self.stream_thread = threading.Thread(
                 target=self._stream_worker,
                 args=(buffer_size,),
@@ -134,9 +274,11 @@ class SoapyBridge:
         try:
             self.is_streaming = False
             
-            # Wait for stream thread to finish
+            # Wait for reader and FFT threads to finish
             if self.stream_thread:
                 self.stream_thread.join(timeout=2.0)
+            if self.fft_thread:
+                self.fft_thread.join(timeout=2.0)
             
             # Deactivate stream
             if self.stream and self.device:
@@ -144,77 +286,328 @@ class SoapyBridge:
                 self.device.closeStream(self.stream)
                 self.stream = None
             
+            self._release_shm()
+            
             print("Streaming stopped")
             return True
         except Exception as e:
             print(f"ERROR: Failed to stop stream: {e}", file=sys.stderr)
             return False
     
-    def start_recording(self):
-        """Start recording IQ samples"""
+    def start_recording(self, max_record_samples: int = 1 << 24):
+        """Start recording IQ samples into a single preallocated buffer
+        
+        Args:
+            max_record_samples: Capacity of the recording buffer (default 16M
+                samples, 128 MB of complex64). Samples beyond this are dropped.
+        """
+        self._rec = np.empty(max_record_samples, dtype=np.complex64)
+        self._rec_pos = 0
         self.is_recording = True
-        self.recorded_samples = []
         print("Recording started")
     
     def stop_recording(self) -> np.ndarray:
-        """Stop recording and return captured samples"""
+        """Stop recording and return captured samples (a view, no copy)"""
         self.is_recording = False
-        samples = np.concatenate(self.recorded_samples) if self.recorded_samples else np.array([])
+        if self._rec is None:
+            return np.array([], dtype=np.complex64)
+        samples = self._rec[:self._rec_pos]
         print(f"Recording stopped. Captured {len(samples)} samples")
         return samples
     
     def _stream_worker(self, buffer_size: int):
-        """Worker thread for streaming IQ samples"""
-        buff = np.zeros(buffer_size, dtype=np.complex64)
+        """Worker thread for streaming IQ samples
+        
+        readStream writes straight into rows of a (fft_batch_size, buffer_size)
+        batch. Once every row is full the batch index is handed to the FFT
+        thread and reading continues into the next free batch.
+        """
+        with self._fft_cond:
+            index = self._fft_free.popleft()
+        batch = self._fft_ring[index]
+        slot = 0
+        fill = 0
         
         while self.is_streaming:
             try:
-                # Read samples from device
-                sr = self.device.readStream(self.stream, [buff], buffer_size, timeoutUs=1000000)
+                # Read samples from device into the remainder of the current row
+                row = batch[slot]
+                sr = self.device.readStream(self.stream, [row[fill:]], buffer_size - fill, timeoutUs=1000000)
                 
                 if sr.ret > 0:
-                    samples = buff[:sr.ret].copy()
-                    
                     # Record samples if recording is active
                     if self.is_recording:
-                        self.recorded_samples.append(samples)
+                        self._record(row[fill:fill + sr.ret])
                     
-                    # Compute FFT and send to server
-                    self._send_fft_data(samples)
+                    fill += sr.ret
+                    if fill < buffer_size:
+                        continue
+                    
+                    slot += 1
+                    fill = 0
+                    if slot == self.fft_batch_size:
+                        # Hand the full batch to the FFT thread
+                        with self._fft_cond:
+                            self._fft_ready.append(index)
+                            self._fft_cond.notify_all()
+                        index = self._next_free_batch()
+                        batch = self._fft_ring[index]
+                        slot = 0
                     
             except Exception as e:
                 print(f"ERROR in stream worker: {e}", file=sys.stderr)
                 time.sleep(0.1)
     
-    def _send_fft_data(self, samples: np.ndarray):
-        """Compute FFT and send to WebSocket server"""
+    def _next_free_batch(self) -> int:
+        """Take a free batch, or evict the oldest queued one if the consumer is behind
+        
+        Waits up to FFT_FREE_TIMEOUT for the FFT thread to release a batch.
+        On overrun the oldest queued batch is dropped rather than stall
+        readStream. With FFT_RING_DEPTH >= 3 and the FFT thread holding at
+        most one batch, at least two are queued when none is free, so the
+        batch just handed over is never the one evicted.
+        """
+        with self._fft_cond:
+            if self._fft_cond.wait_for(lambda: self._fft_free, timeout=FFT_FREE_TIMEOUT):
+                return self._fft_free.popleft()
+            return self._fft_ready.popleft()
+    
+    def _fft_worker(self):
+        """Worker thread that transforms full batches and sends them to the server"""
+        while self.is_streaming:
+            with self._fft_cond:
+                if not self._fft_cond.wait_for(lambda: self._fft_ready, timeout=0.1):
+                    continue
+                index = self._fft_ready.popleft()
+            self._send_fft_batch(self._fft_ring[index])
+            with self._fft_cond:
+                self._fft_free.append(index)
+                self._fft_cond.notify_all()
+    
+    def _record(self, samples: np.ndarray):
+        """Copy samples into the next free slice of the recording buffer"""
+        n = min(len(samples), len(self._rec) - self._rec_pos)
+        self._rec[self._rec_pos:self._rec_pos + n] = samples[:n]
+        self._rec_pos += n
+    
+    def _send_fft_batch(self, batch: np.ndarray):
+        """Compute FFT of every buffer in the batch and send to WebSocket server"""
         try:
-            # Compute FFT
-            fft_result = np.fft.fftshift(np.fft.fft(samples))
-            magnitude_db = 20 * np.log10(np.abs(fft_result) + 1e-10)
+            # One batched FFT over axis 1 (one row per captured buffer)
+            if self._d_in is not None:
+                magnitude_db = self._gpu_magnitude_db(batch)
+            else:
+                if self._fft_plan is not None:
+                    spectrum = self._fft_plan(input_array=batch)
+                else:
+                    spectrum = np.fft.fft(batch, axis=1)
+                if NUMBA_AVAILABLE:
+                    _shifted_magnitude_db(spectrum, self._mag_out)
+                    magnitude_db = self._mag_out
+                else:
+                    fft_result = np.fft.fftshift(spectrum, axes=1)
+                    magnitude_db = _magnitude_db(fft_result)
             
-            # Prepare data for server
-            fft_data = {
-                "timestamp": time.time(),
-                "fft": magnitude_db.tolist(),
-                "sampleCount": len(samples)
-            }
+            sample_count = batch.shape[1]
             
-            # Send to server via HTTP POST
-            # The server's WebSocket handler will broadcast this to connected clients
-            requests.post(
-                f"{self.websocket_url}/api/sdr/broadcast-fft",
-                json=fft_data,
-                timeout=0.5
-            )
+            if self.fft_transport == "shm":
+                self._write_shm_frames(magnitude_db, sample_count)
+                return
+            
+            # The server's WebSocket handler will broadcast frames to connected clients
+            url = f"{self.websocket_url}/api/sdr/broadcast-fft"
+            
+            if self.fft_transport == "binary":
+                # Raw float32 spectrum behind a fixed 12-byte header, no JSON
+                for row in magnitude_db.astype(np.float32, copy=False):
+                    payload = FFT_FRAME_HEADER.pack(time.time(), sample_count) + row.tobytes()
+                    self._session.post(url, data=payload, timeout=0.5)
+                return
+            
+            for row in magnitude_db.astype(np.float32, copy=False):
+                if ORJSON_AVAILABLE:
+                    # Encode the ndarray directly, no per-element float boxing
+                    body = orjson.dumps(
+                        {"timestamp": time.time(), "fft": row, "sampleCount": sample_count},
+                        option=orjson.OPT_SERIALIZE_NUMPY
+                    )
+                    self._session.post(url, data=body, timeout=0.5)
+                    continue
+                
+                # Prepare data for server
+                fft_data = {
+                    "timestamp": time.time(),
+                    "fft": row.tolist(),
+                    "sampleCount": sample_count
+                }
+                
+                # Send to server via HTTP POST
+                self._session.post(url, json=fft_data, timeout=0.5)
             
         except Exception as e:
             # Don't spam errors during streaming
             pass
     
+    def _gpu_magnitude_db(self, batch: np.ndarray) -> np.ndarray:
+        """Batched cuFFT of the pinned batch, returned as dB in pinned host memory"""
+        with self._cp_stream:
+            self._d_in.set(batch, stream=self._cp_stream)
+            with self._cufft_plan:
+                spectrum = cp.fft.fft(self._d_in, axis=1)
+            spectrum = cp.fft.fftshift(spectrum, axes=1)
+            mag = 10 * cp.log10(spectrum.real * spectrum.real + spectrum.imag * spectrum.imag + 1e-20)
+            mag.get(stream=self._cp_stream, out=self._mag_host)
+        self._cp_stream.synchronize()
+        return self._mag_host
+    
+    def _write_shm_frames(self, magnitude_db: np.ndarray, sample_count: int):
+        """Publish spectra into the shared-memory ring, one slot per row"""
+        header = self._shm_header[0]
+        seq = int(header['write_seq'])
+        for row in magnitude_db:
+            frame = self._shm_frames[seq % SHM_FFT_SLOTS]
+            frame['timestamp'] = time.time()
+            frame['sample_count'] = sample_count
+            frame['fft'][:] = row
+            seq += 1
+            header['write_seq'] = seq
+    
+    def _setup_shm(self, buffer_size: int):
+        """Create the shared-memory FFT ring, replacing a stale segment if present"""
+        frame_dtype = np.dtype([
+            ('timestamp', '<f8'),
+            ('sample_count', '<u4'),
+            ('fft', '<f4', (buffer_size,))
+        ])
+        size = SHM_FFT_HEADER_DTYPE.itemsize + SHM_FFT_SLOTS * frame_dtype.itemsize
+        
+        try:
+            self._shm = shared_memory.SharedMemory(name=SHM_FFT_NAME, create=True, size=size)
+        except FileExistsError:
+            stale = shared_memory.SharedMemory(name=SHM_FFT_NAME)
+            stale.close()
+            stale.unlink()
+            self._shm = shared_memory.SharedMemory(name=SHM_FFT_NAME, create=True, size=size)
+        
+        self._shm_header = np.ndarray((1,), dtype=SHM_FFT_HEADER_DTYPE, buffer=self._shm.buf)
+        self._shm_frames = np.ndarray(
+            (SHM_FFT_SLOTS,), dtype=frame_dtype, buffer=self._shm.buf,
+            offset=SHM_FFT_HEADER_DTYPE.itemsize
+        )
+        self._shm_header[0] = (0, SHM_FFT_SLOTS, buffer_size)
+    
+    def _release_shm(self):
+        """Close and unlink the shared-memory FFT ring"""
+        if self._shm is None:
+            return
+        
+        # The FFT thread writes through views of the segment: it must be gone
+        # before close(), which fails with BufferError while views are alive
+        if self.fft_thread is not None and self.fft_thread.is_alive():
+            self.fft_thread.join()
+        
+        # Drop the numpy views first, otherwise close() fails on exported buffers
+        self._shm_header = None
+        self._shm_frames = None
+        try:
+            self._shm.close()
+        except Exception as e:
+            print(f"WARNING: Failed to close FFT shared memory: {e}", file=sys.stderr)
+        finally:
+            # Always unlink, so the next shm start can create the segment
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                print(f"WARNING: Failed to unlink FFT shared memory: {e}", file=sys.stderr)
+            self._shm = None
+    
+    def _setup_fft(self, buffer_size: int):
+        """Allocate the FFT batch ring and build the cuFFT/FFTW plan if available"""
+        shape = (self.fft_batch_size, buffer_size)
+        count = self.fft_batch_size * buffer_size
+        ring_count = FFT_RING_DEPTH * count
+        
+        with self._fft_cond:
+            self._fft_free = deque(range(FFT_RING_DEPTH))
+            self._fft_ready = deque()
+        self._mag_out = np.empty(shape, dtype=np.float32)
+        
+        if self.use_gpu:
+            # Page-locked host ring so each upload is a true async DMA
+            self._pinned_mem = cp.cuda.alloc_pinned_memory(ring_count * 8 + count * 4)
+            self._fft_ring = np.frombuffer(
+                self._pinned_mem, dtype=np.complex64, count=ring_count
+            ).reshape((FFT_RING_DEPTH,) + shape)
+            self._mag_host = np.frombuffer(
+                self._pinned_mem, dtype=np.float32, count=count, offset=ring_count * 8
+            ).reshape(shape)
+            self._fft_out = None
+            self._fft_plan = None
+            
+            self._cp_stream = cp.cuda.Stream(non_blocking=True)
+            self._d_in = cp.empty(shape, dtype=cp.complex64)
+            self._cufft_plan = cpx_fftpack.get_fft_plan(self._d_in, axes=(1,), value_type='C2C')
+            return
+        
+        if not PYFFTW_AVAILABLE:
+            self._fft_ring = np.empty((FFT_RING_DEPTH,) + shape, dtype=np.complex64)
+            self._fft_out = None
+            self._fft_plan = None
+            return
+        
+        # Uninitialized 64-byte aligned batches (AVX-512 codelets); readStream
+        # writes directly into them. Each batch is allocated separately so every
+        # one is aligned and the plan can be re-pointed at it without a copy.
+        self._fft_ring = [
+            pyfftw.empty_aligned(shape, dtype='complex64', n=64)
+            for _ in range(FFT_RING_DEPTH)
+        ]
+        self._fft_out = pyfftw.empty_aligned(shape, dtype='complex64', n=64)
+        
+        # First run pays for an exhaustive FFTW_PATIENT search once and saves
+        # the result; later runs load that wisdom and plan instantly
+        first_run = not os.path.exists(FFTW_WISDOM_PATH)
+        if first_run:
+            print("Planning FFT (FFTW_PATIENT, first run only)...", file=sys.stderr)
+        self._fft_plan = pyfftw.FFTW(
+            self._fft_ring[0], self._fft_out,
+            axes=(1,),
+            flags=('FFTW_PATIENT' if first_run else 'FFTW_MEASURE', 'FFTW_DESTROY_INPUT'),
+            threads=2
+        )
+        if first_run:
+            self._save_fftw_wisdom()
+    
+    def _load_fftw_wisdom(self):
+        """Import FFTW planner wisdom saved by a previous run"""
+        if not PYFFTW_AVAILABLE or not os.path.exists(FFTW_WISDOM_PATH):
+            return
+        
+        try:
+            with open(FFTW_WISDOM_PATH, "rb") as f:
+                pyfftw.import_wisdom(pickle.load(f))
+        except Exception as e:
+            print(f"WARNING: Failed to load FFTW wisdom: {e}", file=sys.stderr)
+    
+    def _save_fftw_wisdom(self):
+        """Export FFTW planner wisdom for the next run"""
+        if not PYFFTW_AVAILABLE:
+            return
+        
+        try:
+            os.makedirs(os.path.dirname(FFTW_WISDOM_PATH), exist_ok=True)
+            with open(FFTW_WISDOM_PATH, "wb") as f:
+                pickle.dump(pyfftw.export_wisdom(), f)
+        except Exception as e:
+            print(f"WARNING: Failed to save FFTW wisdom: {e}", file=sys.stderr)
+    
     def close_device(self):
         """Close the device and cleanup"""
         self.stop_stream()
+        self._save_fftw_wisdom()
+        self._session.close()
         
         if self.device:
             self.device = None
@@ -227,11 +620,13 @@ def main():
         print("Usage: python soapy_bridge.py <command> [args...]")
         print("Commands:")
         print("  enumerate                    - List all available devices")
-        print("  stream <freq> <rate> <gain>  - Start streaming (freq in Hz, rate in Hz, gain in dB)")
+        print("  stream <freq> <rate> <gain> [json|binary|shm]")
+        print("                               - Start streaming (freq in Hz, rate in Hz, gain in dB)")
         sys.exit(1)
     
     command = sys.argv[1]
-    bridge = SoapyBridge()
+    transport = sys.argv[5] if command == "stream" and len(sys.argv) > 5 else "json"
+    bridge = SoapyBridge(fft_transport=transport)
     
     if command == "enumerate":
         devices = bridge.enumerate_devices()
@@ -19,9 +19,16 @@ except ImportError:
     TORCHSIG_AVAILABLE = False
     print("Warning: TorchSig not available, using mock classification", file=sys.stderr)
 
+# orjson is optional - faster JSON encode/decode for the stdin/stdout protocol
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
-# Modulation classes supported by TorchSig models
-MODULATION_CLASSES = [
+# Modulation classes supported by TorchSig models (immutable, index = model output)
+MODULATION_CLASSES = (
     'OOK', '4ASK', '8ASK',
     'BPSK', 'QPSK', '8PSK', '16PSK', '32PSK', '64PSK',
     '16QAM', '32QAM', '64QAM', '128QAM', '256QAM',
@@ -30,28 +37,78 @@ MODULATION_CLASSES = [
     '16APSK', '32APSK', '64APSK', '128APSK', '256APSK',
     'AM-SSB-WC', 'AM-SSB-SC', 'AM-DSB-WC', 'AM-DSB-SC',
     'FM', 'GMSK', 'OQPSK'
-]
+)
+
+# Model input length (samples per classification window)
+INPUT_LENGTH = 4096
+
+
+def _top_k_indices(probs: np.ndarray, top_k: int) -> np.ndarray:
+    """Indices of the top_k largest probabilities, highest first (O(N) partition)"""
+    k = max(0, min(top_k, probs.size))
+    if k == 0:
+        return np.empty(0, dtype=np.intp)
+    part = np.argpartition(probs, -k)[-k:]
+    return part[np.argsort(-probs[part])]
 
 
 class ModulationClassifier:
     """TorchSig-based modulation classifier"""
     
+    # Optimized models keyed by (model_path, device type), shared across instances
+    _model_cache = {}
+    
     def __init__(self, model_path: str = None, use_gpu: bool = True):
         self.use_gpu = use_gpu and torch.cuda.is_available()
         self.device = torch.device('cuda' if self.use_gpu else 'cpu')
         
         print(f"[Classifier] Device: {self.device}", file=sys.stderr)
         
+        # Page-locked staging buffer for async host->device copies (GPU only)
+        self._pinned_iq = None
+        
+        # Reusable (2, N) I/Q scratch for staging captures on CPU
+        self._pad = np.zeros((2, INPUT_LENGTH), dtype=np.float32)
+        
+        # Persistent model input and host-side probabilities, reused every call
+        self._dev_in = torch.zeros(1, 2, INPUT_LENGTH, device=self.device)
+        self._probs_host = torch.empty(len(MODULATION_CLASSES), pin_memory=self.use_gpu)
+        
         if not TORCHSIG_AVAILABLE:
             self.model = None
             return
         
+        # Reduced-precision inference on GPU (bf16 where supported)
+        self._amp_dtype = (
+            torch.bfloat16 if self.use_gpu and torch.cuda.is_bf16_supported()
+            else torch.float16
+        )
+        
+        # Reuse the optimized model if this process already built one
+        cache_key = (model_path, self.device.type)
+        if cache_key not in ModulationClassifier._model_cache:
+            model = self._load_model(model_path)
+            ModulationClassifier._model_cache[cache_key] = self._optimize_model(model)
+        self.model = ModulationClassifier._model_cache[cache_key]
+        
+        # Normalization transform
+        self.normalize = Normalize(norm=np.inf)
+        
+        # Fixed-shape CUDA graph replayed for every classification (GPU only)
+        self._graph = None
+        self._static_in = None
+        self._static_out = None
+        if self.use_gpu:
+            self._capture_cuda_graph()
+    
+    def _load_model(self, model_path: str = None) -> torch.nn.Module:
+        """Load TorchSig model and weights onto the classifier device"""
         # Load pre-trained model
         if model_path:
-            self.model = torch.load(model_path, map_location=self.device)
+            model = torch.load(model_path, map_location=self.device)
         else:
             # Use default EfficientNet-B4 architecture
-            self.model = efficientnet_b4(pretrained=False, num_classes=len(MODULATION_CLASSES))
+            model = efficientnet_b4(pretrained=False, num_classes=len(MODULATION_CLASSES))
             
             # Try to load pre-trained weights from standard locations
             weight_paths = [
@@ -67,7 +124,7 @@ class ModulationClassifier:
                     expanded_path = os.path.expanduser(path)
                     if os.path.exists(expanded_path):
                         print(f"[Classifier] Loading weights from {expanded_path}", file=sys.stderr)
-                        self.model.load_state_dict(torch.load(expanded_path, map_location=self.device))
+                        model.load_state_dict(torch.load(expanded_path, map_location=self.device))
                         weights_loaded = True
                         break
                 except Exception as e:
@@ -77,57 +134,127 @@ class ModulationClassifier:
                 print("[Classifier] WARNING: No pre-trained weights found. Model will use random initialization.", file=sys.stderr)
                 print("[Classifier] Download weights from: https://github.com/TorchDSP/torchsig/releases", file=sys.stderr)
         
-        self.model.to(self.device)
-        self.model.eval()
+        model.to(self.device)
+        model.eval()
         
-        # Normalization transform
-        self.normalize = Normalize(norm=np.inf)
+        return model
     
-    def preprocess(self, iq_samples: np.ndarray, target_length: int = 4096) -> torch.Tensor:
+    def _optimize_model(self, model: torch.nn.Module) -> torch.nn.Module:
+        """
+        Compile the model for GPU inference, or quantize Linear layers to
+        INT8 for CPU inference
+        """
+        if not self.use_gpu:
+            return torch.ao.quantization.quantize_dynamic(
+                model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+        
+        # Default mode: CUDA graphs are captured explicitly in _capture_cuda_graph.
+        # torch.compile is lazy and only builds on the first call, so run one
+        # warmup forward here; any compile failure then falls back to the
+        # eager model before it is cached
+        try:
+            compiled = torch.compile(model)
+            with torch.no_grad(), torch.autocast(device_type='cuda', dtype=self._amp_dtype):
+                compiled(self._dev_in)
+            torch.cuda.synchronize()
+            return compiled
+        except Exception as e:
+            print(f"[Classifier] WARNING: torch.compile failed ({e}), using eager model", file=sys.stderr)
+            return model
+    
+    def _capture_cuda_graph(self):
+        """
+        Warm up the model and capture one CUDA graph for the fixed
+        (1, 2, INPUT_LENGTH) input so inference is a single replay
+        """
+        try:
+            # The graph reads straight from the persistent input preprocess writes to
+            self._static_in = self._dev_in
+            
+            # Warmup on a side stream (compiles kernels, settles allocator)
+            side_stream = torch.cuda.Stream()
+            side_stream.wait_stream(torch.cuda.current_stream())
+            with torch.cuda.stream(side_stream), torch.no_grad(), \
+                    torch.autocast(device_type='cuda', dtype=self._amp_dtype):
+                for _ in range(3):
+                    self.model(self._static_in)
+            torch.cuda.current_stream().wait_stream(side_stream)
+            
+            graph = torch.cuda.CUDAGraph()
+            # No autocast weight-cast cache: cached casts made during capture
+            # are not valid for graph replay
+            with torch.no_grad(), torch.cuda.graph(graph), \
+                    torch.autocast(device_type='cuda', dtype=self._amp_dtype, cache_enabled=False):
+                self._static_out = self.model(self._static_in)
+            self._graph = graph
+        except Exception as e:
+            print(f"[Classifier] WARNING: CUDA graph capture failed ({e}), using eager launches", file=sys.stderr)
+            self._graph = None
+    
+    def preprocess(self, iq_samples: np.ndarray, target_length: int = INPUT_LENGTH) -> torch.Tensor:
         """
         Preprocess IQ samples for TorchSig model
         
         Args:
-            iq_samples: Complex IQ samples
+            iq_samples: Complex IQ samples, or a (2, N) float array holding
+                separate I and Q channels
             target_length: Target sample count (1024, 4096, etc.)
         
         Returns:
             Preprocessed tensor (1, 2, target_length) - batch, I/Q, samples
         """
+        # Separate I and Q channels (views, no copy)
+        if np.iscomplexobj(iq_samples):
+            i_channel, q_channel = iq_samples.real, iq_samples.imag
+        else:
+            i_channel, q_channel = iq_samples[0], iq_samples[1]
+        n = len(i_channel)
+        
         # Extract slice if too long
-        if len(iq_samples) > target_length:
+        if n > target_length:
             # Take middle section
-            start = (len(iq_samples) - target_length) // 2
-            iq_samples = iq_samples[start:start + target_length]
-        elif len(iq_samples) < target_length:
-            # Zero-pad if too short
-            pad_width = target_length - len(iq_samples)
-            iq_samples = np.pad(iq_samples, (0, pad_width), mode='constant')
-        
-        # Split into I and Q channels
-        i_channel = np.real(iq_samples).astype(np.float32)
-        q_channel = np.imag(iq_samples).astype(np.float32)
+            start = (n - target_length) // 2
+            i_channel = i_channel[start:start + target_length]
+            q_channel = q_channel[start:start + target_length]
+            n = target_length
         
-        # Stack as (2, N) array
-        iq_array = np.stack([i_channel, q_channel], axis=0)
+        # Stage channels as (2, target_length) float32, zero-padding short captures
+        if self.use_gpu:
+            if self._pinned_iq is None or self._pinned_iq.shape[1] != target_length:
+                self._pinned_iq = torch.empty(2, target_length, dtype=torch.float32, pin_memory=True)
+            staging = self._pinned_iq.numpy()
+        else:
+            if self._pad.shape[1] != target_length:
+                self._pad = np.zeros((2, target_length), dtype=np.float32)
+            staging = self._pad
+        staging[0, :n] = i_channel
+        staging[1, :n] = q_channel
+        staging[:, n:] = 0
         
-        # Normalize to unit power
-        power = np.mean(np.abs(iq_samples) ** 2)
-        if power > 0:
-            iq_array = iq_array / np.sqrt(power)
+        # Move both channels to the device in one transfer
+        if self.use_gpu:
+            iq_tensor = self._pinned_iq.to(self.device, non_blocking=True)
+        else:
+            iq_tensor = torch.from_numpy(staging)
         
-        # Convert to tensor and add batch dimension
-        iq_tensor = torch.from_numpy(iq_array).unsqueeze(0)  # (1, 2, N)
+        # Normalize to unit power: mean(I^2 + Q^2)
+        power = (iq_tensor * iq_tensor).sum(dim=0).mean()
+        iq_tensor = iq_tensor / torch.sqrt(power).clamp_min(1e-12)
         
-        return iq_tensor.to(self.device)
+        # Already laid out as (1, 2, N) - batch, I/Q, samples
+        if target_length != INPUT_LENGTH:
+            return iq_tensor.unsqueeze(0)
+        self._dev_in[0].copy_(iq_tensor)
+        return self._dev_in
     
     def classify(self, iq_samples: np.ndarray, top_k: int = 5) -> dict:
         """
         Classify modulation type
         
         Args:
-            iq_samples: Complex IQ samples
-            top_k: Number of top predictions to return
+            iq_samples: Complex IQ samples or (2, N) I/Q channels
+            top_k: Number of top predictions to return (none when top_k < 1)
         
         Returns:
             Dictionary with classification results
@@ -142,31 +269,40 @@ class ModulationClassifier:
         print(f"[Classifier] Input shape: {iq_tensor.shape}", file=sys.stderr)
         
         # Inference
-        with torch.no_grad():
-            logits = self.model(iq_tensor)
-            probabilities = F.softmax(logits, dim=1)
+        if self._graph is not None and iq_tensor is self._static_in:
+            self._graph.replay()
+            logits = self._static_out
+        else:
+            with torch.no_grad(), torch.autocast(device_type='cuda', dtype=self._amp_dtype, enabled=self.use_gpu):
+                logits = self.model(iq_tensor)
+        probabilities = F.softmax(logits.float(), dim=1)
+        
+        # Download into the reused host buffer
+        self._probs_host.copy_(probabilities[0], non_blocking=self.use_gpu)
+        if self.use_gpu:
+            torch.cuda.current_stream().synchronize()
         
         # Get top-k predictions
-        probs_np = probabilities.cpu().numpy()[0]
-        top_indices = np.argsort(probs_np)[::-1][:top_k]
+        probs_np = self._probs_host.numpy()
+        probs_list = probs_np.tolist()
+        top_indices = _top_k_indices(probs_np, top_k)
         
         results = {
             'predictions': [
                 {
-                    'modulation': MODULATION_CLASSES[idx],
-                    'probability': float(probs_np[idx]),
-                    'confidence': float(probs_np[idx] * 100)
+                    'modulation': MODULATION_CLASSES[i],
+                    'probability': probs_list[i],
+                    'confidence': probs_list[i] * 100
                 }
-                for idx in top_indices
+                for i in top_indices
             ],
-            'all_probabilities': {
-                MODULATION_CLASSES[i]: float(probs_np[i])
-                for i in range(len(MODULATION_CLASSES))
-            }
+            'all_probabilities': dict(zip(MODULATION_CLASSES, probs_list))
         }
         
-        print(f"[Classifier] Top prediction: {results['predictions'][0]['modulation']} "
-              f"({results['predictions'][0]['confidence']:.1f}%)", file=sys.stderr)
+        if results['predictions']:
+            top = results['predictions'][0]
+            print(f"[Classifier] Top prediction: {top['modulation']} "
+                  f"({top['confidence']:.1f}%)", file=sys.stderr)
         
         return results
     
@@ -174,53 +310,80 @@ class ModulationClassifier:
         """Mock classification for testing without TorchSig"""
         # Generate random probabilities
         probs = np.random.dirichlet(np.ones(len(MODULATION_CLASSES)))
-        top_indices = np.argsort(probs)[::-1][:top_k]
+        probs_list = probs.tolist()
+        top_indices = _top_k_indices(probs, top_k)
         
         return {
             'predictions': [
                 {
-                    'modulation': MODULATION_CLASSES[idx],
-                    'probability': float(probs[idx]),
-                    'confidence': float(probs[idx] * 100),
+                    'modulation': MODULATION_CLASSES[i],
+                    'probability': probs_list[i],
+                    'confidence': probs_list[i] * 100,
                     'mock': True
                 }
-                for idx in top_indices
+                for i in top_indices
             ],
-            'all_probabilities': {
-                MODULATION_CLASSES[i]: float(probs[i])
-                for i in range(len(MODULATION_CLASSES))
-            },
+            'all_probabilities': dict(zip(MODULATION_CLASSES, probs_list)),
             'warning': 'TorchSig not available - using mock classification'
         }
 
 
+def _write_line(obj: dict):
+    """Write one JSON line to stdout and flush it to the Node reader"""
+    if ORJSON_AVAILABLE:
+        sys.stdout.buffer.write(orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE))
+        sys.stdout.buffer.flush()
+    else:
+        print(json.dumps(obj), flush=True)
+
+
 def main():
     """
     CLI interface for modulation classification
     
-    Input (stdin): JSON with {iq_real: [], iq_imag: [], params: {}}
-    Output (stdout): JSON with classification results
-    """
-    # Read input from stdin
-    input_data = json.load(sys.stdin)
-    
-    iq_real = np.array(input_data['iq_real'], dtype=np.float32)
-    iq_imag = np.array(input_data['iq_imag'], dtype=np.float32)
-    iq_samples = iq_real + 1j * iq_imag
-    
-    params = input_data.get('params', {})
+    Runs as a long-lived worker: the model is loaded once and every stdin
+    line is classified with it. A single request without a trailing newline
+    (one-shot invocation) works the same way.
     
-    # Classification parameters
-    model_path = params.get('model_path')
-    use_gpu = params.get('use_gpu', True)
-    top_k = params.get('top_k', 5)
-    
-    # Run classification
-    classifier = ModulationClassifier(model_path=model_path, use_gpu=use_gpu)
-    results = classifier.classify(iq_samples, top_k=top_k)
+    Input (stdin): one JSON object per line with {iq_real: [], iq_imag: [], params: {}}
+    Output (stdout): one JSON line with classification results per request,
+                     or {error: str} if that request failed
+    """
+    # Classifiers keyed by (model_path, use_gpu), kept for the process lifetime
+    classifiers = {}
     
-    # Output JSON to stdout
-    print(json.dumps(results, indent=2))
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        
+        try:
+            input_data = orjson.loads(line) if ORJSON_AVAILABLE else json.loads(line)
+            
+            # Keep I and Q as separate channels (the model's own layout)
+            iq_samples = np.array([input_data['iq_real'], input_data['iq_imag']], dtype=np.float32)
+            
+            params = input_data.get('params', {})
+            
+            # Classification parameters
+            model_path = params.get('model_path')
+            use_gpu = params.get('use_gpu', True)
+            top_k = params.get('top_k', 5)
+            if not isinstance(top_k, int) or top_k < 1:
+                raise ValueError(f"top_k must be a positive integer, got {top_k!r}")
+            
+            # Run classification
+            key = (model_path, use_gpu)
+            if key not in classifiers:
+                classifiers[key] = ModulationClassifier(model_path=model_path, use_gpu=use_gpu)
+            results = classifiers[key].classify(iq_samples, top_k=top_k)
+        except Exception as e:
+            # Report the failure on this request's line; keep the worker alive
+            print(f"[Classifier] ERROR: {type(e).__name__}: {e}", file=sys.stderr)
+            results = {'error': f"{type(e).__name__}: {e}"}
+        
+        # Output one JSON line per request
+        _write_line(results)
 
 
 if __name__ == '__main__':
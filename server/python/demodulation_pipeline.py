@@ -14,6 +14,8 @@ Implements:
 """
 
 import sys
+import math
+import functools
 import numpy as np
 from typing import Dict, Any, Optional, Tuple, List
 from dataclasses import dataclass
@@ -31,6 +33,94 @@ except ImportError:
     xp = np
     from scipy import signal as sp_signal
 
+# Fused |x|^2 for complex64 samples (one pass, no sqrt)
+if GPU_AVAILABLE:
+    _mag2_kernel = cp.ElementwiseKernel(
+        'complex64 s', 'float32 p',
+        'p = s.real() * s.real() + s.imag() * s.imag()',
+        'mag2'
+    )
+    
+    # Frequency shift by -f cycles/sample; the phase is reduced to one cycle
+    # in double precision before the single-precision sincos
+    _mix_down_kernel = cp.ElementwiseKernel(
+        'complex64 x, float64 f', 'complex64 y',
+        '''
+        double cycles = f * (double)i;
+        cycles -= floor(cycles);
+        float s, c;
+        sincosf((float)(-6.283185307179586 * cycles), &s, &c);
+        y = x * complex<float>(c, s);
+        ''',
+        'mix_down'
+    )
+    
+    # Costas block tracking: rotate by the predicted NCO phase phase0 + freq*i
+    # and emit the wrapped phase, with no complex128 phasor temporary
+    _nco_rotate_kernel = cp.ElementwiseKernel(
+        'complex64 x, float64 phase0, float64 freq', 'complex64 y, float32 wrapped',
+        '''
+        double phase = phase0 + freq * (double)i;
+        double cycles = (phase + 3.141592653589793) * 0.15915494309189535;
+        phase -= 6.283185307179586 * floor(cycles);
+        float s, c;
+        sincosf((float)phase, &s, &c);
+        y = x * complex<float>(c, -s);
+        wrapped = (float)phase;
+        ''',
+        'nco_rotate'
+    )
+    
+    # Costas block-rate loop filter update on 0-d device state, so the
+    # tracking loop never waits on the host between blocks
+    _costas_block_update_kernel = cp.ElementwiseKernel(
+        'float32 error, float64 alpha, float64 beta, float64 length',
+        'float64 phase, float64 freq',
+        '''
+        freq += beta * (double)error / length;
+        phase += length * freq + alpha * (double)error;
+        phase -= 6.283185307179586 * floor((phase + 3.141592653589793) * 0.15915494309189535);
+        ''',
+        'costas_block_update'
+    )
+    
+    # Kay weighted phase-difference sum; angle(x[k] * conj(x[k-1])) is formed
+    # from real arithmetic and reduced in place, with no N-sample temporary
+    _kay_kernel = cp.ReductionKernel(
+        'complex64 cur, complex64 prev, float32 w', 'float32 acc',
+        'w * atan2f(cur.imag() * prev.real() - cur.real() * prev.imag(), '
+        'cur.real() * prev.real() + cur.imag() * prev.imag())',
+        'a + b', 'acc = a', '0',
+        'kay_phase_sum'
+    )
+
+@functools.lru_cache(maxsize=32)
+def _kay_weights(n: int, on_gpu: bool) -> Any:
+    """
+    Normalized Kay weights for an N-sample block, cached per (N, device)
+    
+    w[k] is proportional to (N - k) * k; the 3/2 * N / (N^2 - 1) / (N - 1)
+    scale cancels once the weights are normalized to sum to 1.
+    """
+    k = np.arange(1, n, dtype=np.float64)
+    weights = (n - k) * k
+    weights = (weights / np.sum(weights)).astype(np.float32)
+    return cp.asarray(weights) if on_gpu else weights
+
+
+# Numba is optional - per-sample loops run as plain Python without it
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 
 class ModulationType(Enum):
     """Supported modulation types"""
@@ -76,6 +166,10 @@ class TimingRecoveryResult:
 # CFO ESTIMATION ALGORITHMS
 # =============================================================================
 
+# Fitz autocorrelations switch from per-lag dot products to one FFT pair here
+FITZ_FFT_MIN_LAG = 8
+
+
 class CFOEstimator:
     """
     Carrier Frequency Offset Estimation
@@ -116,24 +210,21 @@ class CFOEstimator:
         Returns:
             CFOEstimate with frequency offset
         """
-        samples = self._to_gpu(iq_samples.astype(np.complex64))
+        samples = self._to_gpu(iq_samples.astype(np.complex64, copy=False))
         n = len(samples)
         
         # Compute autocorrelation at lag
         # R(lag) = sum(x[n] * conj(x[n-lag])) / (N - lag)
-        r_lag = xp.sum(samples[lag:] * xp.conj(samples[:-lag])) / (n - lag)
+        # vdot conjugates its first argument: one fused cdotc, no N-sample temporary
+        r_lag = xp.vdot(samples[:-lag], samples[lag:]) / (n - lag)
         
-        # Extract phase
-        phase = xp.angle(r_lag)
+        # Phase and magnitude come back together: one device->host sync
+        phase, confidence = (float(v) for v in self._to_cpu(xp.stack([xp.angle(r_lag), xp.abs(r_lag)])))
         
         # Convert to frequency offset
-        ts = 1.0 / self.sample_rate
-        cfo_normalized = float(self._to_cpu(phase)) / (2 * np.pi * lag)
+        cfo_normalized = phase / (2 * np.pi * lag)
         cfo_hz = cfo_normalized * self.sample_rate
         
-        # Confidence based on magnitude of autocorrelation
-        confidence = float(self._to_cpu(xp.abs(r_lag)))
-        
         return CFOEstimate(
             cfo_hz=cfo_hz,
             cfo_normalized=cfo_normalized,
@@ -153,19 +244,21 @@ class CFOEstimator:
         Returns:
             CFOEstimate with frequency offset
         """
-        samples = self._to_gpu(iq_samples.astype(np.complex64))
+        samples = self._to_gpu(iq_samples.astype(np.complex64, copy=False))
         n = len(samples)
         
-        # Compute phase differences
-        phase_diff = xp.angle(samples[1:] * xp.conj(samples[:-1]))
+        # Kay's weights: w[k] = 3/2 * N * (N^2 - 1) * (N - k) * k, normalized
+        weights = _kay_weights(n, GPU_AVAILABLE)
         
-        # Kay's weights: w[k] = 3/2 * N * (N^2 - 1) * (N - k) * k
-        k = xp.arange(1, n)
-        weights = (3.0 / 2.0) * n / (n**2 - 1) * (n - k) * k / (n - 1)
-        weights = weights[:len(phase_diff)]
-        
-        # Weighted average
-        cfo_normalized = float(self._to_cpu(xp.sum(weights * phase_diff) / xp.sum(weights)))
+        if GPU_AVAILABLE:
+            # Phase differences and weighted sum fused into one reduction
+            cfo_normalized = float(self._to_cpu(_kay_kernel(samples[1:], samples[:-1], weights)))
+        else:
+            # Phase differences from real/imag parts; skips the complex product array
+            cur, prev = samples[1:], samples[:-1]
+            phase_diff = np.arctan2(cur.imag * prev.real - cur.real * prev.imag,
+                                    cur.real * prev.real + cur.imag * prev.imag)
+            cfo_normalized = float(np.dot(weights, phase_diff))
         cfo_normalized /= (2 * np.pi)
         cfo_hz = cfo_normalized * self.sample_rate
         
@@ -190,30 +283,36 @@ class CFOEstimator:
         Returns:
             CFOEstimate with frequency offset
         """
-        samples = self._to_gpu(iq_samples.astype(np.complex64))
+        samples = self._to_gpu(iq_samples.astype(np.complex64, copy=False))
         n = len(samples)
         
         # Limit max_lag
         max_lag = min(max_lag, n // 4)
+        if max_lag < 1:
+            # Too short for any lag: zero estimate
+            return CFOEstimate(cfo_hz=0.0, cfo_normalized=0.0, confidence=0.85, method="fitz")
         
-        # Compute autocorrelations for multiple lags
-        phases = []
-        weights = []
+        # Autocorrelations for all lags, R(m) = sum(x[n] * conj(x[n-m])), kept on
+        # the device (vdot conjugates its first argument, no product temporary).
+        # The 1/(N - m) normalization does not change the phase and is skipped.
+        lags = np.arange(1, max_lag + 1)
+        if max_lag >= FITZ_FFT_MIN_LAG:
+            # Wiener-Khinchin: one padded FFT pair yields every lag at once.
+            # Padding to >= N + max_lag keeps lags 1..max_lag free of wrap-around.
+            nfft = 1 << (n + max_lag - 1).bit_length()
+            spectrum = xp.fft.fft(samples, nfft)
+            r = xp.fft.ifft(spectrum.real ** 2 + spectrum.imag ** 2)[1:max_lag + 1]
+        else:
+            r = xp.stack([xp.vdot(samples[:-m], samples[m:]) for m in lags])
         
-        for m in range(1, max_lag + 1):
-            r_m = xp.sum(samples[m:] * xp.conj(samples[:-m])) / (n - m)
-            phase_m = xp.angle(r_m)
-            phases.append(float(self._to_cpu(phase_m)))
-            
-            # Weight by lag (Fitz weighting)
-            weights.append(m * (n - m))
+        # Single device -> host transfer for every lag's phase
+        phases = self._to_cpu(xp.angle(r)).astype(np.float64)
         
-        phases = np.array(phases)
-        weights = np.array(weights)
+        # Weight by lag (Fitz weighting)
+        weights = lags * (n - lags)
         weights = weights / np.sum(weights)
         
         # Weighted phase estimate accounting for lag
-        lags = np.arange(1, max_lag + 1)
         phase_per_sample = np.sum(weights * phases / lags)
         
         cfo_normalized = phase_per_sample / (2 * np.pi)
@@ -251,12 +350,136 @@ class CFOEstimator:
 # COSTAS LOOP
 # =============================================================================
 
+TWO_PI = 2.0 * math.pi
+INV_TWO_PI = 1.0 / TWO_PI
+
+# Frequency-shift phasor is re-anchored to an exact value every MIX_RESYNC samples
+MIX_RESYNC = 1024
+
+
+@njit(cache=True)
+def _mix_down_rotator(iq, cfo_normalized, out):
+    """
+    Compiled frequency shift: the rotator exp(-j*2*pi*f*n) is advanced by one
+    complex multiply per sample instead of evaluating exp for every n.
+    """
+    n = iq.shape[0]
+    w = -TWO_PI * cfo_normalized
+    step = complex(math.cos(w), math.sin(w))
+    rot = complex(1.0, 0.0)
+    
+    for i in range(n):
+        if i % MIX_RESYNC == 0:
+            # Exact phase, reduced to one cycle before scaling
+            cycles = cfo_normalized * i
+            cycles -= math.floor(cycles)
+            rot = complex(math.cos(-TWO_PI * cycles), math.sin(-TWO_PI * cycles))
+        out[i] = iq[i] * rot
+        rot *= step
+    
+    return out
+
+
+def _mix_down(iq, cfo_normalized, out):
+    """
+    Frequency-shift samples by -cfo_normalized cycles/sample into out
+    
+    Uses the compiled rotator when numba is available. Without it that
+    recursion would be a per-sample Python loop, so the phase is evaluated
+    for every n at once instead (reduced to one cycle in float64 first).
+    """
+    if NUMBA_AVAILABLE:
+        return _mix_down_rotator(iq, cfo_normalized, out)
+    
+    cycles = cfo_normalized * np.arange(len(iq), dtype=np.float64)
+    cycles -= np.floor(cycles)
+    np.multiply(iq, np.exp(-1j * TWO_PI * cycles), out=out)
+    return out
+
+# Phase detector selector passed to the compiled loop
+COSTAS_MODES = {"bpsk": 0, "qpsk": 1, "8psk": 2}
+
+# NCO phasor is advanced by recurrence and re-anchored to an exact cos/sin of
+# the phase every NCO_RESYNC samples (or after a large step) to bound drift
+NCO_RESYNC = 256
+NCO_MAX_STEP = 0.25
+
+# Upper bound on the normalized loop bandwidth of the block-rate Costas update
+# (process_gpu); larger block-rate gains make the sampled loop oscillate
+COSTAS_MAX_BLOCK_BANDWIDTH = 0.25
+
+# Default process_gpu lock test: the frequency estimate has settled when its
+# std over the last quarter of acquisition is below this fraction of the loop
+# bandwidth (locked BPSK/QPSK loops jitter at roughly 0.01-0.18x; a loop still
+# pulling in or slipping cycles sits above ~0.2x)
+COSTAS_LOCK_FRACTION = 0.2
+
+
+@njit(cache=True)
+def _costas_run(iq, alpha, beta, mode, phase, freq):
+    """
+    Per-sample Costas loop (JIT-compiled when numba is available)
+    
+    Returns:
+        Tuple of (corrected, phase_traj, freq_traj, final_phase, final_freq)
+    """
+    n = iq.shape[0]
+    corrected = np.empty(n, dtype=np.complex64)
+    phase_traj = np.empty(n, dtype=np.float32)
+    freq_traj = np.empty(n, dtype=np.float32)
+    
+    # NCO phasor exp(j*phase) = c + j*s
+    c = math.cos(phase)
+    s = math.sin(phase)
+    
+    for i in range(n):
+        # Rotate sample by current phase estimate: x * exp(-j*phase)
+        re = iq[i].real * c + iq[i].imag * s
+        im = iq[i].imag * c - iq[i].real * s
+        corrected[i] = complex(re, im)
+        
+        # Phase detector
+        if mode == 0:
+            error = re * im
+        elif mode == 1:
+            # copysign is a sign-bit transfer: no branch, no ufunc dispatch
+            error = re * math.copysign(1.0, im) - im * math.copysign(1.0, re)
+        else:
+            # Decision-directed 8PSK: angle to the nearest multiple of pi/4
+            ang = math.atan2(im, re)
+            error = ang - math.floor(ang * (4.0 / math.pi) + 0.5) * (math.pi / 4.0)
+        
+        # Loop filter (Type 2)
+        freq += beta * error
+        step = alpha * error + freq
+        phase += step
+        
+        # Wrap phase to [-pi, pi) without a branch or fmod
+        phase -= TWO_PI * math.floor((phase + math.pi) * INV_TWO_PI)
+        
+        # Advance NCO: multiply by exp(j*step) from its Taylor series
+        # (step is small once the loop is tracking), resyncing periodically
+        if (i + 1) % NCO_RESYNC == 0 or abs(step) > NCO_MAX_STEP:
+            c = math.cos(phase)
+            s = math.sin(phase)
+        else:
+            step2 = step * step
+            dc = 1.0 - step2 * (0.5 - step2 * (1.0 / 24.0))
+            ds = step * (1.0 - step2 * (1.0 / 6.0 - step2 * (1.0 / 120.0)))
+            c, s = c * dc - s * ds, s * dc + c * ds
+        
+        phase_traj[i] = phase
+        freq_traj[i] = freq
+    
+    return corrected, phase_traj, freq_traj, phase, freq
+
+
 class CostasLoop:
     """
     Costas Loop for Carrier Recovery
     
     Implements a digital Costas loop for fine CFO tracking and correction.
-    Supports BPSK and QPSK modes.
+    Supports BPSK, QPSK and 8PSK modes.
     """
     
     def __init__(
@@ -271,41 +494,57 @@ class CostasLoop:
         Args:
             loop_bandwidth: Normalized loop bandwidth (0.001 - 0.1)
             damping: Damping factor (0.5 - 1.0, typically 0.707)
-            mode: 'bpsk' or 'qpsk'
+            mode: 'bpsk', 'qpsk' or '8psk'
         """
         self.mode = mode.lower()
+        self.loop_bandwidth = loop_bandwidth
+        self.damping = damping
         
-        # Calculate loop filter coefficients (Type 2 loop)
-        # Using standard PLL design equations
-        theta = loop_bandwidth / (damping + 1.0 / (4 * damping))
-        d = 1 + 2 * damping * theta + theta**2
-        
-        self.alpha = (4 * damping * theta) / d  # Proportional gain
-        self.beta = (4 * theta**2) / d          # Integral gain
+        # Proportional / integral gains of the per-sample loop
+        self.alpha, self.beta = self._loop_gains(loop_bandwidth, damping)
         
         # State variables
         self.phase = 0.0
         self.freq = 0.0
     
-    def _phase_detector(self, sample: complex) -> float:
+    @staticmethod
+    def _loop_gains(loop_bandwidth: float, damping: float) -> Tuple[float, float]:
+        """Type 2 loop filter coefficients (standard PLL design equations)"""
+        theta = loop_bandwidth / (damping + 1.0 / (4 * damping))
+        d = 1 + 2 * damping * theta + theta**2
+        
+        alpha = (4 * damping * theta) / d  # Proportional gain
+        beta = (4 * theta**2) / d          # Integral gain
+        return alpha, beta
+    
+    @staticmethod
+    def phase_detector_bulk(samples: Any, mode: str) -> Any:
         """
-        Phase detector for Costas loop
+        Vectorized phase detector over already-rotated samples
+        
+        Same detectors as the per-sample loop, evaluated with ufuncs over a
+        whole block (NumPy or CuPy array).
         
         Args:
-            sample: Rotated complex sample
+            samples: Rotated complex samples
+            mode: 'bpsk', 'qpsk' or '8psk'
         
         Returns:
-            Phase error
+            Phase error per sample
         """
-        if self.mode == "bpsk":
-            # BPSK: error = real(sample) * imag(sample)
-            return sample.real * sample.imag
-        elif self.mode == "qpsk":
-            # QPSK: error = real(sample) * sign(imag(sample)) - imag(sample) * sign(real(sample))
-            return (sample.real * np.sign(sample.imag) - 
-                    sample.imag * np.sign(sample.real))
+        mod = cp.get_array_module(samples) if GPU_AVAILABLE else np
+        re = samples.real
+        im = samples.imag
+        
+        if mode == "bpsk":
+            return re * im
+        elif mode == "qpsk":
+            return re * mod.copysign(1.0, im) - im * mod.copysign(1.0, re)
+        elif mode == "8psk":
+            ang = mod.arctan2(im, re)
+            return ang - mod.round(ang * (4.0 / np.pi)) * (np.pi / 4.0)
         else:
-            raise ValueError(f"Unsupported mode: {self.mode}")
+            raise ValueError(f"Unsupported mode: {mode}")
     
     def process(self, iq_samples: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
@@ -317,44 +556,97 @@ class CostasLoop:
         Returns:
             Tuple of (corrected_samples, phase_trajectory, freq_trajectory)
         """
-        n = len(iq_samples)
-        corrected = np.zeros(n, dtype=np.complex64)
-        phase_traj = np.zeros(n)
-        freq_traj = np.zeros(n)
-        
-        for i, sample in enumerate(iq_samples):
-            # Rotate sample by current phase estimate
-            rotated = sample * np.exp(-1j * self.phase)
-            corrected[i] = rotated
-            
-            # Phase detector
-            error = self._phase_detector(rotated)
-            
-            # Loop filter (Type 2)
-            self.freq += self.beta * error
-            self.phase += self.alpha * error + self.freq
-            
-            # Wrap phase
-            self.phase = np.mod(self.phase + np.pi, 2 * np.pi) - np.pi
-            
-            phase_traj[i] = self.phase
-            freq_traj[i] = self.freq
+        if self.mode not in COSTAS_MODES:
+            raise ValueError(f"Unsupported mode: {self.mode}")
+        
+        samples = np.ascontiguousarray(iq_samples, dtype=np.complex64)
+        corrected, phase_traj, freq_traj, self.phase, self.freq = _costas_run(
+            samples, self.alpha, self.beta, COSTAS_MODES[self.mode], self.phase, self.freq
+        )
         
         return corrected, phase_traj, freq_traj
     
-    def process_gpu(self, iq_samples: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    def process_gpu(self, iq_samples: np.ndarray,
+                    block_size: int = 1024,
+                    acquisition_samples: int = 16384,
+                    lock_tolerance: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
         GPU-accelerated Costas loop (batch processing)
         
-        Note: Costas loop is inherently sequential, but we can vectorize
-        the rotation operation for blocks of samples using predicted phase.
+        Acquisition runs through the per-sample loop. Once the frequency
+        estimate has settled, tracking starts from its mean over the settle
+        window and the NCO phase is predicted across each block as
+        phase + freq * n, so derotation and phase detection are parallel over
+        the block; the loop filter is then updated once per block from the
+        block-mean phase error, with gains designed at the block rate (loop
+        bandwidth scaled by the block length, capped at
+        COSTAS_MAX_BLOCK_BANDWIDTH to keep the sampled loop stable). Loop
+        state stays on the device until the last block. If the loop has not
+        settled by the end of acquisition, the remaining samples stay on the
+        per-sample loop.
+        
+        Args:
+            iq_samples: Complex IQ samples
+            block_size: Samples per block in tracking mode
+            acquisition_samples: Samples processed per-sample before tracking
+            lock_tolerance: Max std of the frequency estimate (rad/sample)
+                over the last quarter of acquisition to count as locked
+                (default: COSTAS_LOCK_FRACTION * loop_bandwidth)
+        
+        Returns:
+            Tuple of (corrected_samples, phase_trajectory, freq_trajectory)
         """
-        if not GPU_AVAILABLE:
+        if not GPU_AVAILABLE or len(iq_samples) <= acquisition_samples:
             return self.process(iq_samples)
         
-        # For now, use CPU implementation
-        # True GPU acceleration requires custom CUDA kernel
-        return self.process(iq_samples)
+        if lock_tolerance is None:
+            lock_tolerance = COSTAS_LOCK_FRACTION * self.loop_bandwidth
+        
+        # Acquisition (sequential)
+        acq_corrected, acq_phase, acq_freq = self.process(iq_samples[:acquisition_samples])
+        settle = acq_freq[-(acquisition_samples // 4):]
+        if float(np.std(settle)) > lock_tolerance:
+            corrected, phase_traj, freq_traj = self.process(iq_samples[acquisition_samples:])
+            return (np.concatenate([acq_corrected, corrected]),
+                    np.concatenate([acq_phase, phase_traj]),
+                    np.concatenate([acq_freq, freq_traj]))
+        
+        # Tracking (block-parallel on the GPU)
+        samples = cp.asarray(np.ascontiguousarray(iq_samples[acquisition_samples:], dtype=np.complex64))
+        n = len(samples)
+        corrected = cp.empty(n, dtype=cp.complex64)
+        phase_traj = cp.empty(n, dtype=cp.float32)
+        freq_traj = cp.empty(n, dtype=cp.float32)
+        
+        # The per-sample estimate at handover still carries the wide loop's
+        # jitter; the settle-window mean is a far better starting frequency
+        phase = cp.full((), self.phase, dtype=cp.float64)
+        freq = cp.full((), float(np.mean(settle)), dtype=cp.float64)
+        
+        # Block-rate loop: one update per block_size samples
+        block_bw = min(self.loop_bandwidth * block_size, COSTAS_MAX_BLOCK_BANDWIDTH)
+        block_alpha, block_beta = self._loop_gains(block_bw, self.damping)
+        
+        for start in range(0, n, block_size):
+            end = min(start + block_size, n)
+            
+            # Rotate by the predicted NCO phase across the block, writing the
+            # corrected samples and wrapped phase straight into the outputs
+            rotated = corrected[start:end]
+            _nco_rotate_kernel(samples[start:end], phase, freq,
+                               rotated, phase_traj[start:end])
+            freq_traj[start:end] = freq
+            
+            # One loop-filter update per block from the mean phase error; the
+            # block-rate integrator tracks phase advance per block (freq * length)
+            error = cp.mean(self.phase_detector_bulk(rotated, self.mode))
+            _costas_block_update_kernel(error, block_alpha, block_beta,
+                                        float(end - start), phase, freq)
+        
+        self.phase, self.freq = (float(v) for v in cp.stack((phase, freq)).get())
+        return (np.concatenate([acq_corrected, cp.asnumpy(corrected)]),
+                np.concatenate([acq_phase, cp.asnumpy(phase_traj)]),
+                np.concatenate([acq_freq, cp.asnumpy(freq_traj)]))
     
     def reset(self):
         """Reset loop state"""
@@ -377,6 +669,18 @@ class M2M4Estimator:
     Extended for complex signals.
     """
     
+    # Kurtosis correction factor based on modulation
+    # For PSK: kappa = 1 (constant envelope)
+    # For QAM: kappa depends on constellation
+    _KAPPA = {
+        "bpsk": 1.0,
+        "qpsk": 1.0,
+        "8psk": 1.0,
+        "16qam": 1.32,
+        "64qam": 1.38,
+        "ofdm": 1.0,  # Approximation
+    }
+    
     def __init__(self):
         pass
     
@@ -402,31 +706,22 @@ class M2M4Estimator:
         Returns:
             SNREstimate with SNR in dB
         """
-        samples = self._to_gpu(iq_samples.astype(np.complex64))
-        
-        # Compute moments of magnitude
-        magnitude = xp.abs(samples)
-        
-        m2 = xp.mean(magnitude ** 2)  # 2nd moment
-        m4 = xp.mean(magnitude ** 4)  # 4th moment
-        
-        # Kurtosis correction factor based on modulation
-        # For PSK: kappa = 1 (constant envelope)
-        # For QAM: kappa depends on constellation
-        kappa_table = {
-            "bpsk": 1.0,
-            "qpsk": 1.0,
-            "8psk": 1.0,
-            "16qam": 1.32,
-            "64qam": 1.38,
-            "ofdm": 1.0,  # Approximation
-        }
-        kappa = kappa_table.get(modulation.lower(), 1.0)
+        samples = self._to_gpu(iq_samples.astype(np.complex64, copy=False))
+        
+        # Moments from instantaneous power |x|^2 (no sqrt; |x|^4 = p^2)
+        if GPU_AVAILABLE:
+            p = _mag2_kernel(samples)
+        else:
+            p = samples.real * samples.real + samples.imag * samples.imag
+        
+        m2 = xp.mean(p)      # 2nd moment
+        m4 = xp.mean(p * p)  # 4th moment
+        
+        kappa = self._KAPPA.get(modulation.lower(), 1.0)
         
         # M2M4 formula for complex signals
         # SNR = sqrt(2 * M2^2 / (kappa * M4 - M2^2))
-        m2_cpu = float(self._to_cpu(m2))
-        m4_cpu = float(self._to_cpu(m4))
+        m2_cpu, m4_cpu = (float(v) for v in self._to_cpu(xp.stack([m2, m4])))
         
         numerator = 2 * m2_cpu ** 2
         denominator = kappa * m4_cpu - m2_cpu ** 2
@@ -468,16 +763,29 @@ class M2M4Estimator:
         n = len(iq_samples)
         segment_size = n // num_segments
         
-        snr_values = []
-        for i in range(num_segments):
-            start = i * segment_size
-            end = start + segment_size
-            segment = iq_samples[start:end]
-            
-            estimate = self.estimate(segment)
-            snr_values.append(estimate.snr_db)
+        # All segments as rows of one (num_segments, segment_size) block
+        samples = self._to_gpu(
+            iq_samples[:num_segments * segment_size].astype(np.complex64, copy=False)
+        ).reshape(num_segments, segment_size)
+        
+        if GPU_AVAILABLE:
+            p = _mag2_kernel(samples)
+        else:
+            p = samples.real * samples.real + samples.imag * samples.imag
+        
+        # Per-segment moments in one batched reduction, one transfer to host
+        moments = xp.stack([xp.mean(p, axis=1), xp.mean(p * p, axis=1)])
+        m2, m4 = self._to_cpu(moments).astype(np.float64)
+        
+        # Same M2M4 formula as estimate() (default QPSK kurtosis), per segment
+        kappa = self._KAPPA["qpsk"]
+        numerator = 2 * m2 ** 2
+        denominator = kappa * m4 - m2 ** 2
+        valid = denominator > 0
+        snr_linear = np.full(num_segments, 100.0)
+        snr_linear[valid] = np.sqrt(numerator[valid] / denominator[valid])
         
-        snr_array = np.array(snr_values)
+        snr_array = 10 * np.log10(snr_linear)
         mean_snr = np.mean(snr_array)
         
         mean_estimate = SNREstimate(
@@ -494,6 +802,10 @@ class M2M4Estimator:
 # MATCHED FILTER & PULSE SHAPING
 # =============================================================================
 
+# Direct convolutions above this many multiply-accumulates go through FFTs
+MF_FFT_MIN_MACS = 1 << 17
+
+
 class MatchedFilter:
     """
     GPU-accelerated Matched Filter
@@ -508,6 +820,9 @@ class MatchedFilter:
         self.sps = samples_per_symbol
         self.num_taps = num_taps
         self._filter_cache: Dict[str, np.ndarray] = {}
+        self._spectrum_cache: Dict[Tuple[str, int], Any] = {}
+        # Device copies of the taps (complex64), uploaded once per filter
+        self._filter_cache_gpu: Dict[str, Any] = {}
     
     def _to_gpu(self, arr: np.ndarray) -> Any:
         if GPU_AVAILABLE:
@@ -540,20 +855,20 @@ class MatchedFilter:
         # Avoid division by zero
         eps = 1e-10
         
-        h = np.zeros(N)
-        for i, ti in enumerate(t):
-            if abs(ti) < eps:
-                h[i] = 1 - rolloff + 4 * rolloff / np.pi
-            elif abs(abs(ti) - 1/(4*rolloff)) < eps and rolloff > 0:
-                h[i] = rolloff / np.sqrt(2) * (
-                    (1 + 2/np.pi) * np.sin(np.pi / (4*rolloff)) +
-                    (1 - 2/np.pi) * np.cos(np.pi / (4*rolloff))
-                )
-            else:
-                num = np.sin(np.pi * ti * (1 - rolloff)) + \
-                      4 * rolloff * ti * np.cos(np.pi * ti * (1 + rolloff))
-                den = np.pi * ti * (1 - (4 * rolloff * ti)**2)
-                h[i] = num / (den + eps)
+        # All taps in one vectorized pass; the two singular points are
+        # patched in with np.where afterwards
+        num = np.sin(np.pi * t * (1 - rolloff)) + \
+              4 * rolloff * t * np.cos(np.pi * t * (1 + rolloff))
+        den = np.pi * t * (1 - (4 * rolloff * t)**2)
+        h = num / (den + eps)
+        
+        if rolloff > 0:
+            singular = np.abs(np.abs(t) - 1/(4*rolloff)) < eps
+            h = np.where(singular, rolloff / np.sqrt(2) * (
+                (1 + 2/np.pi) * np.sin(np.pi / (4*rolloff)) +
+                (1 - 2/np.pi) * np.cos(np.pi / (4*rolloff))
+            ), h)
+        h = np.where(np.abs(t) < eps, 1 - rolloff + 4 * rolloff / np.pi, h)
         
         # Normalize
         h = h / np.sqrt(np.sum(h**2))
@@ -576,18 +891,37 @@ class MatchedFilter:
             return self._filter_cache[cache_key]
         
         N = self.num_taps
-        sps = self.sps
-        t = np.arange(-(N-1)//2, (N-1)//2 + 1) / sps
+        t = np.arange(-(N-1)//2, (N-1)//2 + 1, dtype=np.float32)
         
+        # exp(-(pi * t / (alpha * sps))^2) with the scale folded into one
+        # float32 factor; the sqrt(pi) / alpha gain cancels in normalization
         alpha = np.sqrt(np.log(2) / 2) / bt
-        h = np.sqrt(np.pi) / alpha * np.exp(-(np.pi * t / alpha)**2)
+        k = np.float32(np.pi / (alpha * self.sps))
+        x = k * t
+        h = np.exp(-(x * x))
         
         # Normalize
-        h = h / np.sum(h)
+        h /= np.sum(h)
         
-        self._filter_cache[cache_key] = h.astype(np.float32)
+        self._filter_cache[cache_key] = h
         return self._filter_cache[cache_key]
     
+    def _filter_spectrum(self, cache_key: str, h: np.ndarray, nfft: int) -> Any:
+        """
+        Full nfft-point spectrum of real taps, cached per (filter, nfft)
+        
+        The taps are real, so only the rfft half is computed; the upper bins
+        follow from Hermitian symmetry H[nfft - k] = conj(H[k]).
+        """
+        key = (cache_key, nfft)
+        if key not in self._spectrum_cache:
+            half = xp.fft.rfft(self._to_gpu(h), nfft).astype(xp.complex64)
+            spectrum = xp.empty(nfft, dtype=xp.complex64)
+            spectrum[:len(half)] = half
+            spectrum[len(half):] = xp.conj(half[1:nfft - len(half) + 1][::-1])
+            self._spectrum_cache[key] = spectrum
+        return self._spectrum_cache[key]
+    
     def apply(self, iq_samples: np.ndarray, 
               filter_type: str = "rrc",
               **kwargs) -> np.ndarray:
@@ -600,27 +934,43 @@ class MatchedFilter:
             **kwargs: Filter parameters (rolloff, bt)
         
         Returns:
-            Filtered samples
+            Filtered samples (a device array if iq_samples already was one)
         """
         # Get filter
         if filter_type == "rrc":
+            cache_key = f"rrc_{kwargs.get('rolloff', 0.35)}"
             h = self.rrc_filter(rolloff=kwargs.get("rolloff", 0.35))
         elif filter_type == "gaussian":
+            cache_key = f"gauss_{kwargs.get('bt', 0.3)}"
             h = self.gaussian_filter(bt=kwargs.get("bt", 0.3))
         else:
             raise ValueError(f"Unknown filter type: {filter_type}")
         
-        samples = self._to_gpu(iq_samples.astype(np.complex64))
-        h_gpu = self._to_gpu(h.astype(np.float32))
-        
-        if GPU_AVAILABLE:
-            # GPU convolution (separate I and Q)
-            filtered_real = cp.convolve(samples.real, h_gpu, mode='same')
-            filtered_imag = cp.convolve(samples.imag, h_gpu, mode='same')
-            filtered = filtered_real + 1j * filtered_imag
+        samples = self._to_gpu(iq_samples.astype(np.complex64, copy=False))
+        
+        n, m = len(samples), len(h)
+        if n >= m and n * m >= MF_FFT_MIN_MACS:
+            # FFT convolution against the cached tap spectrum: one forward and
+            # one inverse transform per call (cuFFT plans come from cupy's cache)
+            nfft = 1 << (n + m - 2).bit_length()
+            spectrum = self._filter_spectrum(cache_key, h, nfft)
+            full = xp.fft.ifft(xp.fft.fft(samples, nfft) * spectrum)
+            # 'same' alignment: centre n outputs of the n + m - 1 full convolution
+            start = (m - 1) // 2
+            filtered = full[start:start + n]
+        elif GPU_AVAILABLE:
+            # Real taps as complex64: one complex convolution filters I and Q
+            # together, and nothing is promoted to complex128 on the way
+            h_gpu = self._filter_cache_gpu.get(cache_key)
+            if h_gpu is None:
+                h_gpu = cp.asarray(h, dtype=cp.complex64)
+                self._filter_cache_gpu[cache_key] = h_gpu
+            filtered = cp.convolve(samples, h_gpu, mode='same')
         else:
             filtered = np.convolve(samples, h, mode='same')
         
+        if GPU_AVAILABLE and isinstance(iq_samples, cp.ndarray):
+            return filtered
         return self._to_cpu(filtered)
 
 
@@ -628,6 +978,134 @@ class MatchedFilter:
 # TIMING RECOVERY
 # =============================================================================
 
+FARROW_SIXTH = 1.0 / 6.0
+
+
+@njit(cache=True)
+def _interp_cubic(samples, mu, idx):
+    """Farrow cubic interpolation at samples[idx + mu], clamped at the edges"""
+    n = samples.shape[0]
+    if idx < 1 or idx >= n - 2:
+        return samples[max(0, min(idx, n - 1))]
+    
+    # Contiguous 4-sample stencil; constant divisions folded into multiplies
+    x0 = samples[idx - 1]
+    x1 = samples[idx]
+    x2 = samples[idx + 1]
+    x3 = samples[idx + 2]
+    
+    a1 = 0.5 * (x2 - x0)
+    a2 = x0 - 2.5 * x1 + 2.0 * x2 - 0.5 * x3
+    a3 = FARROW_SIXTH * (x3 - x0) + 0.5 * (x1 - x2)
+    
+    return x1 + mu * (a1 + mu * (a2 + mu * a3))
+
+
+@njit(cache=True)
+def _gardner_run(samples, sps, alpha, beta, timing_adj):
+    """
+    Gardner TED loop (JIT-compiled when numba is available)
+    
+    Returns:
+        Tuple of (symbols, errors, count, timing_adj); only the first
+        count entries of the preallocated outputs are valid
+    """
+    n = samples.shape[0]
+    # Every step advances at least sps / 2 samples, which bounds the output
+    max_symbols = int(n / (0.5 * sps)) + 1
+    symbols = np.empty(max_symbols, dtype=np.complex64)
+    errors = np.empty(max_symbols, dtype=np.float32)
+    
+    half = sps / 2
+    sample_idx = half  # Start at first symbol center
+    prev_symbol = 0j
+    count = 0
+    
+    while sample_idx < n - sps - 2:
+        idx = int(sample_idx)
+        current_symbol = _interp_cubic(samples, sample_idx - idx, idx)
+        
+        # Midpoint, half a symbol back
+        mid_pos = sample_idx - half
+        mid_idx = int(mid_pos)
+        mid_sample = _interp_cubic(samples, mid_pos - mid_idx, mid_idx)
+        
+        # e = real((y[n] - y[n-1]) * conj(y[n-1/2]))
+        diff = current_symbol - prev_symbol
+        error = diff.real * mid_sample.real + diff.imag * mid_sample.imag
+        
+        # Loop filter, step clamped to [0.5, 1.5] * sps
+        timing_adj += beta * error
+        timing_step = sps + alpha * error + timing_adj
+        timing_step = max(sps * 0.5, min(sps * 1.5, timing_step))
+        
+        symbols[count] = current_symbol
+        errors[count] = error
+        count += 1
+        
+        prev_symbol = current_symbol
+        sample_idx += timing_step
+    
+    return symbols, errors, count, timing_adj
+
+
+@njit(cache=True)
+def _mueller_muller_run(samples, constellation, sps, alpha, beta, timing_adj):
+    """
+    Mueller-Muller TED loop (JIT-compiled when numba is available)
+    
+    The nearest-point decision feeds the next error term, so it stays in the
+    loop as a squared-distance scan over the constellation (no abs/sqrt).
+    
+    Returns:
+        Tuple of (symbols, errors, count, timing_adj); only the first
+        count entries of the preallocated outputs are valid
+    """
+    n = samples.shape[0]
+    max_symbols = int(n / (0.5 * sps)) + 1
+    symbols = np.empty(max_symbols, dtype=np.complex64)
+    errors = np.empty(max_symbols, dtype=np.float32)
+    
+    sample_idx = sps / 2
+    prev_symbol = 0j
+    prev_decision = constellation[0]
+    count = 0
+    
+    while sample_idx < n - sps - 2:
+        idx = int(sample_idx)
+        current_symbol = _interp_cubic(samples, sample_idx - idx, idx)
+        
+        # Hard decision: nearest constellation point by squared distance
+        best = 0
+        best_d2 = np.inf
+        for k in range(constellation.shape[0]):
+            dr = current_symbol.real - constellation[k].real
+            di = current_symbol.imag - constellation[k].imag
+            d2 = dr * dr + di * di
+            if d2 < best_d2:
+                best_d2 = d2
+                best = k
+        current_decision = constellation[best]
+        
+        # e = real(d[n-1] * conj(y[n]) - d[n] * conj(y[n-1]))
+        error = (prev_decision.real * current_symbol.real + prev_decision.imag * current_symbol.imag
+                 - current_decision.real * prev_symbol.real - current_decision.imag * prev_symbol.imag)
+        
+        timing_adj += beta * error
+        timing_step = sps + alpha * error + timing_adj
+        timing_step = max(sps * 0.5, min(sps * 1.5, timing_step))
+        
+        symbols[count] = current_symbol
+        errors[count] = error
+        count += 1
+        
+        prev_symbol = current_symbol
+        prev_decision = current_decision
+        sample_idx += timing_step
+    
+    return symbols, errors, count, timing_adj
+
+
 class TimingRecovery:
     """
     Symbol Timing Recovery
@@ -669,22 +1147,7 @@ class TimingRecovery:
         Returns:
             Interpolated sample
         """
-        if idx < 1 or idx >= len(samples) - 2:
-            return samples[max(0, min(idx, len(samples)-1))]
-        
-        # Cubic interpolation coefficients
-        x0 = samples[idx - 1]
-        x1 = samples[idx]
-        x2 = samples[idx + 1]
-        x3 = samples[idx + 2]
-        
-        # Farrow structure
-        a0 = x1
-        a1 = (x2 - x0) / 2
-        a2 = x0 - 5*x1/2 + 2*x2 - x3/2
-        a3 = (x3 - x0) / 6 + (x1 - x2) / 2
-        
-        return a0 + mu * (a1 + mu * (a2 + mu * a3))
+        return _interp_cubic(samples, mu, idx)
     
     def gardner_ted(self, samples: np.ndarray) -> TimingRecoveryResult:
         """
@@ -699,48 +1162,14 @@ class TimingRecovery:
         Returns:
             TimingRecoveryResult with recovered symbols
         """
-        n = len(samples)
-        symbols = []
-        timing_errors = []
-        
-        # Sample index (float for interpolation)
-        sample_idx = self.sps / 2  # Start at first symbol center
-        
-        prev_symbol = 0 + 0j
-        
-        while sample_idx < n - self.sps - 2:
-            # Integer and fractional parts
-            idx = int(sample_idx)
-            mu = sample_idx - idx
-            
-            # Interpolate current symbol
-            current_symbol = self._interpolate(samples, mu, idx)
-            
-            # Interpolate midpoint (half symbol back)
-            mid_idx = int(sample_idx - self.sps/2)
-            mid_mu = (sample_idx - self.sps/2) - mid_idx
-            mid_sample = self._interpolate(samples, mid_mu, mid_idx)
-            
-            # Gardner TED (for complex signals)
-            # e = real((y[n] - y[n-1]) * conj(y[n-1/2]))
-            error = np.real((current_symbol - prev_symbol) * np.conj(mid_sample))
-            
-            # Loop filter
-            self.timing_adj += self.beta * error
-            timing_step = self.sps + self.alpha * error + self.timing_adj
-            
-            # Clamp timing step
-            timing_step = max(self.sps * 0.5, min(self.sps * 1.5, timing_step))
-            
-            symbols.append(current_symbol)
-            timing_errors.append(error)
-            
-            prev_symbol = current_symbol
-            sample_idx += timing_step
+        samples = np.ascontiguousarray(samples, dtype=np.complex64)
+        symbols, errors, count, self.timing_adj = _gardner_run(
+            samples, float(self.sps), self.alpha, self.beta, self.timing_adj
+        )
         
         return TimingRecoveryResult(
-            symbols=np.array(symbols, dtype=np.complex64),
-            timing_error=np.array(timing_errors),
+            symbols=symbols[:count],
+            timing_error=errors[:count],
             samples_per_symbol=self.sps,
             method="gardner"
         )
@@ -764,46 +1193,15 @@ class TimingRecovery:
             # Default QPSK constellation
             constellation = np.array([1+1j, 1-1j, -1+1j, -1-1j]) / np.sqrt(2)
         
-        n = len(samples)
-        symbols = []
-        timing_errors = []
-        
-        sample_idx = self.sps / 2
-        prev_symbol = 0 + 0j
-        prev_decision = constellation[0]
-        
-        while sample_idx < n - self.sps - 2:
-            idx = int(sample_idx)
-            mu = sample_idx - idx
-            
-            # Interpolate
-            current_symbol = self._interpolate(samples, mu, idx)
-            
-            # Hard decision (find nearest constellation point)
-            distances = np.abs(current_symbol - constellation)
-            current_decision = constellation[np.argmin(distances)]
-            
-            # Mueller-Muller TED
-            error = np.real(
-                prev_decision * np.conj(current_symbol) -
-                current_decision * np.conj(prev_symbol)
-            )
-            
-            # Loop filter
-            self.timing_adj += self.beta * error
-            timing_step = self.sps + self.alpha * error + self.timing_adj
-            timing_step = max(self.sps * 0.5, min(self.sps * 1.5, timing_step))
-            
-            symbols.append(current_symbol)
-            timing_errors.append(error)
-            
-            prev_symbol = current_symbol
-            prev_decision = current_decision
-            sample_idx += timing_step
+        samples = np.ascontiguousarray(samples, dtype=np.complex64)
+        constellation = np.ascontiguousarray(constellation, dtype=np.complex64)
+        symbols, timing_errors, count, self.timing_adj = _mueller_muller_run(
+            samples, constellation, float(self.sps), self.alpha, self.beta, self.timing_adj
+        )
         
         return TimingRecoveryResult(
-            symbols=np.array(symbols, dtype=np.complex64),
-            timing_error=np.array(timing_errors),
+            symbols=symbols[:count],
+            timing_error=timing_errors[:count],
             samples_per_symbol=self.sps,
             method="mueller_muller"
         )
@@ -845,12 +1243,21 @@ class DemodulationPipeline:
         # Initialize components
         self.cfo_estimator = CFOEstimator(sample_rate)
         self.matched_filter = MatchedFilter(int(round(self.sps)))
-        self.costas = CostasLoop(mode="qpsk" if "qpsk" in modulation else "bpsk")
+        self.costas = CostasLoop(
+            mode="qpsk" if "qpsk" in modulation else "8psk" if "8psk" in modulation else "bpsk"
+        )
         self.timing_recovery = TimingRecovery(self.sps)
         self.snr_estimator = M2M4Estimator()
         
-        # Constellation
+        # Constellation, with float32 rails for squared-distance decisions
         self.constellation = self._get_constellation(modulation)
+        self._c_re = self.constellation.real.astype(np.float32)
+        self._c_im = self.constellation.imag.astype(np.float32)
+        self._c_rms = float(np.sqrt(np.mean(self._c_re**2 + self._c_im**2)))
+        
+        # Internal complex64 scratch (never handed back to the caller),
+        # regrown only when a longer block arrives
+        self._bufs: Dict[str, Any] = {}
     
     def _get_constellation(self, modulation: str) -> np.ndarray:
         """Get constellation points for modulation type"""
@@ -864,7 +1271,12 @@ class DemodulationPipeline:
                 for q in [-3, -1, 1, 3]
             ]) / np.sqrt(10),
         }
-        return constellations.get(modulation, constellations["qpsk"])
+        if modulation not in constellations:
+            modulation = "qpsk"
+        
+        # BPSK/QPSK decisions reduce to sign bits of the real/imag rails
+        self.decoder_kind = {"bpsk": "bpsk", "qpsk": "qpsk_sign"}.get(modulation, "generic")
+        return constellations[modulation]
     
     def _to_gpu(self, arr: np.ndarray) -> Any:
         if GPU_AVAILABLE:
@@ -876,6 +1288,14 @@ class DemodulationPipeline:
             return cp.asnumpy(arr)
         return arr
     
+    def _scratch(self, name: str, n: int) -> Any:
+        """Length-n view of a cached complex64 buffer on the active device"""
+        buf = self._bufs.get(name)
+        if buf is None or len(buf) < n:
+            buf = xp.empty(n, dtype=xp.complex64)
+            self._bufs[name] = buf
+        return buf[:n]
+    
     def demodulate(self, iq_samples: np.ndarray) -> Dict[str, Any]:
         """
         Complete demodulation pipeline
@@ -888,8 +1308,18 @@ class DemodulationPipeline:
         """
         results = {}
         
+        # Upload once: CFO estimation/correction, matched filtering and SNR
+        # estimation all run on the device-resident copy
+        iq_host = np.ascontiguousarray(iq_samples, dtype=np.complex64)
+        n = len(iq_host)
+        if GPU_AVAILABLE:
+            iq = self._scratch("iq", n)
+            iq.set(iq_host)
+        else:
+            iq = iq_host
+        
         # 1. Coarse CFO estimation
-        cfo_estimate = self.cfo_estimator.estimate(iq_samples, method="fitz")
+        cfo_estimate = self.cfo_estimator.estimate(iq, method="fitz")
         results['cfo'] = {
             'hz': cfo_estimate.cfo_hz,
             'normalized': cfo_estimate.cfo_normalized,
@@ -897,9 +1327,11 @@ class DemodulationPipeline:
         }
         
         # 2. Coarse CFO correction
-        n = len(iq_samples)
-        t = np.arange(n) / self.sample_rate
-        corrected = iq_samples * np.exp(-1j * 2 * np.pi * cfo_estimate.cfo_hz * t)
+        corrected = self._scratch("corrected", n)
+        if GPU_AVAILABLE:
+            _mix_down_kernel(iq, cfo_estimate.cfo_normalized, corrected)
+        else:
+            _mix_down(iq, cfo_estimate.cfo_normalized, corrected)
         
         # 3. Matched filtering
         filtered = self.matched_filter.apply(
@@ -916,9 +1348,13 @@ class DemodulationPipeline:
             'noise_power': snr_estimate.noise_power
         }
         
+        # Timing recovery is a per-sample recursion and runs on the host; the
+        # Costas loop uploads its post-acquisition tail itself (process_gpu)
+        filtered = self._to_cpu(filtered)
+        
         # 5. Fine CFO tracking (Costas loop)
         self.costas.reset()
-        carrier_corrected, phase_traj, freq_traj = self.costas.process(filtered)
+        carrier_corrected, phase_traj, freq_traj = self.costas.process_gpu(filtered)
         results['costas'] = {
             'final_phase': float(phase_traj[-1]) if len(phase_traj) > 0 else 0,
             'final_freq': float(freq_traj[-1]) if len(freq_traj) > 0 else 0
@@ -932,20 +1368,23 @@ class DemodulationPipeline:
             'mean_timing_error': float(np.mean(np.abs(timing_result.timing_error)))
         }
         
-        # 7. Symbol decisions
+        # 7. Symbol decisions, all symbols at once
         symbols = timing_result.symbols
-        decisions = np.zeros(len(symbols), dtype=np.complex64)
-        decision_indices = np.zeros(len(symbols), dtype=np.int32)
-        
-        for i, sym in enumerate(symbols):
-            distances = np.abs(sym - self.constellation)
-            idx = np.argmin(distances)
-            decisions[i] = self.constellation[idx]
-            decision_indices[i] = idx
+        if self.decoder_kind == "qpsk_sign":
+            # Index bits are the signs: (re < 0) << 1 | (im < 0)
+            decision_indices = ((symbols.real < 0).astype(np.int32) << 1) | (symbols.imag < 0)
+        elif self.decoder_kind == "bpsk":
+            decision_indices = (symbols.real < 0).astype(np.int32)
+        else:
+            # Nearest point by squared distance
+            d2 = (symbols.real[:, None] - self._c_re)**2 + (symbols.imag[:, None] - self._c_im)**2
+            decision_indices = np.argmin(d2, axis=1).astype(np.int32)
+        decisions = self.constellation[decision_indices].astype(np.complex64)
         
         # 8. Compute EVM
-        evm = np.sqrt(np.mean(np.abs(symbols - decisions)**2))
-        evm_percent = evm / np.sqrt(np.mean(np.abs(self.constellation)**2)) * 100
+        error = symbols - decisions
+        evm = np.sqrt(np.mean(error.real**2 + error.imag**2))
+        evm_percent = evm / self._c_rms * 100
         results['evm'] = {
             'rms': float(evm),
             'percent': float(evm_percent)
@@ -1044,4 +1483,26 @@ if __name__ == '__main__':
     print(f"  EVM: {result['evm']['percent']:.1f}%")
     print(f"  SNR: {result['snr']['db']:.1f} dB")
     
+    # Costas GPU block tracking vs the per-sample loop, at the pipeline's
+    # default loop settings (long enough to get past acquisition)
+    print(f"\nCostas Loop (CPU vs GPU):")
+    costas_freq = 2 * np.pi * cfo / fs
+    n_costas = 200000
+    for mode in ("qpsk", "bpsk"):
+        if mode == "qpsk":
+            costas_symbols = constellation[np.random.randint(0, 4, n_costas)]
+        else:
+            costas_symbols = np.random.choice([-1.0, 1.0], n_costas).astype(np.complex128)
+        costas_samples = costas_symbols * np.exp(1j * costas_freq * np.arange(n_costas))
+        costas_samples += 0.1 * (np.random.randn(n_costas) + 1j * np.random.randn(n_costas))
+        costas_samples = costas_samples.astype(np.complex64)
+    
+        _, _, cpu_freq = CostasLoop(mode=mode).process(costas_samples)
+        _, _, gpu_freq = CostasLoop(mode=mode).process_gpu(costas_samples)
+        cpu_mean = float(np.mean(cpu_freq[-n_costas // 2:]))
+        gpu_mean = float(np.mean(gpu_freq[-n_costas // 2:]))
+        print(f"  {mode.upper()}: CPU {cpu_mean:.6f}, GPU {gpu_mean:.6f}, "
+              f"true {costas_freq:.6f} rad/sample")
+        assert abs(gpu_mean - cpu_mean) < 1e-5, f"{mode} GPU/CPU frequency mismatch"
+    
     print("\nAll tests passed!")
\ No newline at end of file
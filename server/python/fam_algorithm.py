@@ -13,6 +13,7 @@ import pyarrow as pa
 # Try to import CuPy for GPU acceleration
 try:
     import cupy as cp
+    import cupyx.scipy.fftpack as cpx_fftpack
     GPU_AVAILABLE = True
     xp = cp
 except ImportError:
@@ -20,6 +21,20 @@ except ImportError:
     xp = np
     print("Warning: CuPy not available, using NumPy (CPU-only)", file=sys.stderr)
 
+# SCF magnitude in two sweeps: per-row peak of |z|^2, then sqrt scaled by 1/peak
+if GPU_AVAILABLE:
+    _row_peak2_kernel = cp.ReductionKernel(
+        'complex64 z', 'float32 peak2',
+        'z.real() * z.real() + z.imag() * z.imag()',
+        'max(a, b)', 'peak2 = a', '0',
+        'scf_row_peak2'
+    )
+    _scaled_mag_kernel = cp.ElementwiseKernel(
+        'complex64 z, float32 inv_peak', 'float32 m',
+        'm = sqrt(z.real() * z.real() + z.imag() * z.imag()) * inv_peak',
+        'scf_scaled_mag'
+    )
+
 
 class FAMAnalyzer:
     """Fast Averaging Method for Cyclostationary Analysis"""
@@ -28,6 +43,38 @@ class FAMAnalyzer:
         self.sample_rate = sample_rate
         self.use_gpu = use_gpu and GPU_AVAILABLE
         self.xp = cp if self.use_gpu else np
+        # cuFFT plans keyed by (shape, dtype, axis), reused across calls
+        self._fft_plans = {}
+        # Host frequency axes keyed by length (sample rate is fixed per analyzer)
+        self._freq_cache = {}
+    
+    def _fftfreq(self, n: int) -> np.ndarray:
+        """Cached, read-only NumPy fftfreq axis for n bins"""
+        freqs = self._freq_cache.get(n)
+        if freqs is None:
+            freqs = np.fft.fftfreq(n, 1/self.sample_rate)
+            freqs.flags.writeable = False
+            self._freq_cache[n] = freqs
+        return freqs
+    
+    def _fft(self, arr, axis: int):
+        """FFT along one axis, with a cached cuFFT plan on GPU"""
+        if not self.use_gpu:
+            return np.fft.fft(arr, axis=axis)
+        
+        key = (arr.shape, arr.dtype.str, axis)
+        if key not in self._fft_plans:
+            try:
+                self._fft_plans[key] = cpx_fftpack.get_fft_plan(arr, axes=(axis,), value_type='C2C')
+            except ValueError:
+                # Layout cuFFT cannot plan directly; cupy's own plan cache handles it
+                self._fft_plans[key] = None
+        
+        plan = self._fft_plans[key]
+        if plan is None:
+            return cp.fft.fft(arr, axis=axis)
+        with plan:
+            return cp.fft.fft(arr, axis=axis)
     
     def channelize(self, iq_samples: np.ndarray, nfft: int = 256, overlap: float = 0.5) -> np.ndarray:
         """
@@ -42,12 +89,11 @@ class FAMAnalyzer:
         Returns:
             Channelized signal (2D: time x frequency)
         """
-        # Convert to GPU if available
-        if self.use_gpu:
-            iq_samples = cp.asarray(iq_samples)
+        # complex64 end to end (on GPU too): complex128 halves vector width
+        iq_samples = self.xp.asarray(iq_samples, dtype=self.xp.complex64)
         
         # Hamming window to reduce spectral leakage
-        window = self.xp.hamming(nfft)
+        window = self.xp.hamming(nfft).astype(self.xp.float32)
         
         # Calculate hop size
         hop = int(nfft * (1 - overlap))
@@ -55,16 +101,15 @@ class FAMAnalyzer:
         # Number of blocks
         num_blocks = (len(iq_samples) - nfft) // hop + 1
         
-        # Channelization matrix
-        channels = self.xp.zeros((num_blocks, nfft), dtype=complex)
-        
-        for i in range(num_blocks):
-            start = i * hop
-            end = start + nfft
-            block = iq_samples[start:end] * window
-            channels[i, :] = self.xp.fft.fft(block)
+        # Overlapping blocks as a (num_blocks, nfft) strided view, no copy;
+        # windowing materializes them and one batched FFT does every row
+        iq_samples = self.xp.ascontiguousarray(iq_samples)
+        itemsize = iq_samples.itemsize
+        blocks = self.xp.lib.stride_tricks.as_strided(
+            iq_samples, shape=(num_blocks, nfft), strides=(hop * itemsize, itemsize)
+        )
         
-        return channels
+        return self._fft(blocks * window[None, :], axis=1)
     
     def compute_fam(self, iq_samples: np.ndarray, alpha_max: float = 0.5, 
                     nfft: int = 256, overlap: float = 0.5) -> tuple:
@@ -93,34 +138,49 @@ class FAMAnalyzer:
         
         # Step 3: Cyclic FFT along time axis
         # This transforms time variations into cyclic frequencies
-        scf_raw = self.xp.fft.fft(channels, axis=0)
+        scf_raw = self._fft(channels, axis=0)
         
-        # Step 4: Magnitude calculation
-        scf_magnitude = self.xp.abs(scf_raw)
-        
-        # Normalize
-        scf_magnitude = scf_magnitude / self.xp.max(scf_magnitude)
-        
-        # Step 5: Compute Cyclic Profile (max-hold along spectral frequency axis)
-        cyclic_profile = self.xp.max(scf_magnitude, axis=1)
+        # Steps 4-5: Normalized magnitude and cyclic profile (max-hold along
+        # the spectral frequency axis); the row peaks give the global peak too
+        if self.use_gpu:
+            row_peak = cp.sqrt(_row_peak2_kernel(scf_raw, axis=1))
+            inv_peak = (1.0 / cp.max(row_peak)).astype(cp.float32)
+            scf_magnitude = _scaled_mag_kernel(scf_raw, inv_peak)
+            cyclic_profile = row_peak * inv_peak
+        else:
+            scf_magnitude = np.abs(scf_raw)
+            row_peak = np.max(scf_magnitude, axis=1)
+            peak = np.max(row_peak)
+            scf_magnitude /= peak
+            cyclic_profile = row_peak / peak
         
         # Generate frequency axes
-        spectral_freqs = self.xp.fft.fftfreq(num_freqs, 1/self.sample_rate)
-        cyclic_freqs = self.xp.fft.fftfreq(num_blocks, 1/self.sample_rate)
+        spectral_freqs = self._fftfreq(num_freqs)
+        cyclic_freqs = self._fftfreq(num_blocks)
         
-        # Limit cyclic frequency range
+        # Limit cyclic frequency range. In FFT order the valid bins are a
+        # prefix of the non-negative half plus a suffix of the negative half,
+        # so rows are taken as two slices instead of a boolean gather
         alpha_max_hz = alpha_max * self.sample_rate
-        valid_cyclic = self.xp.abs(cyclic_freqs) <= alpha_max_hz
+        valid_cyclic = np.abs(cyclic_freqs) <= alpha_max_hz
+        num_nonneg = (num_blocks + 1) // 2
+        num_pos = int(np.count_nonzero(valid_cyclic[:num_nonneg]))
+        num_neg = int(np.count_nonzero(valid_cyclic[num_nonneg:]))
         
-        scf_magnitude = scf_magnitude[valid_cyclic, :]
-        cyclic_freqs = cyclic_freqs[valid_cyclic]
-        cyclic_profile = cyclic_profile[valid_cyclic]
+        if num_pos + num_neg < num_blocks:
+            neg_start = num_blocks - num_neg
+            scf_magnitude = self.xp.concatenate([scf_magnitude[:num_pos], scf_magnitude[neg_start:]])
+            cyclic_profile = self.xp.concatenate([cyclic_profile[:num_pos], cyclic_profile[neg_start:]])
+            cyclic_freqs = np.concatenate([cyclic_freqs[:num_pos], cyclic_freqs[neg_start:]])
         
         # Convert back to NumPy if using GPU
         if self.use_gpu:
-            scf_magnitude = cp.asnumpy(scf_magnitude)
-            spectral_freqs = cp.asnumpy(spectral_freqs)
-            cyclic_freqs = cp.asnumpy(cyclic_freqs)
+            # SCF plane lands in page-locked memory in one DMA, already in the
+            # C-contiguous float32 layout serialize_to_arrow hands to Arrow
+            scf_device = cp.ascontiguousarray(scf_magnitude)
+            pinned = cp.cuda.alloc_pinned_memory(scf_device.nbytes)
+            scf_magnitude = np.frombuffer(pinned, np.float32, scf_device.size).reshape(scf_device.shape)
+            scf_device.get(out=scf_magnitude)
             cyclic_profile = cp.asnumpy(cyclic_profile)
         
         print(f"[FAM] SCF shape: {scf_magnitude.shape}", file=sys.stderr)
@@ -136,8 +196,9 @@ def serialize_to_arrow(scf_magnitude, spectral_freqs, cyclic_freqs, cyclic_profi
     Returns:
         bytes: Arrow IPC stream
     """
-    # Flatten SCF magnitude for Arrow (2D -> 1D with metadata)
-    scf_flat = scf_magnitude.flatten().astype(np.float32)
+    # Flatten SCF magnitude for Arrow (2D -> 1D with metadata); a view, not a
+    # copy, when compute_fam already produced contiguous float32
+    scf_flat = np.ascontiguousarray(scf_magnitude, dtype=np.float32).reshape(-1)
     
     # Create Arrow table
     table = pa.table({
@@ -166,9 +227,10 @@ def main():
     # Read input from stdin
     input_data = json.load(sys.stdin)
     
-    iq_real = np.array(input_data['iq_real'], dtype=np.float32)
-    iq_imag = np.array(input_data['iq_imag'], dtype=np.float32)
-    iq_samples = iq_real + 1j * iq_imag
+    # Fill complex64 directly, no float32 temporaries or 1j multiply
+    iq_samples = np.empty(len(input_data['iq_real']), dtype=np.complex64)
+    iq_samples.real = input_data['iq_real']
+    iq_samples.imag = input_data['iq_imag']
     
     sample_rate = input_data['sample_rate']
     params = input_data.get('params', {})
@@ -11,6 +11,8 @@ Production-ready CUDA-accelerated signal processing with:
 
 import sys
 import threading
+import time
+from collections import OrderedDict
 from typing import Dict, Any, Optional, Tuple, List
 from dataclasses import dataclass
 from contextlib import contextmanager
@@ -21,6 +23,9 @@ try:
     import cupy as cp
     from cupy.cuda import stream as cuda_stream
     from cupyx.scipy import signal as cp_signal
+    import cupyx
+    import cupyx.scipy.fftpack as cpx_fftpack
+    from cupy.cuda import cufft
     GPU_AVAILABLE = True
 except ImportError:
     GPU_AVAILABLE = False
@@ -32,7 +37,254 @@ if GPU_AVAILABLE:
     xp = cp
 else:
     import scipy.signal as sp_signal
+    import scipy.fft as sp_fft
     xp = np
+    
+    # Prefer a faster FFT library behind scipy.fft when one is installed
+    try:
+        import pyfftw
+        import pyfftw.interfaces.scipy_fft
+        pyfftw.interfaces.cache.enable()
+        sp_fft.set_global_backend(pyfftw.interfaces.scipy_fft)
+        print("[GPU Processor] CPU FFT backend: pyFFTW", file=sys.stderr)
+    except ImportError:
+        try:
+            import mkl_fft._scipy_fft_backend as mkl_fft_backend
+            sp_fft.set_global_backend(mkl_fft_backend)
+            print("[GPU Processor] CPU FFT backend: MKL", file=sys.stderr)
+        except ImportError:
+            pass
+
+# Numba is optional - JIT-compiled, multi-threaded CPU fallback kernels
+try:
+    import numba
+    from numba import njit, prange
+    # Kernels are called from service worker threads: prefer OpenMP, since
+    # TBB's pool can hang interpreter exit when first launched off-main-thread
+    numba.config.THREADING_LAYER_PRIORITY = ['omp', 'tbb', 'workqueue']
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Welch PSD: mean |X|^2 over segments (axis 0), scaled and converted to dB
+if GPU_AVAILABLE:
+    _psd_db_kernel = cp.ReductionKernel(
+        'complex64 z, float32 scale', 'float32 psd_db',
+        'z.real() * z.real() + z.imag() * z.imag()',
+        'a + b',
+        'psd_db = 10.0f * log10f(a * scale + 1e-12f)',
+        '0',
+        'psd_db'
+    )
+    
+    # WVD/CWD: x(t + tau/2) * conj(x(t - tau/2)) times a per-lag weight
+    _lag_product_kernel = cp.ElementwiseKernel(
+        'complex64 a, complex64 b, complex64 w', 'complex64 y',
+        'y = a * conj(b) * w',
+        'wvd_lag_product'
+    )
+    
+    # FAM: per-row peak |z|^2, then |z| scaled by the global peak, so the SCF
+    # magnitude and cyclic profile take two passes over the raw SCF
+    _scf_row_peak2_kernel = cp.ReductionKernel(
+        'complex64 z', 'float32 peak2',
+        'z.real() * z.real() + z.imag() * z.imag()',
+        'max(a, b)', 'peak2 = a', '0',
+        'scf_row_peak2'
+    )
+    _scf_scaled_mag_kernel = cp.ElementwiseKernel(
+        'complex64 z, float32 inv_peak', 'float32 m',
+        'm = sqrt(z.real() * z.real() + z.imag() * z.imag()) * inv_peak',
+        'scf_scaled_mag'
+    )
+
+# RF-DNA: one block per (region, domain) computes variance, skewness and
+# excess kurtosis of its region; out is (domain, region, stat)
+REGION_STATS_THREADS = 256
+
+if GPU_AVAILABLE:
+    _region_stats_kernel = cp.RawKernel(r'''
+    __device__ float block_sum(float v, float* sh)
+    {
+        sh[threadIdx.x] = v;
+        __syncthreads();
+        for (int s = blockDim.x / 2; s > 0; s >>= 1) {
+            if (threadIdx.x < s)
+                sh[threadIdx.x] += sh[threadIdx.x + s];
+            __syncthreads();
+        }
+        float total = sh[0];
+        __syncthreads();
+        return total;
+    }
+    
+    extern "C" __global__
+    void region_stats(const float* amplitude, const float* phase, const float* frequency,
+                      int region_size, float* out)
+    {
+        __shared__ float sh[256];
+        const float* x = blockIdx.y == 0 ? amplitude : (blockIdx.y == 1 ? phase : frequency);
+        x += (long long)blockIdx.x * region_size;
+        
+        float sum = 0.0f;
+        for (int i = threadIdx.x; i < region_size; i += blockDim.x)
+            sum += x[i];
+        const float mean = block_sum(sum, sh) / region_size;
+        
+        // Second pass over the (cache-resident) region for centered moments
+        float m2 = 0.0f, m3 = 0.0f, m4 = 0.0f;
+        for (int i = threadIdx.x; i < region_size; i += blockDim.x) {
+            const float c = x[i] - mean;
+            const float c2 = c * c;
+            m2 += c2;
+            m3 += c2 * c;
+            m4 += c2 * c2;
+        }
+        m2 = block_sum(m2, sh) / region_size;
+        m3 = block_sum(m3, sh) / region_size;
+        m4 = block_sum(m4, sh) / region_size;
+        
+        if (threadIdx.x == 0) {
+            const float var = m2 + 1e-10f;
+            float* o = out + 3 * ((long long)blockIdx.y * gridDim.x + blockIdx.x);
+            o[0] = m2;
+            o[1] = m3 / (var * sqrtf(var));
+            o[2] = m4 / (var * var) - 3.0f;
+        }
+    }
+    ''', 'region_stats')
+
+# Cumulants: sums of |z - mean|^2, ^4 and ^6 in one pass, accumulated in
+# double (cum6 cancels heavily) and combined across blocks with atomicAdd
+MOMENTS_THREADS = 256
+MOMENTS_MAX_BLOCKS = 1024
+
+if GPU_AVAILABLE:
+    _moments246_kernel = cp.RawKernel(r'''
+    #include <cupy/complex.cuh>
+    
+    extern "C" __global__
+    void moments246(const complex<float>* z, long long n, const complex<float>* mean,
+                    double* sums)
+    {
+        __shared__ double sh[3][256];
+        const complex<float> mu = mean[0];
+        
+        double s2 = 0.0, s4 = 0.0, s6 = 0.0;
+        for (long long i = (long long)blockIdx.x * blockDim.x + threadIdx.x; i < n;
+             i += (long long)gridDim.x * blockDim.x) {
+            const complex<float> c = z[i] - mu;
+            const double p2 = (double)c.real() * c.real() + (double)c.imag() * c.imag();
+            const double p4 = p2 * p2;
+            s2 += p2;
+            s4 += p4;
+            s6 += p4 * p2;
+        }
+        sh[0][threadIdx.x] = s2;
+        sh[1][threadIdx.x] = s4;
+        sh[2][threadIdx.x] = s6;
+        __syncthreads();
+        
+        for (int s = blockDim.x / 2; s > 0; s >>= 1) {
+            if (threadIdx.x < s) {
+                sh[0][threadIdx.x] += sh[0][threadIdx.x + s];
+                sh[1][threadIdx.x] += sh[1][threadIdx.x + s];
+                sh[2][threadIdx.x] += sh[2][threadIdx.x + s];
+            }
+            __syncthreads();
+        }
+        
+        if (threadIdx.x == 0) {
+            atomicAdd(&sums[0], sh[0][0]);
+            atomicAdd(&sums[1], sh[1][0]);
+            atomicAdd(&sums[2], sh[2][0]);
+        }
+    }
+    ''', 'moments246')
+
+# CPU Welch: frequency bins accumulated per thread in cache-sized blocks
+WELCH_BIN_BLOCK = 256
+
+
+@njit(parallel=True, cache=True)
+def _welch_power_db(spectra, scale, out):
+    """
+    Mean |X|^2 over segments (rows) of spectra per frequency bin, scaled
+    and converted to dB into out
+    """
+    num_segments, nbins = spectra.shape
+    num_blocks = (nbins + WELCH_BIN_BLOCK - 1) // WELCH_BIN_BLOCK
+    for b in prange(num_blocks):
+        lo = b * WELCH_BIN_BLOCK
+        hi = min(lo + WELCH_BIN_BLOCK, nbins)
+        acc = np.zeros(hi - lo)
+        for s in range(num_segments):
+            for k in range(lo, hi):
+                z = spectra[s, k]
+                acc[k - lo] += z.real * z.real + z.imag * z.imag
+        for k in range(lo, hi):
+            out[k] = 10.0 * np.log10(acc[k - lo] * scale + 1e-12)
+
+
+@njit(parallel=True, cache=True, error_model='numpy')
+def _region_stats_cpu(x, regions, region_size, out):
+    """
+    Variance, skewness and excess kurtosis of each region of x into
+    out[region] (CPU counterpart of the region_stats kernel)
+    """
+    for r in prange(regions):
+        start = r * region_size
+        mean = 0.0
+        for i in range(start, start + region_size):
+            mean += x[i]
+        mean /= region_size
+        
+        m2 = 0.0
+        m3 = 0.0
+        m4 = 0.0
+        for i in range(start, start + region_size):
+            c = x[i] - mean
+            c2 = c * c
+            m2 += c2
+            m3 += c2 * c
+            m4 += c2 * c2
+        m2 /= region_size
+        m3 /= region_size
+        m4 /= region_size
+        
+        var = m2 + 1e-10
+        out[r, 0] = m2
+        out[r, 1] = m3 / (var * np.sqrt(var))
+        out[r, 2] = m4 / (var * var) - 3.0
+
+
+# cuFFT plans kept per (shape, dtype, axis, stream); oldest evicted first
+FFT_PLAN_CACHE_SIZE = 32
+
+# Persistent scratch arrays kept per (name, shape, dtype, stream); LRU evicted
+SCRATCH_CACHE_SIZE = 8
+
+# Choi-Williams kernel matrices kept per (sigma, T, nfft, time_step); LRU evicted
+CWD_KERNEL_CACHE_SIZE = 4
+
+# Smallest row bucket of a coalesced Welch batch (buckets are powers of two)
+PSD_BATCH_MIN_ROWS = 64
+
+# Default pool watermark as a fraction of device memory
+POOL_HIGH_WATERMARK_FRACTION = 0.7
+
+
+def _mapped_pinned_malloc(size: int) -> Any:
+    """Page-locked host allocation the device can address directly"""
+    flags = cp.cuda.runtime.hostAllocPortable | cp.cuda.runtime.hostAllocMapped
+    return cp.cuda.PinnedMemoryPointer(cp.cuda.PinnedMemory(size, flags), 0)
 
 
 @dataclass
@@ -43,26 +295,42 @@ class GPUConfig:
     enable_memory_pool: bool = True
     pinned_memory_limit_mb: int = 512
     unified_memory: bool = False
+    pool_high_watermark_bytes: Optional[int] = None  # None: 70% of device memory
+    typical_batch: int = 256        # Welch segments per call to pre-plan (0: off)
+    typical_fft_size: int = 1024
+    psd_batch_wait_ms: float = 0.0  # >0: coalesce concurrent Welch FFTs (0: off)
+    psd_max_batch: int = 2048       # segments that trigger an immediate batch
 
 
 class CUDAStreamPool:
     """
     Manages a pool of CUDA streams for concurrent kernel execution.
-    Thread-safe round-robin allocation.
+    Thread-safe round-robin allocation, or a fixed stream per client key.
     """
     
     def __init__(self, num_streams: int = 4):
         self.num_streams = num_streams
         self._lock = threading.Lock()
         self._current_idx = 0
+        self._local = threading.local()
         
         if GPU_AVAILABLE:
             self.streams = [cp.cuda.Stream(non_blocking=True) for _ in range(num_streams)]
         else:
             self.streams = [None] * num_streams
     
-    def get_stream(self) -> Optional[Any]:
-        """Get next stream from pool (thread-safe)"""
+    def get_stream(self, key: Optional[Any] = None) -> Optional[Any]:
+        """
+        Get a stream from the pool (thread-safe)
+        
+        A key (client id, thread id, ...) always maps to the same stream, so
+        one client's calls stay ordered on one stream and reuse its cuFFT
+        plans and scratch buffers. Without a key streams go round-robin.
+        """
+        if not self.streams:
+            return None
+        if key is not None:
+            return self.streams[hash(key) % self.num_streams]
         with self._lock:
             stream = self.streams[self._current_idx]
             self._current_idx = (self._current_idx + 1) % self.num_streams
@@ -75,16 +343,136 @@ class CUDAStreamPool:
                 stream.synchronize()
     
     @contextmanager
-    def stream_context(self):
-        """Context manager for stream-scoped operations"""
-        stream = self.get_stream()
+    def stream_context(self, key: Optional[Any] = None):
+        """
+        Context manager for stream-scoped operations
+        
+        Reentrant: a nested context on the same thread (one public method
+        calling another) stays on the outer stream.
+        """
+        active = getattr(self._local, 'stream', None)
+        if active is not None:
+            yield active
+            return
+        
+        stream = self.get_stream(key)
         if GPU_AVAILABLE and stream is not None:
-            with stream:
-                yield stream
+            self._local.stream = stream
+            try:
+                with stream:
+                    yield stream
+            finally:
+                self._local.stream = None
         else:
             yield None
 
 
+class _PendingFFT:
+    """One caller's segments waiting in a PSDBatchScheduler queue"""
+    
+    def __init__(self, segments: Any, ready: Any):
+        self.segments = segments
+        self.ready = ready              # event: segments written / result ready
+        self.result: Optional[Any] = None
+        self.error: Optional[BaseException] = None
+        self.done = threading.Event()
+
+
+class PSDBatchScheduler:
+    """
+    Coalesces concurrent Welch FFTs of the same size into one batched FFT.
+    
+    Callers block in submit() while a background thread collects segments
+    for up to max_wait_ms (or until max_batch rows are queued), transforms
+    them with one cuFFT launch on its own stream, and hands each caller its
+    rows back. Cross-stream ordering uses CUDA events, never host syncs.
+    Batches are padded to a power-of-two row count (at least
+    PSD_BATCH_MIN_ROWS) so a handful of cached cuFFT plans serve every
+    batch size.
+    """
+    
+    def __init__(self, fft: Any, max_wait_ms: float, max_batch: int):
+        self._fft = fft
+        self._max_wait = max_wait_ms / 1000.0
+        self._max_batch = max_batch
+        self._cond = threading.Condition()
+        self._queues: Dict[int, List[_PendingFFT]] = {}
+        self._queued_rows = 0
+        self._stream = cp.cuda.Stream(non_blocking=True)
+        self._thread = threading.Thread(target=self._run, name="psd-batcher", daemon=True)
+        self._thread.start()
+    
+    def submit(self, segments: Any) -> Any:
+        """
+        FFT each row of segments (written on the current stream)
+        
+        Returns the spectra as rows of the shared batch output; the current
+        stream is made to wait until they are ready.
+        """
+        stream = cp.cuda.get_current_stream()
+        item = _PendingFFT(segments, stream.record())
+        with self._cond:
+            self._queues.setdefault(segments.shape[1], []).append(item)
+            self._queued_rows += segments.shape[0]
+            self._cond.notify()
+        
+        item.done.wait()
+        if item.error is not None:
+            raise item.error
+        stream.wait_event(item.ready)
+        return item.result
+    
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._queues:
+                    self._cond.wait()
+                # Give other clients a short window to join this batch
+                deadline = time.monotonic() + self._max_wait
+                while self._queued_rows < self._max_batch:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                queues, self._queues = self._queues, {}
+                self._queued_rows = 0
+            
+            for items in queues.values():
+                self._dispatch(items)
+    
+    def _dispatch(self, items: List[_PendingFFT]):
+        try:
+            with self._stream:
+                for item in items:
+                    self._stream.wait_event(item.ready)
+                # Pad rows to a plan bucket; padding rows are transformed too
+                # (rows are independent) and never handed out
+                rows = sum(item.segments.shape[0] for item in items)
+                bucket = max(PSD_BATCH_MIN_ROWS, 1 << (rows - 1).bit_length())
+                batch = cp.empty((bucket, items[0].segments.shape[1]), dtype=cp.complex64)
+                offset = 0
+                for item in items:
+                    n = item.segments.shape[0]
+                    batch[offset:offset + n] = item.segments
+                    offset += n
+                batch[rows:] = 0
+                spectra = self._fft(batch, axis=1, out=batch)
+                ready = self._stream.record()
+            
+            offset = 0
+            for item in items:
+                rows = item.segments.shape[0]
+                item.result = spectra[offset:offset + rows]
+                item.ready = ready
+                offset += rows
+        except Exception as e:
+            for item in items:
+                item.error = e
+        finally:
+            for item in items:
+                item.done.set()
+
+
 class GPUSignalProcessor:
     """
     High-performance GPU signal processing for RF forensics.
@@ -104,6 +492,13 @@ class GPUSignalProcessor:
             # Select GPU device
             cp.cuda.Device(self.config.device_id).use()
             
+            # Integrated GPUs (Jetson, iGPUs) share DRAM with the host:
+            # uploads become mapped host memory and H2D copies are skipped
+            props = cp.cuda.runtime.getDeviceProperties(self.config.device_id)
+            self._zero_copy = bool(props.get('integrated', 0))
+            if self._zero_copy:
+                self.config.unified_memory = True
+            
             # Configure memory pool
             if self.config.enable_memory_pool:
                 if self.config.unified_memory:
@@ -112,62 +507,436 @@ class GPUSignalProcessor:
                     pool = cp.cuda.MemoryPool()
                 cp.cuda.set_allocator(pool.malloc)
                 self._memory_pool = pool
-                
-                # Pinned memory pool for H2D transfers
+            else:
+                self._memory_pool = None
+            
+            # Pinned memory pool for H2D transfers (mapped on integrated GPUs)
+            if self._zero_copy:
+                pinned_pool = cp.cuda.PinnedMemoryPool(_mapped_pinned_malloc)
+            elif self.config.enable_memory_pool:
                 pinned_pool = cp.cuda.PinnedMemoryPool()
+            else:
+                pinned_pool = None
+            if pinned_pool is not None:
                 cp.cuda.set_pinned_memory_allocator(pinned_pool.malloc)
-                self._pinned_pool = pinned_pool
+            self._pinned_pool = pinned_pool
+            
+            # Mapped inputs handed to the device per stream; released once
+            # that stream has been synchronized
+            self._mapped_live: Dict[int, List[np.ndarray]] = {}
+            
+            # Release cached pool blocks once the pool holds more than this
+            self._pool_watermark = self.config.pool_high_watermark_bytes
+            if self._pool_watermark is None:
+                total_mem = cp.cuda.runtime.memGetInfo()[1]
+                self._pool_watermark = int(total_mem * POOL_HIGH_WATERMARK_FRACTION)
             
             # Initialize stream pool
             self.stream_pool = CUDAStreamPool(self.config.num_streams)
             
             # Pre-cache window functions
             self._cached_windows: Dict[Tuple[str, int], Any] = {}
+            self._fft_plans: Dict[Tuple[Tuple[int, ...], str, int, int], Any] = {}
+            
+            # Plan the typical Welch batch on every stream up front
+            if self.config.typical_batch > 0:
+                shape = (self.config.typical_batch, self.config.typical_fft_size)
+                for stream in self.stream_pool.streams:
+                    with stream:
+                        self._get_fft_plan(cp.empty(shape, dtype=cp.complex64), axis=1)
+            
+            # Cross-client Welch FFT coalescing (opt-in)
+            self._psd_batcher: Optional[PSDBatchScheduler] = None
+            if self.config.psd_batch_wait_ms > 0:
+                self._psd_batcher = PSDBatchScheduler(
+                    self._fft, self.config.psd_batch_wait_ms, self.config.psd_max_batch
+                )
+            
+            # Page-locked staging for uploads; the event marks when the last
+            # H2D copy out of it has finished so it can be refilled
+            self._staging: Optional[np.ndarray] = None
+            self._staging_event = None
+            self._scratch: OrderedDict = OrderedDict()
+            self._cwd_kernels: OrderedDict = OrderedDict()
             
             print(f"[GPU Processor] Initialized on GPU {self.config.device_id}", file=sys.stderr)
             print(f"[GPU Processor] {self.config.num_streams} CUDA streams", file=sys.stderr)
+            if self._zero_copy:
+                print("[GPU Processor] Integrated GPU - zero-copy host memory", file=sys.stderr)
         else:
             self.stream_pool = CUDAStreamPool(0)
+            self._zero_copy = False
+            self._mapped_live = {}
             self._memory_pool = None
             self._pinned_pool = None
             self._cached_windows = {}
+            self._fft_plans = {}
+            self._staging = None
+            self._staging_event = None
+            self._scratch = OrderedDict()
+            self._cwd_kernels = OrderedDict()
+            self._psd_batcher = None
             print("[GPU Processor] Running in CPU-only mode", file=sys.stderr)
     
     def _get_window(self, window_type: str, size: int) -> Any:
         """Get cached window function (GPU or CPU)"""
         key = (window_type, size)
-        if key not in self._cached_windows:
+        # Single lookup into a local: cleanup() may clear the cache concurrently
+        window = self._cached_windows.get(key)
+        if window is None:
             if window_type == 'hann':
-                self._cached_windows[key] = xp.hanning(size).astype(xp.float32)
+                window = xp.hanning(size).astype(xp.float32)
             elif window_type == 'hamming':
-                self._cached_windows[key] = xp.hamming(size).astype(xp.float32)
+                window = xp.hamming(size).astype(xp.float32)
             elif window_type == 'blackman':
-                self._cached_windows[key] = xp.blackman(size).astype(xp.float32)
+                window = xp.blackman(size).astype(xp.float32)
             elif window_type == 'kaiser':
                 if GPU_AVAILABLE:
                     # CuPy doesn't have kaiser, compute on CPU and transfer
-                    self._cached_windows[key] = cp.asarray(np.kaiser(size, 14.0).astype(np.float32))
+                    window = cp.asarray(np.kaiser(size, 14.0).astype(np.float32))
                 else:
-                    self._cached_windows[key] = np.kaiser(size, 14.0).astype(np.float32)
+                    window = np.kaiser(size, 14.0).astype(np.float32)
             else:
                 raise ValueError(f"Unknown window type: {window_type}")
-        return self._cached_windows[key]
+            self._cached_windows[key] = window
+        return window
+    
+    def _get_fft_plan(self, arr: Any, axis: int) -> Any:
+        """
+        Cached cuFFT plan for a C2C transform of arr along one axis
+        
+        Plans are keyed by shape, dtype, axis and the current stream, so a
+        plan (and its workspace) is never shared between streams. None
+        means cuFFT cannot plan the layout directly.
+        """
+        key = (arr.shape, arr.dtype.str, axis % arr.ndim, cp.cuda.get_current_stream().ptr)
+        with self._lock:
+            if key in self._fft_plans:
+                return self._fft_plans[key]
+            if len(self._fft_plans) >= FFT_PLAN_CACHE_SIZE:
+                # FIFO eviction: dicts iterate in insertion order
+                del self._fft_plans[next(iter(self._fft_plans))]
+            try:
+                plan = cpx_fftpack.get_fft_plan(arr, axes=(axis,), value_type='C2C')
+            except ValueError:
+                # Layout cuFFT cannot plan directly; cupy's own plan cache handles it
+                plan = None
+            self._fft_plans[key] = plan
+            return plan
+    
+    def _fft(self, arr: Any, axis: int = -1, out: Optional[Any] = None) -> Any:
+        """
+        FFT along one axis, executing a cached cuFFT plan on GPU
+        
+        The result may be written into out (arr itself for in-place) when
+        given; always use the returned array.
+        """
+        if not GPU_AVAILABLE:
+            # workers=-1 spreads batched transforms over all cores
+            return sp_fft.fft(arr, axis=axis, workers=-1)
+        
+        arr = cp.ascontiguousarray(arr)
+        plan = self._get_fft_plan(arr, axis)
+        try:
+            return self._run_fft(arr, axis, plan, out)
+        except cp.cuda.memory.OutOfMemoryError:
+            # Cached blocks can leave the pool too fragmented for the
+            # output; hand them back to the driver and retry once
+            self._free_pool_blocks()
+            return self._run_fft(arr, axis, plan, out)
+    
+    @staticmethod
+    def _run_fft(arr: Any, axis: int, plan: Any, out: Optional[Any]) -> Any:
+        if plan is None:
+            return cp.fft.fft(arr, axis=axis)
+        # Batched plan executed directly, without cupy.fft's per-call dispatch
+        if out is None:
+            out = cp.empty(arr.shape, dtype=arr.dtype)
+        plan.fft(arr, out, cufft.CUFFT_FORWARD)
+        return out
+    
+    def _get_window_power(self, window_type: str, size: int) -> float:
+        """Cached sum(w^2) of a window, as a host float"""
+        key = ('power', window_type, size)
+        power = self._cached_windows.get(key)
+        if power is None:
+            win = self._get_window(window_type, size)
+            power = float(xp.sum(win ** 2))
+            self._cached_windows[key] = power
+        return power
     
     def to_gpu(self, arr: np.ndarray) -> Any:
         """Transfer array to GPU (or return as-is for CPU mode)"""
         if GPU_AVAILABLE:
+            if self._zero_copy and isinstance(arr, np.ndarray):
+                return self.to_gpu_pinned(arr, dtype=arr.dtype)
             return cp.asarray(arr)
         return arr
     
+    @staticmethod
+    def _device_view(host: np.ndarray) -> Any:
+        """
+        Device array aliasing a mapped pinned host array
+        
+        With unified addressing a mapped host pointer is valid on the device
+        as-is; the view keeps the host array alive.
+        """
+        mem = cp.cuda.UnownedMemory(host.ctypes.data, host.nbytes, host)
+        return cp.ndarray(host.shape, dtype=host.dtype, memptr=cp.cuda.MemoryPointer(mem, 0))
+    
+    def allocate_input_buffer(self, nbytes: int) -> np.ndarray:
+        """
+        Allocate a page-locked host buffer (uint8) for IQ producers
+        
+        Arrays viewed from it (e.g. .view(np.complex64)) are uploaded by
+        to_gpu_pinned without the intermediate staging copy.
+        """
+        if GPU_AVAILABLE:
+            return cupyx.empty_pinned(nbytes, dtype=np.uint8)
+        return np.empty(nbytes, dtype=np.uint8)
+    
+    @staticmethod
+    def _is_pinned(arr: np.ndarray) -> bool:
+        """True if arr is (a view into) page-locked memory"""
+        base = arr
+        while isinstance(base, np.ndarray):
+            base = base.base
+        return isinstance(base, cp.cuda.PinnedMemoryPointer)
+    
+    def to_gpu_pinned(self, arr: np.ndarray, dtype: Any = np.complex64) -> Any:
+        """
+        Transfer array to GPU through page-locked memory
+        
+        Pageable input is cast/copied into a reused pinned staging buffer in
+        one pass and uploaded asynchronously on the current stream; input
+        that already lives in pinned memory is uploaded directly.
+        """
+        if not GPU_AVAILABLE:
+            return np.asarray(arr, dtype=dtype)
+        if isinstance(arr, cp.ndarray):
+            return arr.astype(dtype, copy=False)
+        
+        stream = cp.cuda.get_current_stream()
+        if self._zero_copy:
+            return self._to_gpu_mapped(arr, dtype, stream)
+        
+        gpu = cp.empty(arr.shape, dtype=dtype)
+        if self._is_pinned(arr) and arr.dtype == dtype and arr.flags['C_CONTIGUOUS']:
+            gpu.set(arr, stream=stream)
+            return gpu
+        
+        with self._lock:
+            # Don't overwrite staging that an earlier upload is still reading
+            if self._staging_event is not None:
+                self._staging_event.synchronize()
+            nbytes = gpu.nbytes
+            if self._staging is None or self._staging.nbytes < nbytes:
+                self._staging = cupyx.empty_pinned(nbytes, dtype=np.uint8)
+            staging = self._staging[:nbytes].view(dtype).reshape(arr.shape)
+            staging[...] = arr
+            gpu.set(staging, stream=stream)
+            self._staging_event = stream.record()
+        return gpu
+    
+    def _to_gpu_mapped(self, arr: np.ndarray, dtype: Any, stream: Any) -> Any:
+        """Zero-copy upload for integrated GPUs"""
+        if not (self._is_pinned(arr) and arr.dtype == dtype and arr.flags['C_CONTIGUOUS']):
+            # Pageable input: one host-side cast/copy into mapped memory
+            host = cupyx.empty_pinned(arr.shape, dtype=dtype)
+            host[...] = arr
+            arr = host
+        with self._lock:
+            # Kernels queued on this stream may outlive the caller's view
+            self._mapped_live.setdefault(stream.ptr, []).append(arr)
+        return self._device_view(arr)
+    
     def to_cpu(self, arr: Any) -> np.ndarray:
         """Transfer array to CPU"""
         if GPU_AVAILABLE and isinstance(arr, cp.ndarray):
             return cp.asnumpy(arr)
         return arr
     
+    def to_cpu_async(self, arr: Any) -> np.ndarray:
+        """
+        Queue a D2H copy into pinned host memory on the current stream
+        
+        The returned array is only valid after sync_stream(); issuing every
+        result copy first and synchronizing once lets them overlap with
+        work other clients have queued on their own streams.
+        """
+        if GPU_AVAILABLE and isinstance(arr, cp.ndarray):
+            if self._zero_copy:
+                # Write the result straight into mapped host memory
+                out = cupyx.empty_pinned(arr.shape, dtype=arr.dtype)
+                self._device_view(out)[...] = arr
+                return out
+            arr = cp.ascontiguousarray(arr)
+            out = cupyx.empty_pinned(arr.shape, dtype=arr.dtype)
+            # blocking=False: get() otherwise synchronizes the stream on every copy
+            arr.get(stream=cp.cuda.get_current_stream(), out=out, blocking=False)
+            return out
+        return arr
+    
+    def sync_stream(self):
+        """Wait for work and copies queued on the current stream"""
+        if GPU_AVAILABLE:
+            stream = cp.cuda.get_current_stream()
+            stream.synchronize()
+            if self._zero_copy:
+                with self._lock:
+                    self._mapped_live.pop(stream.ptr, None)
+            self._check_pool_watermark()
+    
+    def _device_pool(self) -> Any:
+        """Memory pool currently backing device allocations"""
+        return self._memory_pool or cp.get_default_memory_pool()
+    
+    def _free_pool_blocks(self):
+        """Return cached (unused) device pool blocks to the driver"""
+        self._device_pool().free_all_blocks()
+    
+    def _check_pool_watermark(self):
+        """
+        Release cached pool blocks if the pool has grown past the watermark
+        
+        One large transient (e.g. a big FAM SCF) would otherwise stay
+        reserved by the pool and starve later requests.
+        """
+        if self._device_pool().total_bytes() > self._pool_watermark:
+            self._free_pool_blocks()
+    
+    def reset_pool(self):
+        """
+        Drop scratch buffers and release cached device and pinned pool
+        blocks; call between client sessions. FFT plans are kept.
+        """
+        if GPU_AVAILABLE:
+            with self._lock:
+                self._scratch.clear()
+            self._free_pool_blocks()
+            (self._pinned_pool or cp.get_default_pinned_memory_pool()).free_all_blocks()
+    
+    def _get_scratch(self, name: str, shape: Tuple[int, ...], dtype: Any) -> Any:
+        """
+        Persistent scratch array reused across calls of the same shape
+        
+        Keyed per thread and stream so concurrent clients never share one
+        (two threads can interleave work on one pool stream); a thread's
+        work on its stream is ordered, so reuse is safe there. Never hand a
+        scratch array back to the caller.
+        """
+        stream = cp.cuda.get_current_stream().ptr if GPU_AVAILABLE else None
+        key = (name, tuple(shape), np.dtype(dtype).str, stream, threading.get_ident())
+        with self._lock:
+            buf = self._scratch.get(key)
+            if buf is None:
+                if len(self._scratch) >= SCRATCH_CACHE_SIZE:
+                    self._scratch.popitem(last=False)
+                buf = xp.empty(shape, dtype=dtype)
+                self._scratch[key] = buf
+            else:
+                self._scratch.move_to_end(key)
+        return buf
+    
+    @staticmethod
+    def _frames(iq_gpu: Any, num_frames: int, frame_len: int, hop: int) -> Any:
+        """Overlapping (num_frames, frame_len) frames as a strided view, no copy"""
+        iq_gpu = xp.ascontiguousarray(iq_gpu)
+        itemsize = iq_gpu.itemsize
+        return xp.lib.stride_tricks.as_strided(
+            iq_gpu, shape=(num_frames, frame_len), strides=(hop * itemsize, itemsize)
+        )
+    
+    def _get_lag_weights(self, nfft: int, smooth_window: int = 0) -> Any:
+        """
+        Per-lag weights for the WVD/CWD autocorrelation (2 * (nfft // 2) lags)
+        
+        exp(2j*pi * n * (nfft // 2) / nfft) rotates the FFT output by
+        nfft // 2, so spectra come out DC-centred without an fftshift of the
+        (T, nfft) result. The Pseudo-WVD smoothing window is folded in.
+        """
+        key = ('lag_weights', nfft, smooth_window)
+        weights = self._cached_windows.get(key)
+        if weights is None:
+            half_nfft = nfft // 2
+            lags = np.arange(2 * half_nfft)
+            weights = np.exp(2j * np.pi * ((lags * half_nfft) % nfft) / nfft)
+            if smooth_window > 0:
+                # Pad window to nfft
+                pad_left = (nfft - smooth_window) // 2
+                pad_right = nfft - smooth_window - pad_left
+                smooth_win = np.pad(np.hamming(smooth_window), (pad_left, pad_right))
+                weights *= smooth_win[:2 * half_nfft]
+            weights = xp.asarray(weights.astype(np.complex64))
+            if GPU_AVAILABLE:
+                # Other streams may read it as soon as it is cached
+                cp.cuda.get_current_stream().synchronize()
+            self._cached_windows[key] = weights
+        return weights
+    
+    def _get_cwd_kernel(self, sigma: float, num_points: int, nfft: int, time_step: int) -> Any:
+        """
+        Cached Choi-Williams kernel exp(-sigma * tau^2 / t^2) over the
+        (T, nfft) grid, float32
+        
+        t = nfft/2 + k * time_step, so the grid is fixed by these four
+        parameters and a stream with steady settings reuses one matrix.
+        """
+        key = (float(sigma), num_points, nfft, time_step)
+        with self._lock:
+            kernel = self._cwd_kernels.get(key)
+            if kernel is not None:
+                self._cwd_kernels.move_to_end(key)
+                return kernel
+        
+        half_nfft = nfft // 2
+        tau = xp.arange(-half_nfft, nfft - half_nfft, dtype=xp.float32)
+        t = xp.arange(num_points, dtype=xp.float32) * time_step + half_nfft
+        kernel = xp.exp(-np.float32(sigma) * tau[None, :] ** 2 / (t[:, None] ** 2 + np.float32(1e-10)))
+        if GPU_AVAILABLE:
+            # Other streams may read it as soon as it is cached
+            cp.cuda.get_current_stream().synchronize()
+        
+        with self._lock:
+            if len(self._cwd_kernels) >= CWD_KERNEL_CACHE_SIZE:
+                self._cwd_kernels.popitem(last=False)
+            self._cwd_kernels[key] = kernel
+        return kernel
+    
+    def _instantaneous_autocorr(self, iq_gpu: Any, num_points: int,
+                                time_step: int, nfft: int, lag_weights: Any) -> Any:
+        """
+        x(t + tau/2) * conj(x(t - tau/2)) * lag_weights[tau] for
+        t = nfft/2 + k * time_step, k < num_points, and tau in
+        [-nfft/2, nfft/2), as a (T, nfft) complex64
+        
+        Each time point reads from an (nfft + 1)-sample window of one strided
+        view, so only a 1-D lag index is gathered. The caller keeps every t
+        in [nfft/2, N - nfft/2) and |tau // 2| <= nfft/4, so all reads are
+        in bounds.
+        """
+        half_nfft = nfft // 2
+        half_tau = xp.arange(-half_nfft, half_nfft) // 2
+        
+        windows = self._frames(iq_gpu, num_points, 2 * half_nfft + 1, time_step)
+        pos = windows[:, half_nfft + half_tau]
+        neg = windows[:, half_nfft - half_tau]
+        
+        autocorr = self._get_scratch("autocorr_c64", (num_points, nfft), xp.complex64)
+        filled = autocorr[:, :2 * half_nfft]
+        if GPU_AVAILABLE:
+            _lag_product_kernel(pos, neg, lag_weights, filled)
+        else:
+            np.multiply(pos, np.conj(neg), out=filled)
+            filled *= lag_weights
+        if nfft % 2:
+            # Odd nfft: the last lag column has no tau and stays zero
+            autocorr[:, -1] = 0
+        return autocorr
+    
     def psd_welch(self, iq_samples: np.ndarray, fft_size: int = 1024,
                   overlap: float = 0.5, window: str = 'hann',
-                  detrend: bool = False) -> np.ndarray:
+                  detrend: bool = False, client_id: Optional[Any] = None) -> np.ndarray:
         """
         GPU-accelerated Welch's Power Spectral Density estimation.
         
@@ -177,13 +946,14 @@ class GPUSignalProcessor:
             overlap: Overlap fraction between segments (0.0-1.0)
             window: Window function ('hann', 'hamming', 'blackman', 'kaiser')
             detrend: Whether to remove DC offset
+            client_id: Caller identity; calls with the same id share one CUDA stream
         
         Returns:
             PSD in dB (CPU numpy array)
         """
-        with self.stream_pool.stream_context():
+        with self.stream_pool.stream_context(client_id):
             # Transfer to GPU
-            iq_gpu = self.to_gpu(iq_samples.astype(np.complex64))
+            iq_gpu = self.to_gpu_pinned(iq_samples)
             
             n = len(iq_gpu)
             hop = int(fft_size * (1 - overlap))
@@ -191,7 +961,7 @@ class GPUSignalProcessor:
             
             # Get window
             win = self._get_window(window, fft_size)
-            win_power = xp.sum(win ** 2)
+            win_power = self._get_window_power(window, fft_size)
             
             # Detrend if requested
             if detrend:
@@ -200,37 +970,47 @@ class GPUSignalProcessor:
             if num_segments == 1:
                 # Single segment case
                 segment = iq_gpu[:fft_size] * win
-                spectrum = xp.fft.fft(segment)
-                psd = xp.abs(spectrum) ** 2 / win_power
+                spectra = self._fft(segment)[None, :]
             else:
-                # Multi-segment: extract overlapping segments using advanced indexing
-                indices = xp.arange(num_segments)[:, None] * hop + xp.arange(fft_size)
-                
-                # Bounds check
-                valid_mask = indices[:, -1] < n
-                indices = indices[valid_mask]
-                num_segments = len(indices)
+                # Multi-segment: every segment lies within n here, so the
+                # overlapping segments are a strided view of the samples
+                frames = self._frames(iq_gpu, num_segments, fft_size, hop)
                 
-                # Extract and window segments
-                segments = iq_gpu[indices] * win
+                # Window the segments into reused scratch
+                segments = self._get_scratch("segments_c64", frames.shape, xp.complex64)
+                xp.multiply(frames, win, out=segments)
                 
-                # Batched FFT
-                spectra = xp.fft.fft(segments, axis=1)
-                
-                # Average power
-                psd = xp.mean(xp.abs(spectra) ** 2, axis=0) / win_power
+                if self._psd_batcher is not None and num_segments < self.config.psd_max_batch:
+                    # Shared FFT launch with other clients' segments
+                    spectra = self._psd_batcher.submit(segments)
+                else:
+                    # Batched FFT, in place: only the power reduction reads it
+                    spectra = self._fft(segments, axis=1, out=segments)
             
-            # Convert to dB
-            psd_db = 10 * xp.log10(psd + 1e-12)
+            # Average power in dB
+            scale = 1.0 / (num_segments * win_power)
+            if GPU_AVAILABLE:
+                # |X|^2, segment sum, scaling and log10 in one reduction
+                psd_db = _psd_db_kernel(spectra, np.float32(scale), axis=0)
+            elif NUMBA_AVAILABLE:
+                psd_db = np.empty(spectra.shape[1], dtype=np.float32)
+                _welch_power_db(spectra, scale, psd_db)
+            else:
+                power = np.abs(spectra)
+                np.square(power, out=power)
+                psd_db = 10 * np.log10(power.sum(axis=0) * np.float32(scale) + 1e-12)
             
             # FFT shift to center DC
             psd_db = xp.fft.fftshift(psd_db)
             
-            return self.to_cpu(psd_db)
+            psd_db = self.to_cpu_async(psd_db)
+            self.sync_stream()
+            return psd_db
     
     def fam_scf(self, iq_samples: np.ndarray, sample_rate: float,
                 nfft: int = 256, overlap: float = 0.5,
-                alpha_max: float = 0.5, window: str = 'hamming') -> Dict[str, np.ndarray]:
+                alpha_max: float = 0.5, window: str = 'hamming',
+                client_id: Optional[Any] = None) -> Dict[str, np.ndarray]:
         """
         GPU-accelerated FAM (FFT Accumulation Method) for Spectral Correlation Function.
         
@@ -244,66 +1024,76 @@ class GPUSignalProcessor:
             overlap: Overlap fraction
             alpha_max: Maximum cyclic frequency (normalized 0-1)
             window: Window function
+            client_id: Caller identity; calls with the same id share one CUDA stream
         
         Returns:
             Dict with 'scf_magnitude', 'spectral_freqs', 'cyclic_freqs', 'cyclic_profile'
         """
-        with self.stream_pool.stream_context():
-            iq_gpu = self.to_gpu(iq_samples.astype(np.complex64))
+        with self.stream_pool.stream_context(client_id):
+            iq_gpu = self.to_gpu_pinned(iq_samples)
             
             n = len(iq_gpu)
             hop = int(nfft * (1 - overlap))
-            num_blocks = max(1, (n - nfft) // hop + 1)
+            # Blocks that fit entirely within the samples (none if n < nfft)
+            num_blocks = max(0, (n - nfft) // hop + 1)
             
             # Get window
             win = self._get_window(window, nfft)
             
-            # Step 1: Channelization with overlapping blocks
-            indices = xp.arange(num_blocks)[:, None] * hop + xp.arange(nfft)
-            valid_mask = indices[:, -1] < n
-            indices = indices[valid_mask]
-            num_blocks = len(indices)
+            # Step 1: Channelization with overlapping blocks (strided view)
+            frames = self._frames(iq_gpu, num_blocks, nfft, hop)
             
             # Extract windowed blocks
-            blocks = iq_gpu[indices] * win
+            blocks = self._get_scratch("blocks_c64", frames.shape, xp.complex64)
+            xp.multiply(frames, win, out=blocks)
             
             # Step 2: FFT each block (channelization)
-            channels = xp.fft.fft(blocks, axis=1)
+            channels = self._fft(blocks, axis=1, out=blocks)
             
             # Step 3: Cyclic FFT along time axis
             # This transforms temporal variations into cyclic frequencies
-            scf_raw = xp.fft.fft(channels, axis=0)
+            scf_raw = self._fft(channels, axis=0, out=channels)
             
-            # Step 4: Compute magnitude
-            scf_magnitude = xp.abs(scf_raw)
-            
-            # Normalize
-            max_val = xp.max(scf_magnitude)
-            if max_val > 0:
-                scf_magnitude = scf_magnitude / max_val
-            
-            # Step 5: Cyclic profile (max-hold along spectral axis)
-            cyclic_profile = xp.max(scf_magnitude, axis=1)
+            # Steps 4-5: magnitude normalized to its peak, and the cyclic
+            # profile (max-hold along the spectral axis)
+            if GPU_AVAILABLE:
+                row_peak = cp.sqrt(_scf_row_peak2_kernel(scf_raw, axis=1))
+                # An all-zero SCF stays zero; no host round trip for the check
+                inv_peak = (1.0 / cp.maximum(cp.max(row_peak), 1e-30)).astype(cp.float32)
+                scf_magnitude = _scf_scaled_mag_kernel(scf_raw, inv_peak)
+                cyclic_profile = row_peak * inv_peak
+            else:
+                scf_magnitude = np.abs(scf_raw)
+                row_peak = np.max(scf_magnitude, axis=1)
+                max_val = np.max(row_peak)
+                if max_val > 0:
+                    scf_magnitude /= max_val
+                    row_peak /= max_val
+                cyclic_profile = row_peak
             
-            # Generate frequency axes
-            spectral_freqs = xp.fft.fftfreq(nfft, 1/sample_rate)
-            cyclic_freqs = xp.fft.fftfreq(num_blocks, hop/sample_rate)
+            # Frequency axes are tiny; build them on the host
+            spectral_freqs = np.fft.fftfreq(nfft, 1/sample_rate)
+            cyclic_freqs = np.fft.fftfreq(num_blocks, hop/sample_rate)
             
-            # Limit to alpha_max
+            # Limit to alpha_max; only the row indices go to the device
             alpha_max_hz = alpha_max * sample_rate
-            valid_cyclic = xp.abs(cyclic_freqs) <= alpha_max_hz
+            valid_rows = np.flatnonzero(np.abs(cyclic_freqs) <= alpha_max_hz)
+            valid_rows_gpu = xp.asarray(valid_rows)
             
-            return {
-                'scf_magnitude': self.to_cpu(scf_magnitude[valid_cyclic, :]),
-                'spectral_freqs': self.to_cpu(xp.fft.fftshift(spectral_freqs)),
-                'cyclic_freqs': self.to_cpu(cyclic_freqs[valid_cyclic]),
-                'cyclic_profile': self.to_cpu(cyclic_profile[valid_cyclic])
+            result = {
+                'scf_magnitude': self.to_cpu_async(scf_magnitude[valid_rows_gpu, :]),
+                'spectral_freqs': np.fft.fftshift(spectral_freqs),
+                'cyclic_freqs': cyclic_freqs[valid_rows],
+                'cyclic_profile': self.to_cpu_async(cyclic_profile[valid_rows_gpu])
             }
+            self.sync_stream()
+            return result
     
     def wigner_ville(self, iq_samples: np.ndarray, nfft: int = 256,
                      num_time_points: Optional[int] = None,
                      smoothing: bool = False,
-                     smooth_window: int = 16) -> Dict[str, np.ndarray]:
+                     smooth_window: int = 16,
+                     client_id: Optional[Any] = None) -> Dict[str, np.ndarray]:
         """
         GPU-accelerated Wigner-Ville Distribution.
         
@@ -318,12 +1108,13 @@ class GPUSignalProcessor:
             num_time_points: Number of time points (default: N/4)
             smoothing: Apply Pseudo-WVD smoothing
             smooth_window: Smoothing window size
+            client_id: Caller identity; calls with the same id share one CUDA stream
         
         Returns:
             Dict with 'wvd', 'time_axis', 'freq_axis'
         """
-        with self.stream_pool.stream_context():
-            iq_gpu = self.to_gpu(iq_samples.astype(np.complex64))
+        with self.stream_pool.stream_context(client_id):
+            iq_gpu = self.to_gpu_pinned(iq_samples)
             
             N = len(iq_gpu)
             if num_time_points is None:
@@ -332,63 +1123,46 @@ class GPUSignalProcessor:
             half_nfft = nfft // 2
             time_step = max(1, N // num_time_points)
             
-            # Compute valid time indices
-            t_indices = xp.arange(num_time_points) * time_step + half_nfft
+            # Compute valid time indices (on the host: no device sync)
+            t_indices = np.arange(num_time_points) * time_step + half_nfft
             t_indices = t_indices[(t_indices >= half_nfft) & (t_indices < N - half_nfft)]
             actual_time_points = len(t_indices)
             
             if actual_time_points == 0:
+                # Releases the mapped input held for this stream
+                self.sync_stream()
                 return {
                     'wvd': np.zeros((1, nfft), dtype=np.float32),
                     'time_axis': np.array([0], dtype=np.float32),
                     'freq_axis': np.linspace(-0.5, 0.5, nfft, dtype=np.float32)
                 }
             
-            # Allocate output
-            autocorr = xp.zeros((actual_time_points, nfft), dtype=xp.complex64)
-            
-            # Compute instantaneous autocorrelation for all tau values
-            # Using vectorized operations across time points
-            for tau_offset in range(-half_nfft, half_nfft):
-                tau_idx = tau_offset + half_nfft
-                
-                idx1 = t_indices + tau_offset // 2
-                idx2 = t_indices - tau_offset // 2
-                
-                # Bounds check
-                valid = (idx1 >= 0) & (idx1 < N) & (idx2 >= 0) & (idx2 < N)
-                
-                # x(t+τ/2) * conj(x(t-τ/2))
-                autocorr[valid, tau_idx] = iq_gpu[idx1[valid]] * xp.conj(iq_gpu[idx2[valid]])
+            # Instantaneous autocorrelation for all (t, tau) in one gather
+            # Lag weights pre-shift the spectra to centre DC and apply the
+            # smoothing window if requested (Pseudo-WVD)
+            lag_weights = self._get_lag_weights(nfft, smooth_window if smoothing else 0)
+            autocorr = self._instantaneous_autocorr(iq_gpu, actual_time_points, time_step,
+                                                    nfft, lag_weights)
             
-            # Apply smoothing window if requested (Pseudo-WVD)
-            if smoothing and smooth_window > 0:
-                smooth_win = self._get_window('hamming', smooth_window)
-                # Pad window to nfft
-                pad_left = (nfft - smooth_window) // 2
-                pad_right = nfft - smooth_window - pad_left
-                smooth_win_padded = xp.pad(smooth_win, (pad_left, pad_right))
-                autocorr = autocorr * smooth_win_padded
-            
-            # Batched FFT for all time slices
-            wvd_complex = xp.fft.fft(autocorr, axis=1)
+            # Batched FFT for all time slices, already DC-centred
+            wvd_complex = self._fft(autocorr, axis=1, out=autocorr)
             wvd_magnitude = xp.abs(wvd_complex)
             
-            # FFT shift to center DC
-            wvd_magnitude = xp.fft.fftshift(wvd_magnitude, axes=1)
-            
             # Frequency axis (normalized)
-            freq_axis = xp.fft.fftshift(xp.fft.fftfreq(nfft))
+            freq_axis = np.fft.fftshift(np.fft.fftfreq(nfft))
             
-            return {
-                'wvd': self.to_cpu(wvd_magnitude),
-                'time_axis': self.to_cpu(t_indices.astype(xp.float32)),
-                'freq_axis': self.to_cpu(freq_axis.astype(xp.float32))
+            result = {
+                'wvd': self.to_cpu_async(wvd_magnitude),
+                'time_axis': t_indices.astype(np.float32),
+                'freq_axis': freq_axis.astype(np.float32)
             }
+            self.sync_stream()
+            return result
     
     def choi_williams(self, iq_samples: np.ndarray, nfft: int = 256,
                       sigma: float = 1.0,
-                      num_time_points: Optional[int] = None) -> Dict[str, np.ndarray]:
+                      num_time_points: Optional[int] = None,
+                      client_id: Optional[Any] = None) -> Dict[str, np.ndarray]:
         """
         GPU-accelerated Choi-Williams Distribution.
         
@@ -400,12 +1174,13 @@ class GPUSignalProcessor:
             nfft: FFT size
             sigma: Kernel parameter (smaller = more smoothing)
             num_time_points: Number of time points
+            client_id: Caller identity; calls with the same id share one CUDA stream
         
         Returns:
             Dict with 'cwd', 'time_axis', 'freq_axis'
         """
-        with self.stream_pool.stream_context():
-            iq_gpu = self.to_gpu(iq_samples.astype(np.complex64))
+        with self.stream_pool.stream_context(client_id):
+            iq_gpu = self.to_gpu_pinned(iq_samples)
             
             N = len(iq_gpu)
             if num_time_points is None:
@@ -414,49 +1189,42 @@ class GPUSignalProcessor:
             half_nfft = nfft // 2
             time_step = max(1, N // num_time_points)
             
-            t_indices = xp.arange(num_time_points) * time_step + half_nfft
+            t_indices = np.arange(num_time_points) * time_step + half_nfft
             t_indices = t_indices[(t_indices >= half_nfft) & (t_indices < N - half_nfft)]
             actual_time_points = len(t_indices)
             
             if actual_time_points == 0:
+                # Releases the mapped input held for this stream
+                self.sync_stream()
                 return {
                     'cwd': np.zeros((1, nfft), dtype=np.float32),
                     'time_axis': np.array([0], dtype=np.float32),
                     'freq_axis': np.linspace(-0.5, 0.5, nfft, dtype=np.float32)
                 }
             
-            autocorr = xp.zeros((actual_time_points, nfft), dtype=xp.complex64)
+            # Lag weights pre-shift the spectra to centre DC
+            autocorr = self._instantaneous_autocorr(iq_gpu, actual_time_points, time_step,
+                                                    nfft, self._get_lag_weights(nfft))
             
-            for tau_offset in range(-half_nfft, half_nfft):
-                tau_idx = tau_offset + half_nfft
-                
-                idx1 = t_indices + tau_offset // 2
-                idx2 = t_indices - tau_offset // 2
-                
-                valid = (idx1 >= 0) & (idx1 < N) & (idx2 >= 0) & (idx2 < N)
-                valid_t = t_indices[valid]
-                
-                # Choi-Williams kernel
-                kernel = xp.exp(-sigma * (tau_offset ** 2) / (valid_t ** 2 + 1e-10))
-                
-                autocorr[valid, tau_idx] = kernel * (
-                    iq_gpu[idx1[valid]] * xp.conj(iq_gpu[idx2[valid]])
-                )
+            # Choi-Williams kernel exp(-sigma * tau^2 / t^2) over the whole grid
+            autocorr *= self._get_cwd_kernel(sigma, actual_time_points, nfft, time_step)
             
-            cwd_complex = xp.fft.fft(autocorr, axis=1)
+            cwd_complex = self._fft(autocorr, axis=1, out=autocorr)
             cwd_magnitude = xp.abs(cwd_complex)
-            cwd_magnitude = xp.fft.fftshift(cwd_magnitude, axes=1)
             
-            freq_axis = xp.fft.fftshift(xp.fft.fftfreq(nfft))
+            freq_axis = np.fft.fftshift(np.fft.fftfreq(nfft))
             
-            return {
-                'cwd': self.to_cpu(cwd_magnitude),
-                'time_axis': self.to_cpu(t_indices.astype(xp.float32)),
-                'freq_axis': self.to_cpu(freq_axis.astype(xp.float32))
+            result = {
+                'cwd': self.to_cpu_async(cwd_magnitude),
+                'time_axis': t_indices.astype(np.float32),
+                'freq_axis': freq_axis.astype(np.float32)
             }
+            self.sync_stream()
+            return result
     
     def rf_dna_features(self, iq_samples: np.ndarray,
-                        regions: int = 20) -> Dict[str, np.ndarray]:
+                        regions: int = 20,
+                        client_id: Optional[Any] = None) -> Dict[str, np.ndarray]:
         """
         GPU-accelerated AFIT RF-DNA feature extraction.
         
@@ -467,12 +1235,13 @@ class GPUSignalProcessor:
         Args:
             iq_samples: Complex IQ samples
             regions: Number of signal regions to analyze
+            client_id: Caller identity; calls with the same id share one CUDA stream
         
         Returns:
             Dict with 'features' (180 element array), 'domain_features'
         """
-        with self.stream_pool.stream_context():
-            iq_gpu = self.to_gpu(iq_samples.astype(np.complex64))
+        with self.stream_pool.stream_context(client_id):
+            iq_gpu = self.to_gpu_pinned(iq_samples)
             
             N = len(iq_gpu)
             region_size = N // regions
@@ -481,54 +1250,67 @@ class GPUSignalProcessor:
             amplitude = xp.abs(iq_gpu)
             phase = xp.angle(iq_gpu)
             
-            # Unwrap phase for frequency calculation
-            phase_unwrapped = xp.unwrap(phase)
-            frequency = xp.diff(phase_unwrapped)
-            frequency = xp.concatenate([frequency, xp.array([frequency[-1]])])
+            # Instantaneous frequency as the angle of the lag-1 product: the
+            # wrapped phase difference, without a sequential unwrap pass
+            frequency = xp.angle(iq_gpu[1:] * xp.conj(iq_gpu[:-1]))
+            frequency = xp.concatenate([frequency, frequency[-1:]])
             
-            all_features = []
-            domain_features = {}
-            
-            for domain_name, domain_data in [
+            domains = [
                 ('amplitude', amplitude),
                 ('phase', phase),
                 ('frequency', frequency)
-            ]:
-                # Truncate to exact region boundaries
-                truncated = domain_data[:regions * region_size]
-                
-                # Reshape into regions: (regions, region_size)
-                reshaped = truncated.reshape(regions, region_size)
-                
-                # Compute statistics (vectorized across regions)
-                mean_val = xp.mean(reshaped, axis=1, keepdims=True)
-                variance = xp.var(reshaped, axis=1)
-                std_dev = xp.sqrt(variance + 1e-10)
-                
-                # Standardize
-                centered = reshaped - mean_val
-                standardized = centered / std_dev[:, None]
-                
-                # Higher-order moments
-                skewness = xp.mean(standardized ** 3, axis=1)
-                kurtosis = xp.mean(standardized ** 4, axis=1) - 3  # Excess kurtosis
-                
-                # Stack features: [var1, skew1, kurt1, var2, skew2, kurt2, ...]
-                domain_feat = xp.stack([variance, skewness, kurtosis], axis=1).flatten()
-                all_features.append(domain_feat)
-                domain_features[domain_name] = self.to_cpu(domain_feat)
+            ]
             
-            features = xp.concatenate(all_features)
+            if GPU_AVAILABLE:
+                # All regions of all domains in one launch, one pass each
+                features = cp.empty((len(domains), regions, 3), dtype=cp.float32)
+                _region_stats_kernel(
+                    (regions, len(domains)), (REGION_STATS_THREADS,),
+                    (amplitude, phase, frequency, np.int32(region_size), features)
+                )
+            elif NUMBA_AVAILABLE:
+                features = np.empty((len(domains), regions, 3), dtype=np.float32)
+                for i, (_, domain_data) in enumerate(domains):
+                    _region_stats_cpu(domain_data, regions, region_size, features[i])
+            else:
+                all_features = []
+                for _, domain_data in domains:
+                    # Reshape into regions: (regions, region_size)
+                    reshaped = domain_data[:regions * region_size].reshape(regions, region_size)
+                    
+                    # Compute statistics (vectorized across regions)
+                    mean_val = xp.mean(reshaped, axis=1, keepdims=True)
+                    variance = xp.var(reshaped, axis=1)
+                    std_dev = xp.sqrt(variance + 1e-10)
+                    
+                    # Standardize
+                    centered = reshaped - mean_val
+                    standardized = centered / std_dev[:, None]
+                    
+                    # Higher-order moments
+                    skewness = xp.mean(standardized ** 3, axis=1)
+                    kurtosis = xp.mean(standardized ** 4, axis=1) - 3  # Excess kurtosis
+                    
+                    all_features.append(xp.stack([variance, skewness, kurtosis], axis=1))
+                features = xp.stack(all_features)
             
-            return {
-                'features': self.to_cpu(features),
+            # Per domain: [var1, skew1, kurt1, var2, skew2, kurt2, ...]
+            features = self.to_cpu_async(features.reshape(len(domains), -1))
+            domain_features = {name: features[i] for i, (name, _) in enumerate(domains)}
+            features = features.reshape(-1)
+            
+            result = {
+                'features': features,
                 'domain_features': domain_features,
                 'feature_count': len(features),
                 'regions': regions
             }
+            self.sync_stream()
+            return result
     
     def higher_order_cumulants(self, iq_samples: np.ndarray,
-                                orders: List[int] = [4, 6]) -> Dict[str, float]:
+                                orders: List[int] = [4, 6],
+                                client_id: Optional[Any] = None) -> Dict[str, float]:
         """
         GPU-accelerated higher-order cumulant calculation.
         
@@ -538,41 +1320,53 @@ class GPUSignalProcessor:
         Args:
             iq_samples: Complex IQ samples
             orders: List of cumulant orders to compute
+            client_id: Caller identity; calls with the same id share one CUDA stream
         
         Returns:
             Dict with cumulant values
         """
-        with self.stream_pool.stream_context():
-            iq_gpu = self.to_gpu(iq_samples.astype(np.complex64))
+        with self.stream_pool.stream_context(client_id):
+            iq_gpu = self.to_gpu_pinned(iq_samples)
             
             n = len(iq_gpu)
             mean = xp.mean(iq_gpu)
-            centered = iq_gpu - mean
             
-            # Compute moments
-            m2 = xp.mean(xp.abs(centered) ** 2)
-            m4 = xp.mean(xp.abs(centered) ** 4)
-            m6 = xp.mean(xp.abs(centered) ** 6)
+            # Compute moments of |x - mean|^2
+            if GPU_AVAILABLE:
+                sums = cp.zeros(3, dtype=cp.float64)
+                blocks = max(1, min(MOMENTS_MAX_BLOCKS, -(-n // MOMENTS_THREADS)))
+                _moments246_kernel(
+                    (blocks,), (MOMENTS_THREADS,),
+                    (iq_gpu, np.int64(n), mean.astype(cp.complex64), sums)
+                )
+                m2, m4, m6 = (sums / n).get(stream=cp.cuda.get_current_stream()).tolist()
+            else:
+                centered = iq_gpu - mean
+                power = centered.real ** 2 + centered.imag ** 2
+                power2 = power * power
+                m2 = np.mean(power)
+                m4 = np.mean(power2)
+                m6 = np.mean(power2 * power)
             
             results = {}
             
             if 4 in orders:
                 # 4th-order cumulant (kurtosis)
-                cum4 = m4 - 3 * m2 ** 2
-                results['cum4'] = float(self.to_cpu(cum4))
+                results['cum4'] = float(m4 - 3 * m2 ** 2)
             
             if 6 in orders:
                 # 6th-order cumulant
-                cum6 = m6 - 15 * m4 * m2 + 30 * m2 ** 3
-                results['cum6'] = float(self.to_cpu(cum6))
+                results['cum6'] = float(m6 - 15 * m4 * m2 + 30 * m2 ** 3)
             
+            # Releases the mapped input and checks the pool watermark
+            self.sync_stream()
             return results
     
     def get_memory_info(self) -> Dict[str, Any]:
         """Get GPU memory usage information"""
         if GPU_AVAILABLE:
-            mempool = cp.get_default_memory_pool()
-            pinned_mempool = cp.get_default_pinned_memory_pool()
+            mempool = self._device_pool()
+            pinned_mempool = self._pinned_pool or cp.get_default_pinned_memory_pool()
             
             return {
                 'gpu_available': True,
@@ -580,7 +1374,8 @@ class GPUSignalProcessor:
                 'used_bytes': mempool.used_bytes(),
                 'total_bytes': mempool.total_bytes(),
                 'pinned_bytes': pinned_mempool.n_free_blocks(),
-                'free_blocks': mempool.n_free_blocks()
+                'free_blocks': mempool.n_free_blocks(),
+                'pool_high_watermark_bytes': self._pool_watermark
             }
         else:
             return {
@@ -593,9 +1388,15 @@ class GPUSignalProcessor:
     def cleanup(self):
         """Free GPU memory"""
         if GPU_AVAILABLE:
-            self._cached_windows.clear()
-            cp.get_default_memory_pool().free_all_blocks()
-            cp.get_default_pinned_memory_pool().free_all_blocks()
+            with self._lock:
+                self._cached_windows.clear()
+                self._cwd_kernels.clear()
+                self._fft_plans.clear()
+                if self._staging_event is not None:
+                    self._staging_event.synchronize()
+                self._staging = None
+                self._staging_event = None
+            self.reset_pool()
             print("[GPU Processor] Memory cleared", file=sys.stderr)
 
 
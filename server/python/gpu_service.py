@@ -7,12 +7,13 @@ requests from the Node.js tRPC backend via ZeroMQ.
 
 Features:
 - Persistent GPU context (no per-request initialization overhead)
-- Async request handling
+- Async request handling (pipelined: many requests in flight per socket)
 - Health monitoring and memory management
 - Graceful shutdown with resource cleanup
 """
 
 import asyncio
+import functools
 import json
 import signal
 import sys
@@ -21,12 +22,20 @@ import time
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from gpu_processor import GPUSignalProcessor, GPUConfig, get_processor
+from gpu_processor import GPUSignalProcessor, GPUConfig, get_processor, GPU_AVAILABLE
+
+# orjson is optional - serializes numpy arrays natively for JSON clients
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # ZeroMQ for IPC
 try:
@@ -46,6 +55,8 @@ class ServiceConfig:
     memory_cleanup_interval: float = 300.0
     max_request_size_mb: int = 100
     log_requests: bool = True
+    gpu_workers: int = 4      # Threads running GPU calls concurrently
+    max_inflight: int = 64    # Requests accepted before RX stops reading
 
 
 class GPUServiceStats:
@@ -89,9 +100,21 @@ class GPUService:
     ZeroMQ-based GPU service for Node.js integration.
     
     Protocol:
+    - ROUTER socket: REQ and DEALER clients are both accepted, and
+      requests are processed concurrently, replies returning as they finish
     - Client sends JSON request with 'command' field
+    - Optional 'client_id' pins that client's requests to one CUDA stream
+      (defaults to the socket identity of the connection)
     - Server responds with JSON result or error
     
+    Binary (multipart) protocol:
+    - Frame 0: JSON header {command, params, client_id?, dtype}; frame 1:
+      raw IQ buffer (complex64, or interleaved real samples of 'dtype')
+    - Reply frame 0: JSON header with the scalar fields and an 'arrays'
+      list of {name, dtype, shape}; frames 1..n: the raw array buffers
+    - Single-frame JSON requests (iq_real/iq_imag) get single-frame JSON
+      replies, so existing clients keep working
+    
     Commands:
     - ping: Health check
     - psd: Power Spectral Density
@@ -113,21 +136,35 @@ class GPUService:
         self._context: Optional[zmq.asyncio.Context] = None
         self._socket: Optional[zmq.asyncio.Socket] = None
         self._cleanup_task: Optional[asyncio.Task] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._tx_queue: Optional[asyncio.Queue] = None
+        self._inflight: Optional[asyncio.Semaphore] = None
+        self._request_tasks: set = set()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.config.gpu_workers, thread_name_prefix='gpu-worker'
+        )
     
-    async def handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
-        """Route and handle incoming request"""
+    async def handle_request(self, request: Dict[str, Any],
+                             iq_buffer: Optional[Any] = None) -> Dict[str, Any]:
+        """Route and handle incoming request (iq_buffer: binary IQ frame)"""
         
         cmd = request.get('command', '').lower()
         params = request.get('params', {})
+        # Optional caller identity: one client's requests share a CUDA stream
+        client_id = request.get('client_id')
         start_time = time.time()
         
         try:
             # Extract IQ data if present
             iq_samples = None
-            if 'iq_real' in request and 'iq_imag' in request:
-                iq_real = np.array(request['iq_real'], dtype=np.float32)
-                iq_imag = np.array(request['iq_imag'], dtype=np.float32)
-                iq_samples = iq_real + 1j * iq_imag
+            if iq_buffer is not None:
+                iq_samples = self._decode_iq(iq_buffer, request.get('dtype', 'complex64'))
+                bytes_processed = iq_samples.nbytes
+            elif 'iq_real' in request and 'iq_imag' in request:
+                # Fill complex64 directly, no float32 temporaries or 1j multiply
+                iq_samples = self._alloc_iq(len(request['iq_real']))
+                iq_samples.real = request['iq_real']
+                iq_samples.imag = request['iq_imag']
                 bytes_processed = iq_samples.nbytes
             else:
                 bytes_processed = 0
@@ -137,28 +174,29 @@ class GPUService:
                 result = await self._handle_ping()
             
             elif cmd == 'psd':
-                result = await self._handle_psd(iq_samples, params)
+                result = await self._handle_psd(iq_samples, params, client_id)
             
             elif cmd == 'fam':
-                result = await self._handle_fam(iq_samples, params)
+                result = await self._handle_fam(iq_samples, params, client_id)
             
             elif cmd == 'wvd':
-                result = await self._handle_wvd(iq_samples, params)
+                result = await self._handle_wvd(iq_samples, params, client_id)
             
             elif cmd == 'cwd':
-                result = await self._handle_cwd(iq_samples, params)
+                result = await self._handle_cwd(iq_samples, params, client_id)
             
             elif cmd == 'rf_dna':
-                result = await self._handle_rf_dna(iq_samples, params)
+                result = await self._handle_rf_dna(iq_samples, params, client_id)
             
             elif cmd == 'cumulants':
-                result = await self._handle_cumulants(iq_samples, params)
+                result = await self._handle_cumulants(iq_samples, params, client_id)
             
             elif cmd == 'memory':
                 result = self.processor.get_memory_info()
             
             elif cmd == 'cleanup':
-                self.processor.cleanup()
+                # On a GPU worker thread, like the requests it may overlap with
+                await self._run_blocking(self.processor.cleanup)
                 result = {'status': 'ok', 'message': 'GPU memory cleared'}
             
             elif cmd == 'stats':
@@ -189,6 +227,70 @@ class GPUService:
                 'processing_time_ms': (time.time() - start_time) * 1000
             }
     
+    async def _run_blocking(self, fn, *args, **kwargs) -> Any:
+        """Run a blocking GPU call on the worker pool, off the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+    
+    def _alloc_iq(self, n: int) -> np.ndarray:
+        """complex64 IQ buffer in page-locked memory (uploaded without staging)"""
+        return self.processor.allocate_input_buffer(n * 8).view(np.complex64)
+    
+    def _decode_iq(self, buffer: Any, dtype: str) -> np.ndarray:
+        """Decode a binary IQ frame to complex64"""
+        samples = np.frombuffer(buffer, dtype=np.dtype(dtype))
+        if samples.dtype.kind != 'c' and samples.size % 2:
+            raise ValueError('Interleaved IQ frame has an odd number of samples')
+        
+        if not GPU_AVAILABLE:
+            # CPU mode: view the frame in place when possible
+            if samples.dtype == np.complex64:
+                return samples
+            if samples.dtype.kind == 'c':
+                return samples.astype(np.complex64)
+            # Interleaved I/Q real samples (float32 views in place, ints convert)
+            return samples.astype(np.float32, copy=False).view(np.complex64)
+        
+        # GPU mode: cast/copy once, straight into pinned memory, so the
+        # processor's H2D copy is a direct DMA with no staging pass
+        n = samples.size if samples.dtype.kind == 'c' else samples.size // 2
+        iq = self._alloc_iq(n)
+        if samples.dtype.kind == 'c':
+            iq[...] = samples
+        else:
+            iq.view(np.float32)[...] = samples
+        return iq
+    
+    @staticmethod
+    def _json_default(obj: Any) -> Any:
+        """json.dumps fallback for numpy results"""
+        if isinstance(obj, np.ndarray):
+            return obj.tolist()
+        if isinstance(obj, np.generic):
+            return obj.item()
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    
+    def _encode_json(self, response: Dict[str, Any]) -> bytes:
+        """Single-frame JSON reply, numpy arrays included"""
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(response, option=orjson.OPT_SERIALIZE_NUMPY)
+        return json.dumps(response, default=self._json_default).encode('utf-8')
+    
+    def _encode_multipart(self, response: Dict[str, Any]) -> list:
+        """JSON header frame followed by one raw frame per numpy array"""
+        header: Dict[str, Any] = {}
+        arrays = []
+        for name, value in response.items():
+            if isinstance(value, np.ndarray):
+                value = np.ascontiguousarray(value)
+                header.setdefault('arrays', []).append(
+                    {'name': name, 'dtype': value.dtype.str, 'shape': list(value.shape)}
+                )
+                arrays.append(value)
+            else:
+                header[name] = value
+        return [self._encode_json(header)] + arrays
+    
     async def _handle_ping(self) -> Dict[str, Any]:
         """Health check"""
         memory_info = self.processor.get_memory_info()
@@ -199,107 +301,126 @@ class GPUService:
             'stats': self.stats.to_dict()
         }
     
-    async def _handle_psd(self, iq_samples: np.ndarray, params: Dict) -> Dict[str, Any]:
+    async def _handle_psd(self, iq_samples: np.ndarray, params: Dict,
+                          client_id: Optional[Any] = None) -> Dict[str, Any]:
         """Power Spectral Density"""
         if iq_samples is None:
             return {'error': 'Missing IQ data'}
         
-        psd = self.processor.psd_welch(
+        psd = await self._run_blocking(
+            self.processor.psd_welch,
             iq_samples,
             fft_size=params.get('fft_size', 1024),
             overlap=params.get('overlap', 0.5),
-            window=params.get('window', 'hann')
+            window=params.get('window', 'hann'),
+            client_id=client_id
         )
         
         return {
-            'psd': psd.tolist(),
+            'psd': psd,
             'fft_size': params.get('fft_size', 1024),
             'num_bins': len(psd)
         }
     
-    async def _handle_fam(self, iq_samples: np.ndarray, params: Dict) -> Dict[str, Any]:
+    async def _handle_fam(self, iq_samples: np.ndarray, params: Dict,
+                          client_id: Optional[Any] = None) -> Dict[str, Any]:
         """FAM Cyclostationary Analysis"""
         if iq_samples is None:
             return {'error': 'Missing IQ data'}
         
-        result = self.processor.fam_scf(
+        result = await self._run_blocking(
+            self.processor.fam_scf,
             iq_samples,
             sample_rate=params.get('sample_rate', 1e6),
             nfft=params.get('nfft', 256),
             overlap=params.get('overlap', 0.5),
-            alpha_max=params.get('alpha_max', 0.5)
+            alpha_max=params.get('alpha_max', 0.5),
+            client_id=client_id
         )
         
         return {
-            'scf_magnitude': result['scf_magnitude'].tolist(),
-            'spectral_freqs': result['spectral_freqs'].tolist(),
-            'cyclic_freqs': result['cyclic_freqs'].tolist(),
-            'cyclic_profile': result['cyclic_profile'].tolist(),
+            'scf_magnitude': result['scf_magnitude'],
+            'spectral_freqs': result['spectral_freqs'],
+            'cyclic_freqs': result['cyclic_freqs'],
+            'cyclic_profile': result['cyclic_profile'],
             'shape': list(result['scf_magnitude'].shape)
         }
     
-    async def _handle_wvd(self, iq_samples: np.ndarray, params: Dict) -> Dict[str, Any]:
+    async def _handle_wvd(self, iq_samples: np.ndarray, params: Dict,
+                          client_id: Optional[Any] = None) -> Dict[str, Any]:
         """Wigner-Ville Distribution"""
         if iq_samples is None:
             return {'error': 'Missing IQ data'}
         
-        result = self.processor.wigner_ville(
+        result = await self._run_blocking(
+            self.processor.wigner_ville,
             iq_samples,
             nfft=params.get('nfft', 256),
             num_time_points=params.get('num_time_points'),
             smoothing=params.get('smoothing', False),
-            smooth_window=params.get('smooth_window', 16)
+            smooth_window=params.get('smooth_window', 16),
+            client_id=client_id
         )
         
         return {
-            'wvd': result['wvd'].tolist(),
-            'time_axis': result['time_axis'].tolist(),
-            'freq_axis': result['freq_axis'].tolist(),
+            'wvd': result['wvd'],
+            'time_axis': result['time_axis'],
+            'freq_axis': result['freq_axis'],
             'shape': list(result['wvd'].shape)
         }
     
-    async def _handle_cwd(self, iq_samples: np.ndarray, params: Dict) -> Dict[str, Any]:
+    async def _handle_cwd(self, iq_samples: np.ndarray, params: Dict,
+                          client_id: Optional[Any] = None) -> Dict[str, Any]:
         """Choi-Williams Distribution"""
         if iq_samples is None:
             return {'error': 'Missing IQ data'}
         
-        result = self.processor.choi_williams(
+        result = await self._run_blocking(
+            self.processor.choi_williams,
             iq_samples,
             nfft=params.get('nfft', 256),
             sigma=params.get('sigma', 1.0),
-            num_time_points=params.get('num_time_points')
+            num_time_points=params.get('num_time_points'),
+            client_id=client_id
         )
         
         return {
-            'cwd': result['cwd'].tolist(),
-            'time_axis': result['time_axis'].tolist(),
-            'freq_axis': result['freq_axis'].tolist(),
+            'cwd': result['cwd'],
+            'time_axis': result['time_axis'],
+            'freq_axis': result['freq_axis'],
             'shape': list(result['cwd'].shape)
         }
     
-    async def _handle_rf_dna(self, iq_samples: np.ndarray, params: Dict) -> Dict[str, Any]:
+    async def _handle_rf_dna(self, iq_samples: np.ndarray, params: Dict,
+                             client_id: Optional[Any] = None) -> Dict[str, Any]:
         """RF-DNA Feature Extraction"""
         if iq_samples is None:
             return {'error': 'Missing IQ data'}
         
-        result = self.processor.rf_dna_features(
+        result = await self._run_blocking(
+            self.processor.rf_dna_features,
             iq_samples,
-            regions=params.get('regions', 20)
+            regions=params.get('regions', 20),
+            client_id=client_id
         )
         
         return {
-            'features': result['features'].tolist(),
+            'features': result['features'],
             'feature_count': result['feature_count'],
             'regions': result['regions']
         }
     
-    async def _handle_cumulants(self, iq_samples: np.ndarray, params: Dict) -> Dict[str, Any]:
+    async def _handle_cumulants(self, iq_samples: np.ndarray, params: Dict,
+                                client_id: Optional[Any] = None) -> Dict[str, Any]:
         """Higher-Order Cumulants"""
         if iq_samples is None:
             return {'error': 'Missing IQ data'}
         
         orders = params.get('orders', [4, 6])
-        result = self.processor.higher_order_cumulants(iq_samples, orders=orders)
+        result = await self._run_blocking(
+            self.processor.higher_order_cumulants,
+            iq_samples, orders=orders, client_id=client_id
+        )
         
         return result
     
@@ -312,7 +433,7 @@ class GPUService:
             # If using more than 80% of allocated memory, cleanup
             if memory_info.get('used_bytes', 0) > memory_info.get('total_bytes', 1) * 0.8:
                 print("[GPU Service] Memory cleanup triggered", file=sys.stderr)
-                self.processor.cleanup()
+                await self._run_blocking(self.processor.cleanup)
     
     async def run(self):
         """Main service loop"""
@@ -321,7 +442,7 @@ class GPUService:
             return
         
         self._context = zmq.asyncio.Context()
-        self._socket = self._context.socket(zmq.REP)
+        self._socket = self._context.socket(zmq.ROUTER)
         
         # Set socket options
         self._socket.setsockopt(zmq.RCVTIMEO, 60000)  # 60 second timeout
@@ -340,24 +461,24 @@ class GPUService:
         # Start periodic cleanup task
         self._cleanup_task = asyncio.create_task(self._periodic_cleanup())
         
+        # RX (this loop) -> one task per request -> TX queue -> single writer
+        self._inflight = asyncio.Semaphore(self.config.max_inflight)
+        self._tx_queue = asyncio.Queue()
+        self._writer_task = asyncio.create_task(self._writer())
+        
         while self.running:
             try:
-                # Wait for request
-                message_bytes = await self._socket.recv()
-                
-                # Parse JSON
-                try:
-                    request = json.loads(message_bytes.decode('utf-8'))
-                except json.JSONDecodeError as e:
-                    response = {'error': f'Invalid JSON: {e}'}
-                    await self._socket.send_json(response)
+                # Wait for request: routing envelope, JSON header, optional IQ frame
+                frames = await self._socket.recv_multipart(copy=False)
+                envelope, body = self._split_envelope(frames)
+                if not body:
                     continue
                 
-                # Handle request
-                response = await self.handle_request(request)
-                
-                # Send response
-                await self._socket.send_json(response)
+                # Backpressure: stop reading once max_inflight requests are pending
+                await self._inflight.acquire()
+                task = asyncio.create_task(self._process(envelope, body))
+                self._request_tasks.add(task)
+                task.add_done_callback(self._request_done)
             
             except zmq.Again:
                 # Timeout - continue loop
@@ -370,19 +491,61 @@ class GPUService:
             
             except asyncio.CancelledError:
                 break
-            
-            except Exception as e:
-                print(f"[GPU Service] Unexpected error: {e}", file=sys.stderr)
-                traceback.print_exc(file=sys.stderr)
-                
-                # Try to send error response
-                try:
-                    await self._socket.send_json({'error': str(e)})
-                except:
-                    pass
         
         await self.shutdown()
     
+    @staticmethod
+    def _split_envelope(frames: list) -> tuple:
+        """Split ROUTER frames into (routing envelope, request frames)"""
+        # REQ peers send [identity, b'', ...]; DEALER peers may omit the delimiter
+        for i in range(1, len(frames)):
+            if len(frames[i].buffer) == 0:
+                return frames[:i + 1], frames[i + 1:]
+        return frames[:1], frames[1:]
+    
+    def _request_done(self, task: asyncio.Task):
+        self._request_tasks.discard(task)
+        self._inflight.release()
+    
+    async def _process(self, envelope: list, frames: list):
+        """Handle one routed request and queue its reply for the writer"""
+        binary = len(frames) > 1
+        try:
+            try:
+                request = json.loads(frames[0].bytes)
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                reply = [self._encode_json({'error': f'Invalid JSON: {e}'})]
+            else:
+                # Unnamed clients are pinned to a CUDA stream by their socket identity
+                request.setdefault('client_id', envelope[0].bytes)
+                iq_buffer = frames[1].buffer if binary else None
+                response = await self.handle_request(request, iq_buffer)
+                
+                # Array frames go out zero-copy
+                if binary:
+                    reply = self._encode_multipart(response)
+                else:
+                    reply = [self._encode_json(response)]
+        
+        except Exception as e:
+            print(f"[GPU Service] Unexpected error: {e}", file=sys.stderr)
+            traceback.print_exc(file=sys.stderr)
+            reply = [self._encode_json({'error': str(e)})]
+        
+        await self._tx_queue.put(list(envelope) + reply)
+    
+    async def _writer(self):
+        """Single TX coroutine - the only task that sends on the socket"""
+        while True:
+            frames = await self._tx_queue.get()
+            try:
+                await self._socket.send_multipart(frames, copy=False)
+            except zmq.Again:
+                print("[GPU Service] Reply dropped: send timed out", file=sys.stderr)
+            except zmq.ZMQError as e:
+                if self.running:
+                    print(f"[GPU Service] ZMQ error: {e}", file=sys.stderr)
+    
     async def shutdown(self):
         """Graceful shutdown"""
         print("[GPU Service] Shutting down...", file=sys.stderr)
@@ -396,6 +559,15 @@ class GPUService:
             except asyncio.CancelledError:
                 pass
         
+        # Cancel in-flight requests and the writer, then drain GPU workers
+        for task in list(self._request_tasks) + [self._writer_task]:
+            if task:
+                task.cancel()
+        await asyncio.gather(*self._request_tasks, return_exceptions=True)
+        if self._writer_task:
+            await asyncio.gather(self._writer_task, return_exceptions=True)
+        self._executor.shutdown(wait=True)
+        
         # Cleanup GPU resources
         self.processor.cleanup()
         
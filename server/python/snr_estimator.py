@@ -6,7 +6,44 @@ Second and fourth moment-based estimator for MPSK/MQAM signals
 
 import sys
 import json
+import base64
 import numpy as np
+import scipy.fft as sp_fft
+
+# orjson is optional - faster parsing of large IQ payloads
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Numba is optional - fused, multi-threaded moment sweep
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _envelope_moments(iq, mean_re, mean_im):
+    """Sums of |x - mean|^2 and |x - mean|^4 in a single sweep"""
+    s2 = 0.0
+    s4 = 0.0
+    for i in prange(iq.shape[0]):
+        re = iq[i].real - mean_re
+        im = iq[i].imag - mean_im
+        p = re * re + im * im
+        s2 += p
+        s4 += p * p
+    return s2, s4
 
 
 class M2M4SNREstimator:
@@ -31,17 +68,25 @@ class M2M4SNREstimator:
         Returns:
             Dictionary with SNR estimates in dB and linear
         """
-        # Remove DC offset
-        iq_samples = iq_samples - np.mean(iq_samples)
+        n = len(iq_samples)
         
-        # Calculate envelope (magnitude)
-        envelope = np.abs(iq_samples)
+        # DC offset, removed inside the moment pass (no centered copy)
+        dc = np.mean(iq_samples, dtype=np.complex128) if n else 0j
         
-        # Second moment (M2) - average power
-        M2 = np.mean(envelope ** 2)
-        
-        # Fourth moment (M4) - average of fourth power
-        M4 = np.mean(envelope ** 4)
+        # Second moment (M2) - average power; fourth moment (M4) - average
+        # of squared power. |x|^2 is never passed through sqrt/abs.
+        if n == 0:
+            M2 = M4 = 0.0
+        elif NUMBA_AVAILABLE:
+            s2, s4 = _envelope_moments(np.ascontiguousarray(iq_samples), dc.real, dc.imag)
+            M2 = s2 / n
+            M4 = s4 / n
+        else:
+            centered = iq_samples - iq_samples.dtype.type(dc)
+            power = centered.real * centered.real
+            power += centered.imag * centered.imag
+            M2 = power.sum(dtype=np.float64) / n
+            M4 = np.einsum('i,i->', power, power, dtype=np.float64) / n
         
         # M2M4 ratio
         if M2 > 0:
@@ -92,7 +137,8 @@ class M2M4SNREstimator:
         }
 
 
-def estimate_cfo_power_method(iq_samples: np.ndarray, sample_rate: float, symbol_rate: float = None) -> dict:
+def estimate_cfo_power_method(iq_samples: np.ndarray, sample_rate: float, symbol_rate: float = None,
+                              include_psd_peak: bool = False) -> dict:
     """
     Carrier Frequency Offset (CFO) estimation using power method
     
@@ -100,6 +146,7 @@ def estimate_cfo_power_method(iq_samples: np.ndarray, sample_rate: float, symbol
         iq_samples: Complex IQ samples
         sample_rate: Sample rate in Hz
         symbol_rate: Symbol rate in Hz (optional, for normalization)
+        include_psd_peak: Also locate the spectral peak (one full-length FFT)
     
     Returns:
         Dictionary with CFO estimate in Hz and normalized
@@ -108,24 +155,26 @@ def estimate_cfo_power_method(iq_samples: np.ndarray, sample_rate: float, symbol
     iq_samples = iq_samples - np.mean(iq_samples)
     
     # Method 1: Autocorrelation-based CFO estimation
-    # Compute autocorrelation at lag 1
-    autocorr = np.correlate(iq_samples[:-1], iq_samples[1:], mode='valid')
+    # Lag-1 autocorrelation sum(conj(x[n]) * x[n+1]): a single dot product
+    autocorr = np.vdot(iq_samples[:-1], iq_samples[1:])
     
     # Phase of autocorrelation gives frequency offset
-    phase = np.angle(np.sum(autocorr))
+    phase = np.angle(autocorr)
     
     # Convert phase to frequency (Hz)
     cfo_hz = phase * sample_rate / (2 * np.pi)
     
-    # Method 2: Power spectral density peak
-    # FFT of signal
-    fft_result = np.fft.fft(iq_samples)
-    psd = np.abs(fft_result) ** 2
-    
-    # Find peak frequency
-    peak_idx = np.argmax(psd)
-    freqs = np.fft.fftfreq(len(iq_samples), 1/sample_rate)
-    peak_freq = freqs[peak_idx]
+    # Method 2: Power spectral density peak (optional)
+    peak_freq = None
+    if include_psd_peak and len(iq_samples) > 0:
+        # |X| peaks where |X|^2 does - no power array needed
+        spectrum = sp_fft.fft(iq_samples, workers=-1)
+        peak_idx = int(np.argmax(np.abs(spectrum)))
+        
+        # fftfreq bin -> Hz without building the full frequency axis
+        n = len(iq_samples)
+        k = peak_idx if peak_idx < (n + 1) // 2 else peak_idx - n
+        peak_freq = k * sample_rate / n
     
     # Normalized CFO
     if symbol_rate:
@@ -136,8 +185,8 @@ def estimate_cfo_power_method(iq_samples: np.ndarray, sample_rate: float, symbol
     return {
         'cfo_hz': float(cfo_hz),
         'cfo_normalized': float(cfo_normalized),
-        'peak_freq_hz': float(peak_freq),
-        'method': 'Autocorrelation + PSD',
+        'peak_freq_hz': float(peak_freq) if peak_freq is not None else None,
+        'method': 'Autocorrelation + PSD' if peak_freq is not None else 'Autocorrelation',
         'sample_rate': float(sample_rate),
         'symbol_rate': float(symbol_rate) if symbol_rate else None
     }
@@ -148,14 +197,22 @@ def main():
     CLI interface for SNR and CFO estimation
     
     Input (stdin): JSON with {iq_real: [], iq_imag: [], sample_rate: float, params: {}}
+                   or, for large captures, {iq_bytes_b64: str, sample_rate: float, params: {}}
+                   where iq_bytes_b64 is base64 of interleaved little-endian complex64
     Output (stdout): JSON with estimation results
     """
     # Read input from stdin
-    input_data = json.load(sys.stdin)
+    raw = sys.stdin.buffer.read()
+    input_data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
     
-    iq_real = np.array(input_data['iq_real'], dtype=np.float32)
-    iq_imag = np.array(input_data['iq_imag'], dtype=np.float32)
-    iq_samples = iq_real + 1j * iq_imag
+    if 'iq_bytes_b64' in input_data:
+        # Binary IQ: decoded straight into a complex64 array, no Python floats
+        iq_samples = np.frombuffer(base64.b64decode(input_data['iq_bytes_b64']), dtype='<c8')
+    else:
+        # Fill complex64 directly, no float32 temporaries or 1j multiply
+        iq_samples = np.empty(len(input_data['iq_real']), dtype=np.complex64)
+        iq_samples.real = input_data['iq_real']
+        iq_samples.imag = input_data['iq_imag']
     
     sample_rate = input_data.get('sample_rate', 1e6)
     params = input_data.get('params', {})
@@ -164,6 +221,7 @@ def main():
     modulation_type = params.get('modulation_type', 'QPSK')
     symbol_rate = params.get('symbol_rate')
     estimate_cfo = params.get('estimate_cfo', True)
+    include_psd_peak = params.get('include_psd_peak', False)
     
     # SNR estimation
     estimator = M2M4SNREstimator()
@@ -171,7 +229,7 @@ def main():
     
     # CFO estimation
     if estimate_cfo:
-        cfo_results = estimate_cfo_power_method(iq_samples, sample_rate, symbol_rate)
+        cfo_results = estimate_cfo_power_method(iq_samples, sample_rate, symbol_rate, include_psd_peak)
     else:
         cfo_results = None
     
@@ -16,6 +16,23 @@ class SDRBridge:
         self.device = None
         self.rx_stream = None
         self.tx_stream = None
+        self._rx_buf = None
+        
+    def _get_rx_buffer(self, num_samples):
+        """Persistent complex64 RX buffer, (re)allocated only when too small"""
+        if self._rx_buf is None or len(self._rx_buf) < num_samples:
+            self._rx_buf = None
+            # CuPy is optional and imported only when a stream needs a buffer
+            # (not by enumerate/configure): pinned buffers upload to the GPU directly
+            try:
+                import cupyx
+                self._rx_buf = cupyx.empty_pinned(num_samples, dtype=np.complex64)
+            except Exception:
+                # No CuPy or no usable CUDA runtime - fall back to pageable memory
+                pass
+            if self._rx_buf is None:
+                self._rx_buf = np.empty(num_samples, dtype=np.complex64)
+        return self._rx_buf
         
     def enumerate_devices(self):
         """List all available SoapySDR devices"""
@@ -96,9 +113,13 @@ class SDRBridge:
             self.rx_stream = self.device.setupStream(SOAPY_SDR_RX, stream_format)
             self.device.activateStream(self.rx_stream)
             
+            # Size the reusable RX buffer up front
+            mtu = self.device.getStreamMTU(self.rx_stream)
+            self._get_rx_buffer(max(mtu, num_samples))
+            
             return {
                 'success': True,
-                'mtu': self.device.getStreamMTU(self.rx_stream)
+                'mtu': mtu
             }
         except Exception as e:
             return {
@@ -107,26 +128,29 @@ class SDRBridge:
             }
     
     def read_samples(self, num_samples=1024):
-        """Read IQ samples from RX stream"""
+        """
+        Read IQ samples from RX stream
+        
+        'data' is the complex64 sample array itself; .view(np.float32) gives
+        the interleaved I/Q float32 layout without a copy. It is a view of
+        the persistent (pinned when CuPy is available) RX buffer, valid
+        until the next read - copy it to keep samples longer.
+        """
         try:
             if not self.rx_stream:
                 raise Exception("RX stream not started")
             
-            buff = np.zeros(num_samples, dtype=np.complex64)
-            sr = self.device.readStream(self.rx_stream, [buff], len(buff), timeoutUs=1000000)
+            # readStream overwrites the samples it returns - no zero-fill needed
+            buff = self._get_rx_buffer(num_samples)
+            sr = self.device.readStream(self.rx_stream, [buff], num_samples, timeoutUs=1000000)
             
             if sr.ret < 0:
                 raise Exception(f"Stream read error: {sr.ret}")
             
-            # Return as interleaved I/Q float32
-            iq_data = np.empty(sr.ret * 2, dtype=np.float32)
-            iq_data[0::2] = buff[:sr.ret].real
-            iq_data[1::2] = buff[:sr.ret].imag
-            
             return {
                 'success': True,
                 'num_samples': sr.ret,
-                'data': iq_data.tobytes().hex()  # Hex encode for JSON transport
+                'data': buff[:sr.ret]
             }
         except Exception as e:
             return {
@@ -141,6 +165,7 @@ class SDRBridge:
                 self.device.deactivateStream(self.rx_stream)
                 self.device.closeStream(self.rx_stream)
                 self.rx_stream = None
+                self._rx_buf = None
             
             return {'success': True}
         except Exception as e:
@@ -161,6 +186,23 @@ class SDRBridge:
                 'error': str(e)
             }
 
+def write_samples(result):
+    """
+    Write a read_samples result to stdout
+    
+    One JSON header line, then (on success) 'nbytes' of raw interleaved
+    little-endian I/Q float32 - no hex/base64 expansion.
+    """
+    data = result.pop('data', None)
+    if data is not None:
+        result['format'] = 'CF32'
+        result['nbytes'] = data.nbytes
+    sys.stdout.write(json.dumps(result) + '\n')
+    sys.stdout.flush()
+    if data is not None:
+        sys.stdout.buffer.write(data.view(np.float32))
+        sys.stdout.buffer.flush()
+
 def main():
     """Command-line interface"""
     bridge = SDRBridge()
@@ -198,7 +240,7 @@ def main():
     elif command == 'read':
         num_samples = int(sys.argv[2]) if len(sys.argv) > 2 else 1024
         result = bridge.read_samples(num_samples)
-        print(json.dumps(result))
+        write_samples(result)
     
     elif command == 'stop':
         result = bridge.stop_rx_stream()
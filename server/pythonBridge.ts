@@ -2,9 +2,11 @@
  * Python Bridge - Interface between Node.js/tRPC and Python DSP/ML scripts
  * 
  * Spawns Python child processes and handles stdin/stdout communication
+ * (the modulation classifier runs as one persistent worker process)
  */
 
 import { spawn } from 'child_process';
+import type { ChildProcess } from 'child_process';
 import path from 'path';
 import { fileURLToPath } from 'url';
 import { dirname } from 'path';
@@ -121,6 +123,81 @@ export async function runFAMAnalysis(
   });
 }
 
+interface PendingClassification {
+  resolve: (result: ClassificationResult) => void;
+  reject: (error: Error) => void;
+}
+
+/**
+ * Long-lived classifier worker: the model is loaded (and its CUDA graph
+ * captured) once, then each request is one JSON line on stdin answered by
+ * one JSON line on stdout, in order.
+ */
+let classifierWorker: ChildProcess | null = null;
+const pendingClassifications: PendingClassification[] = [];
+
+function getClassifierWorker(): ChildProcess {
+  if (classifierWorker) {
+    return classifierWorker;
+  }
+  
+  const scriptPath = path.join(PYTHON_DIR, 'classify_modulation.py');
+  const python = spawn(PYTHON_BIN, [scriptPath]);
+  let stdoutBuffer = '';
+  
+  // Each complete stdout line answers the oldest pending request
+  python.stdout!.on('data', (chunk: Buffer) => {
+    stdoutBuffer += chunk.toString();
+    let newline: number;
+    while ((newline = stdoutBuffer.indexOf('\n')) >= 0) {
+      const line = stdoutBuffer.slice(0, newline).trim();
+      stdoutBuffer = stdoutBuffer.slice(newline + 1);
+      if (!line) continue;
+      
+      const pending = pendingClassifications.shift();
+      if (!pending) continue;
+      
+      try {
+        const result = JSON.parse(line);
+        if (result.error) {
+          pending.reject(new Error(`Classification failed: ${result.error}`));
+        } else {
+          pending.resolve(result as ClassificationResult);
+        }
+      } catch (error) {
+        pending.reject(new Error(`Failed to parse classification result: ${error}`));
+      }
+    }
+  });
+  
+  // Collect stderr (debug logs)
+  python.stderr!.on('data', (chunk: Buffer) => {
+    console.log('[Classifier stderr]', chunk.toString().trim());
+  });
+  
+  // Worker died: fail everything in flight, respawn on the next request
+  const fail = (error: Error) => {
+    if (classifierWorker === python) {
+      classifierWorker = null;
+    }
+    while (pendingClassifications.length > 0) {
+      pendingClassifications.shift()!.reject(error);
+    }
+  };
+  python.on('close', (code) => {
+    fail(new Error(`Classification worker exited (code ${code})`));
+  });
+  python.on('error', (error) => {
+    fail(new Error(`Failed to spawn Python process: ${error.message}`));
+  });
+  python.stdin!.on('error', (error) => {
+    fail(new Error(`Classification worker stdin closed: ${error.message}`));
+  });
+  
+  classifierWorker = python;
+  return python;
+}
+
 /**
  * Classify modulation type using TorchSig
  */
@@ -129,8 +206,6 @@ export async function classifyModulation(
   iqImag: Float32Array,
   params: ClassificationParams = {}
 ): Promise<ClassificationResult> {
-  const scriptPath = path.join(PYTHON_DIR, 'classify_modulation.py');
-  
   const input = {
     iq_real: Array.from(iqReal),
     iq_imag: Array.from(iqImag),
@@ -143,48 +218,17 @@ export async function classifyModulation(
   
   console.log(`[PythonBridge] Classifying modulation for ${iqReal.length} samples...`);
   
-  return new Promise((resolve, reject) => {
-    const python = spawn(PYTHON_BIN, [scriptPath]);
-    
-    let stdoutData = '';
-    const stderrChunks: string[] = [];
+  const result = await new Promise<ClassificationResult>((resolve, reject) => {
+    const python = getClassifierWorker();
+    pendingClassifications.push({ resolve, reject });
     
-    // Send input via stdin
-    python.stdin.write(JSON.stringify(input));
-    python.stdin.end();
-    
-    // Collect stdout (JSON result)
-    python.stdout.on('data', (chunk: Buffer) => {
-      stdoutData += chunk.toString();
-    });
-    
-    // Collect stderr (debug logs)
-    python.stderr.on('data', (chunk: Buffer) => {
-      const msg = chunk.toString();
-      stderrChunks.push(msg);
-      console.log('[Classifier stderr]', msg.trim());
-    });
-    
-    python.on('close', (code) => {
-      if (code !== 0) {
-        const errorMsg = stderrChunks.join('');
-        reject(new Error(`Classification failed (code ${code}): ${errorMsg}`));
-        return;
-      }
-      
-      try {
-        const result: ClassificationResult = JSON.parse(stdoutData);
-        console.log(`[PythonBridge] Classification complete. Top: ${result.predictions[0].modulation} (${result.predictions[0].confidence.toFixed(1)}%)`);
-        resolve(result);
-      } catch (error) {
-        reject(new Error(`Failed to parse classification result: ${error}`));
-      }
-    });
-    
-    python.on('error', (error) => {
-      reject(new Error(`Failed to spawn Python process: ${error.message}`));
-    });
+    // One request per line
+    python.stdin!.write(JSON.stringify(input) + '\n');
   });
+  
+  const top = result.predictions[0];
+  console.log(`[PythonBridge] Classification complete. Top: ${top ? `${top.modulation} (${top.confidence.toFixed(1)}%)` : 'none'}`);
+  return result;
 }
 
 /**
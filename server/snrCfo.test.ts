@@ -59,7 +59,37 @@ describe('SNR and CFO Estimation', () => {
     
     expect(result.cfo).toBeDefined();
     expect(result.cfo?.cfo_hz).toBeDefined();
+    expect(result.cfo?.cfo_hz).toBeCloseTo(cfoHz, 0);
+    // The PSD-peak FFT is opt-in (includePsdPeak)
+    expect(result.cfo?.method).toBe('Autocorrelation');
+    expect(result.cfo?.peak_freq_hz).toBeNull();
+  }, 10000);
+
+  it('should locate the PSD peak when includePsdPeak is set', async () => {
+    const numSamples = 1024;
+    const sampleRate = 1e6;
+    const cfoHz = 1000; // 1 kHz offset
+    
+    const iqReal = new Float32Array(numSamples);
+    const iqImag = new Float32Array(numSamples);
+    
+    for (let i = 0; i < numSamples; i++) {
+      const phase = 2 * Math.PI * cfoHz * i / sampleRate;
+      iqReal[i] = Math.cos(phase);
+      iqImag[i] = Math.sin(phase);
+    }
+    
+    const result = await runSNRCFOEstimation(iqReal, iqImag, sampleRate, {
+      modulationType: 'QPSK',
+      estimateCfo: true,
+      includePsdPeak: true
+    });
+    
+    expect(result.cfo?.cfo_hz).toBeCloseTo(cfoHz, 0);
     expect(result.cfo?.method).toBe('Autocorrelation + PSD');
+    // Nearest FFT bin to the tone (bin spacing is fs / 1024 ~ 977 Hz)
+    expect(typeof result.cfo?.peak_freq_hz).toBe('number');
+    expect(Math.abs(result.cfo!.peak_freq_hz! - cfoHz)).toBeLessThan(sampleRate / numSamples);
   }, 10000);
 
   it('should handle zero-power signal gracefully', async () => {
@@ -20,7 +20,7 @@ export interface SNRResult {
 export interface CFOResult {
   cfo_hz: number;
   cfo_normalized: number;
-  peak_freq_hz: number;
+  peak_freq_hz: number | null;
   method: string;
   sample_rate: number;
   symbol_rate: number | null;
@@ -48,6 +48,7 @@ export async function runSNRCFOEstimation(
     modulationType?: string;
     symbolRate?: number;
     estimateCfo?: boolean;
+    includePsdPeak?: boolean;
   } = {},
 ): Promise<SNRCFOEstimationResult> {
   try {
@@ -79,13 +80,13 @@ function estimateInNode(
   iqReal: Float32Array,
   iqImag: Float32Array,
   sampleRate: number,
-  params: { modulationType?: string; symbolRate?: number; estimateCfo?: boolean },
+  params: { modulationType?: string; symbolRate?: number; estimateCfo?: boolean; includePsdPeak?: boolean },
 ): SNRCFOEstimationResult {
   const { m2, m4, snrLinear, snrDb, signalPowerDb, noisePowerDb } = estimateSNR(iqReal, iqImag);
 
   const cfo = params.estimateCfo === false
     ? null
-    : estimateCFO(iqReal, iqImag, sampleRate, params.symbolRate ?? null);
+    : estimateCFO(iqReal, iqImag, sampleRate, params.symbolRate ?? null, params.includePsdPeak === true);
 
   return {
     snr: {
@@ -131,6 +132,7 @@ function estimateCFO(
   iqImag: Float32Array,
   sampleRate: number,
   symbolRate: number | null,
+  includePsdPeak: boolean,
 ): CFOResult {
   let accRe = 0;
   let accIm = 0;
@@ -151,22 +153,109 @@ function estimateCFO(
   const avgIm = count > 0 ? accIm / count : 0;
   const angle = Math.atan2(avgIm, avgRe);
   const cfoHz = (angle / (2 * Math.PI)) * sampleRate;
+  const peakFreqHz = includePsdPeak ? psdPeakFrequency(iqReal, iqImag, sampleRate) : null;
 
   return {
     cfo_hz: cfoHz,
     cfo_normalized: sampleRate > 0 ? cfoHz / sampleRate : 0,
-    peak_freq_hz: cfoHz,
-    method: 'Autocorrelation + PSD',
+    peak_freq_hz: peakFreqHz,
+    method: peakFreqHz !== null ? 'Autocorrelation + PSD' : 'Autocorrelation',
     sample_rate: sampleRate,
     symbol_rate: symbolRate,
   };
 }
 
+// Frequency of the largest spectral bin. The DC-removed signal is zero-padded
+// to a power of two for an in-place radix-2 FFT, so bins are sampleRate / nfft
+// apart (at least as fine as the Python estimator's full-length FFT).
+function psdPeakFrequency(
+  iqReal: Float32Array,
+  iqImag: Float32Array,
+  sampleRate: number,
+): number | null {
+  const n = iqReal.length;
+  if (n === 0) {
+    return null;
+  }
+
+  let nfft = 1;
+  while (nfft < n) {
+    nfft <<= 1;
+  }
+
+  let meanRe = 0;
+  let meanIm = 0;
+  for (let i = 0; i < n; i++) {
+    meanRe += iqReal[i];
+    meanIm += iqImag[i];
+  }
+  meanRe /= n;
+  meanIm /= n;
+
+  const re = new Float64Array(nfft);
+  const im = new Float64Array(nfft);
+  for (let i = 0; i < n; i++) {
+    re[i] = iqReal[i] - meanRe;
+    im[i] = iqImag[i] - meanIm;
+  }
+
+  // Bit-reversal permutation
+  for (let i = 1, j = 0; i < nfft; i++) {
+    let bit = nfft >> 1;
+    for (; j & bit; bit >>= 1) {
+      j ^= bit;
+    }
+    j ^= bit;
+    if (i < j) {
+      [re[i], re[j]] = [re[j], re[i]];
+      [im[i], im[j]] = [im[j], im[i]];
+    }
+  }
+
+  // Iterative butterflies
+  for (let len = 2; len <= nfft; len <<= 1) {
+    const half = len >> 1;
+    const stepRe = Math.cos(-2 * Math.PI / len);
+    const stepIm = Math.sin(-2 * Math.PI / len);
+    for (let start = 0; start < nfft; start += len) {
+      let wRe = 1;
+      let wIm = 0;
+      for (let k = 0; k < half; k++) {
+        const a = start + k;
+        const b = a + half;
+        const tRe = re[b] * wRe - im[b] * wIm;
+        const tIm = re[b] * wIm + im[b] * wRe;
+        re[b] = re[a] - tRe;
+        im[b] = im[a] - tIm;
+        re[a] += tRe;
+        im[a] += tIm;
+        const nextRe = wRe * stepRe - wIm * stepIm;
+        wIm = wRe * stepIm + wIm * stepRe;
+        wRe = nextRe;
+      }
+    }
+  }
+
+  let peakIdx = 0;
+  let peakPower = -1;
+  for (let k = 0; k < nfft; k++) {
+    const power = re[k] * re[k] + im[k] * im[k];
+    if (power > peakPower) {
+      peakPower = power;
+      peakIdx = k;
+    }
+  }
+
+  // FFT bin -> signed frequency
+  const bin = peakIdx < nfft / 2 ? peakIdx : peakIdx - nfft;
+  return (bin * sampleRate) / nfft;
+}
+
 function runPythonEstimator(
   iqReal: Float32Array,
   iqImag: Float32Array,
   sampleRate: number,
-  params: { modulationType?: string; symbolRate?: number; estimateCfo?: boolean },
+  params: { modulationType?: string; symbolRate?: number; estimateCfo?: boolean; includePsdPeak?: boolean },
 ) {
   return new Promise<SNRCFOEstimationResult>((resolve, reject) => {
     const scriptPath = path.join(__dirname, 'python', 'snr_estimator.py');
@@ -213,6 +302,7 @@ function runPythonEstimator(
         modulation_type: params.modulationType || 'QPSK',
         symbol_rate: params.symbolRate,
         estimate_cfo: params.estimateCfo !== false,
+        include_psd_peak: params.includePsdPeak === true,
       },
     });
 